@@ -22,7 +22,7 @@ Authentication manager for Kiro API.
 
 Manages token lifecycle:
 - Automatic token refresh on expiration
-- Thread-safe refresh using asyncio.Lock
+- Single-flight refresh: concurrent callers share one in-flight refresh
 - Support for both Kiro Desktop Auth and AWS SSO OIDC (kiro-cli)
 
 Credential loading/saving extracted to auth_credentials.py.
@@ -30,21 +30,73 @@ Credential loading/saving extracted to auth_credentials.py.
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
+from pathlib import Path
 from typing import Optional
 import asyncio
+import importlib.util
+import random
+import sqlite3
+import threading
+import time
 import httpx
 from loguru import logger
 
 from kiro.config import (
     TOKEN_REFRESH_THRESHOLD,
     BACKGROUND_REFRESH_INTERVAL,
+    SQLITE_RELOAD_MIN_INTERVAL,
+    get_kiro_refresh_url,
     get_kiro_api_host,
     get_kiro_q_host,
     get_aws_sso_oidc_url,
 )
-from kiro.utils import get_machine_fingerprint
+from kiro.utils import get_machine_fingerprint, json_dumps_bytes, json_loads
 from kiro.auth_credentials import KiroCredentialsMixin
-from kiro.auth_multi import AuthType, MultiTokenAuthManager  # noqa: F401
+from kiro.auth_multi import AuthType
+
+
+# AWS SSO OIDC CreateToken request headers (constant, shared by all refreshes)
+_AWS_SSO_OIDC_HEADERS = {"Content-Type": "application/json"}
+
+
+@dataclass(frozen=True, slots=True)
+class _TokenResponse:
+    """Successful token refresh response (both endpoints use camelCase fields)."""
+    access_token: str
+    refresh_token: Optional[str]
+    expires_in: int
+    profile_arn: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: dict, source_name: str) -> "_TokenResponse":
+        """
+        Builds a token response from a parsed refresh response body.
+
+        Args:
+            data: Parsed JSON body
+            source_name: Auth endpoint name used in the error message
+
+        Raises:
+            ValueError: If the response doesn't contain accessToken
+        """
+        access_token = data.get("accessToken")
+        if not access_token:
+            raise ValueError(f"{source_name} response does not contain accessToken: {data}")
+        return cls(
+            access_token=access_token,
+            refresh_token=data.get("refreshToken"),
+            expires_in=data.get("expiresIn", 3600),
+            profile_arn=data.get("profileArn"),
+        )
+
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]");
+# without it the refresh client falls back to HTTP/1.1 keep-alive
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Background refresh retry backoff bounds (seconds)
+_REFRESH_BACKOFF_INITIAL = 1.0
+_REFRESH_BACKOFF_MAX = 300.0
 
 
 class KiroAuthManager(KiroCredentialsMixin):
@@ -80,6 +132,20 @@ class KiroAuthManager(KiroCredentialsMixin):
         >>> token = await auth_manager.get_access_token()
     """
 
+    # One instance per token in multi-account pools: no per-instance __dict__
+    __slots__ = (
+        "_refresh_token", "_profile_arn", "_region",
+        "_creds_file", "_creds_file_path", "_creds_file_mirror", "_sqlite_db",
+        "_client_id", "_client_secret", "_scopes", "_sso_region", "_client_id_hash",
+        "_sqlite_token_key", "_sqlite_conn", "_sqlite_lock", "_last_sqlite_reload_ts",
+        "_token_data_buf", "_last_saved_sig",
+        "_access_token", "_expires_at_dt", "_expires_at_ts",
+        "_refresh_lock", "_refresh_future", "_background_task", "_shutdown_event",
+        "_http_client", "_refresh_backoff", "_auth_type",
+        "_refresh_url", "_sso_url", "_sso_url_region", "_api_host", "_q_host",
+        "_fingerprint", "_kiro_desktop_headers",
+    )
+
     def __init__(
         self,
         refresh_token: Optional[str] = None,
@@ -106,6 +172,12 @@ class KiroAuthManager(KiroCredentialsMixin):
         self._profile_arn = profile_arn
         self._region = region
         self._creds_file = creds_file
+        # Resolved once; saves after every refresh reuse it
+        self._creds_file_path: Optional[Path] = (
+            Path(creds_file).expanduser() if creds_file else None
+        )
+        # (st_mtime_ns, st_size, data) of the last credentials file we wrote
+        self._creds_file_mirror: Optional[tuple] = None
         self._sqlite_db = sqlite_db
 
         # AWS SSO OIDC specific fields
@@ -119,19 +191,40 @@ class KiroAuthManager(KiroCredentialsMixin):
 
         # Track which SQLite key we loaded credentials from (for saving back to correct location)
         self._sqlite_token_key: Optional[str] = None
+        # Persistent SQLite connection (opened lazily, closed on stop_background_refresh)
+        self._sqlite_conn: Optional[sqlite3.Connection] = None
+        self._sqlite_lock = threading.Lock()
+        # Reused payload dict for SQLite token saves (filled under _sqlite_lock)
+        self._token_data_buf: dict = {}
+        # Credential fields as of the last successful save (None = never saved)
+        self._last_saved_sig: Optional[tuple] = None
+        # Monotonic time of the last pre-refresh SQLite reload (None = never)
+        self._last_sqlite_reload_ts: Optional[float] = None
 
         self._access_token: Optional[str] = None
-        self._expires_at: Optional[datetime] = None
-        self._lock = asyncio.Lock()
+        # Expiration as datetime (logging/serialization) and as epoch seconds
+        # (hot-path checks); assign through the _expires_at property only
+        self._expires_at_dt: Optional[datetime] = None
+        self._expires_at_ts: Optional[float] = None
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_future: Optional[asyncio.Future] = None
         self._background_task: Optional[asyncio.Task] = None
-        self._shutdown = False
+        self._shutdown_event = asyncio.Event()
+        # HTTP client for token refresh requests. Kept alive across refreshes
+        # so each refresh reuses the pooled TCP+TLS connection instead of
+        # paying a fresh handshake; closed by stop_background_refresh
+        self._http_client: Optional[httpx.AsyncClient] = None
+        # Background refresh retry delay, doubled per failure (seconds)
+        self._refresh_backoff = _REFRESH_BACKOFF_INITIAL
 
         # Auth type will be determined after loading credentials
         self._auth_type: AuthType = AuthType.KIRO_DESKTOP
 
         # Dynamic URLs based on region
-        from kiro.config import get_kiro_refresh_url
         self._refresh_url = get_kiro_refresh_url(region)
+        # AWS SSO OIDC endpoint, built on first refresh (see _get_sso_url)
+        self._sso_url: Optional[str] = None
+        self._sso_url_region: Optional[str] = None
         self._api_host = get_kiro_api_host(region)
         self._q_host = get_kiro_q_host(region)
 
@@ -144,6 +237,12 @@ class KiroAuthManager(KiroCredentialsMixin):
         # Fingerprint for User-Agent
         self._fingerprint = get_machine_fingerprint()
 
+        # Refresh request headers only depend on the fingerprint, build them once
+        self._kiro_desktop_headers = {
+            "Content-Type": "application/json",
+            "User-Agent": f"KiroIDE-0.7.45-{self._fingerprint}",
+        }
+
         # Load credentials from SQLite if specified (takes priority over JSON)
         if sqlite_db:
             self._load_credentials_from_sqlite(sqlite_db)
@@ -154,6 +253,29 @@ class KiroAuthManager(KiroCredentialsMixin):
         # Determine auth type based on available credentials
         self._detect_auth_type()
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Returns the HTTP client used for this manager's token refresh requests.
+
+        The client is created lazily on first use and recreated if it was
+        closed. HTTP/2 is enabled when h2 is installed, so concurrent
+        refreshes to the same auth host multiplex over one connection.
+        Creation is synchronous, so there is no await point between the
+        check and the assignment and concurrent callers cannot race.
+
+        Returns:
+            httpx.AsyncClient with keep-alive enabled
+        """
+        client = self._http_client
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=300),
+                http2=_HTTP2_AVAILABLE,
+            )
+            self._http_client = client
+        return client
+
     def _detect_auth_type(self) -> None:
         """
         Detects authentication type based on available credentials.
@@ -168,6 +290,16 @@ class KiroAuthManager(KiroCredentialsMixin):
             self._auth_type = AuthType.KIRO_DESKTOP
             logger.info("Detected auth type: Kiro Desktop")
 
+    @property
+    def _expires_at(self) -> Optional[datetime]:
+        """Token expiration time; setting it also updates _expires_at_ts."""
+        return self._expires_at_dt
+
+    @_expires_at.setter
+    def _expires_at(self, value: Optional[datetime]) -> None:
+        self._expires_at_dt = value
+        self._expires_at_ts = value.timestamp() if value else None
+
     def is_token_expiring_soon(self) -> bool:
         """
         Checks if token is expiring soon.
@@ -176,13 +308,11 @@ class KiroAuthManager(KiroCredentialsMixin):
             True if token expires within TOKEN_REFRESH_THRESHOLD seconds
             or if expiration time information is not available
         """
-        if not self._expires_at:
+        expires_at_ts = self._expires_at_ts
+        if expires_at_ts is None:
             return True  # If no expiration info available, assume refresh is needed
 
-        now = datetime.now(timezone.utc)
-        threshold = now.timestamp() + TOKEN_REFRESH_THRESHOLD
-
-        return self._expires_at.timestamp() <= threshold
+        return expires_at_ts - time.time() <= TOKEN_REFRESH_THRESHOLD
 
     def is_token_expired(self) -> bool:
         """
@@ -195,11 +325,27 @@ class KiroAuthManager(KiroCredentialsMixin):
             True if token has already expired or if expiration time
             information is not available
         """
-        if not self._expires_at:
+        expires_at_ts = self._expires_at_ts
+        if expires_at_ts is None:
             return True  # If no expiration info available, assume expired
 
-        now = datetime.now(timezone.utc)
-        return now >= self._expires_at
+        return expires_at_ts <= time.time()
+
+    def is_token_stale(self) -> bool:
+        """
+        Checks if token is stale: expiring soon but not yet expired.
+
+        A stale token can still be used while a refresh runs in the background.
+
+        Returns:
+            True if token is within TOKEN_REFRESH_THRESHOLD of expiry
+            but has not expired yet
+        """
+        expires_at_ts = self._expires_at_ts
+        if expires_at_ts is None:
+            return False
+
+        return 0 < expires_at_ts - time.time() <= TOKEN_REFRESH_THRESHOLD
 
     def is_token_fresh_for_streaming(self, min_validity_seconds: float = 600) -> bool:
         """
@@ -215,13 +361,11 @@ class KiroAuthManager(KiroCredentialsMixin):
         Returns:
             True if token is valid for at least min_validity_seconds
         """
-        if not self._expires_at:
+        expires_at_ts = self._expires_at_ts
+        if expires_at_ts is None:
             return False  # No expiration info, not fresh
 
-        now = datetime.now(timezone.utc)
-        time_until_expiry = (self._expires_at - now).total_seconds()
-
-        return time_until_expiry >= min_validity_seconds
+        return expires_at_ts - time.time() >= min_validity_seconds
 
     async def _refresh_token_request(self) -> None:
         """
@@ -259,42 +403,17 @@ class KiroAuthManager(KiroCredentialsMixin):
         logger.info("Refreshing Kiro token via Kiro Desktop Auth...")
 
         payload = {'refreshToken': self._refresh_token}
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": f"KiroIDE-0.7.45-{self._fingerprint}",
-        }
-
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(self._refresh_url, json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
 
-        new_access_token = data.get("accessToken")
-        new_refresh_token = data.get("refreshToken")
-        expires_in = data.get("expiresIn", 3600)
-        new_profile_arn = data.get("profileArn")
-
-        if not new_access_token:
-            raise ValueError(f"Response does not contain accessToken: {data}")
-
-        # Update data
-        self._access_token = new_access_token
-        if new_refresh_token:
-            self._refresh_token = new_refresh_token
-        if new_profile_arn:
-            self._profile_arn = new_profile_arn
-
-        # Calculate expiration time with buffer (minus 60 seconds for safety)
-        # Kiro tokens typically expire in 3600 seconds (1 hour)
-        self._expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in - 60)
-
-        logger.info(f"Token refreshed via Kiro Desktop Auth, expires: {self._expires_at.isoformat()}")
-
-        # Save to file or SQLite depending on configuration
-        if self._sqlite_db:
-            self._save_credentials_to_sqlite()
-        else:
-            self._save_credentials_to_file()
+        client = self._get_http_client()
+        response = await client.post(
+            self._refresh_url,
+            content=json_dumps_bytes(payload),
+            headers=self._kiro_desktop_headers,
+        )
+        response.raise_for_status()
+        source_name = "Kiro Desktop Auth"
+        token = _TokenResponse.from_dict(json_loads(response.content), source_name)
+        await self._apply_token_response(token, source_name)
 
     async def _refresh_token_aws_sso_oidc(self) -> None:
         """
@@ -328,11 +447,29 @@ class KiroAuthManager(KiroCredentialsMixin):
                     "Token refresh failed with 400, reloading credentials "
                     "from SQLite and retrying..."
                 )
-                self._load_credentials_from_sqlite(self._sqlite_db)
+                await self._reload_credentials_from_sqlite()
                 await self._do_aws_sso_oidc_refresh()
             else:
                 raise
 
+    def _get_sso_url(self, sso_region: str) -> str:
+        """
+        Returns the AWS SSO OIDC token URL for sso_region, cached on the instance.
+
+        The region can change when credentials are reloaded, so the cache is
+        keyed on it and rebuilt only when it differs.
+
+        Args:
+            sso_region: Region of the OIDC endpoint
+
+        Returns:
+            AWS SSO OIDC token endpoint URL
+        """
+        if sso_region != self._sso_url_region:
+            self._sso_url = get_aws_sso_oidc_url(sso_region)
+            self._sso_url_region = sso_region
+        return self._sso_url
+
     async def _do_aws_sso_oidc_refresh(self) -> None:
         """
         Performs actual AWS SSO OIDC token refresh.
@@ -361,7 +498,7 @@ class KiroAuthManager(KiroCredentialsMixin):
         # AWS SSO OIDC CreateToken API uses JSON with camelCase parameters
         # Use SSO region for OIDC endpoint (may differ from API region)
         sso_region = self._sso_region or self._region
-        url = get_aws_sso_oidc_url(sso_region)
+        url = self._get_sso_url(sso_region)
 
         # IMPORTANT: AWS SSO OIDC CreateToken API requires:
         # 1. JSON payload (not form-urlencoded)
@@ -373,71 +510,78 @@ class KiroAuthManager(KiroCredentialsMixin):
             "refreshToken": self._refresh_token,
         }
 
-        headers = {
-            "Content-Type": "application/json",
-        }
-
         # Log request details (without secrets) for debugging
         logger.debug(
             f"AWS SSO OIDC refresh request: url={url}, sso_region={sso_region}, "
             f"api_region={self._region}, client_id={self._client_id[:8]}..."
         )
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(url, json=payload, headers=headers)
+        client = self._get_http_client()
+        response = await client.post(
+            url, content=json_dumps_bytes(payload), headers=_AWS_SSO_OIDC_HEADERS
+        )
 
-            # Log response details for debugging (especially on errors)
-            if response.status_code != 200:
-                error_body = response.text
+        # Log response details for debugging (especially on errors)
+        if response.status_code != 200:
+            error_body = response.text
+            logger.error(
+                f"AWS SSO OIDC refresh failed: status={response.status_code}, "
+                f"body={error_body}"
+            )
+            # Try to parse AWS error for more details
+            try:
+                error_json = response.json()
+                error_code = error_json.get("error", "unknown")
+                error_desc = error_json.get("error_description", "no description")
                 logger.error(
-                    f"AWS SSO OIDC refresh failed: status={response.status_code}, "
-                    f"body={error_body}"
+                    f"AWS SSO OIDC error details: error={error_code}, "
+                    f"description={error_desc}"
                 )
-                # Try to parse AWS error for more details
-                try:
-                    error_json = response.json()
-                    error_code = error_json.get("error", "unknown")
-                    error_desc = error_json.get("error_description", "no description")
-                    logger.error(
-                        f"AWS SSO OIDC error details: error={error_code}, "
-                        f"description={error_desc}"
-                    )
-                except Exception:
-                    pass  # Body wasn't JSON, already logged as text
-                response.raise_for_status()
-
-            result = response.json()
+            except Exception:
+                pass  # Body wasn't JSON, already logged as text
+            response.raise_for_status()
 
-        # AWS SSO OIDC CreateToken API returns camelCase fields
-        new_access_token = result.get("accessToken")
-        new_refresh_token = result.get("refreshToken")
-        expires_in = result.get("expiresIn", 3600)
+        # AWS SSO OIDC CreateToken API returns the same camelCase fields
+        source_name = "AWS SSO OIDC"
+        token = _TokenResponse.from_dict(json_loads(response.content), source_name)
+        await self._apply_token_response(token, source_name)
 
-        if not new_access_token:
-            raise ValueError(f"AWS SSO OIDC response does not contain accessToken: {result}")
+    async def _apply_token_response(self, token: _TokenResponse, source_name: str) -> None:
+        """
+        Applies a successful refresh response and persists the new credentials.
 
-        # Update data
-        self._access_token = new_access_token
-        if new_refresh_token:
-            self._refresh_token = new_refresh_token
+        Args:
+            token: Parsed refresh response
+            source_name: Auth endpoint name used in log messages
+        """
+        self._access_token = token.access_token
+        if token.refresh_token:
+            self._refresh_token = token.refresh_token
+        if token.profile_arn:
+            self._profile_arn = token.profile_arn
 
-        # Calculate expiration time with buffer (minus 60 seconds)
-        self._expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in - 60)
+        # Calculate expiration time with buffer (minus 60 seconds for safety)
+        # Tokens typically expire in 3600 seconds (1 hour)
+        self._expires_at = datetime.now(timezone.utc) + timedelta(seconds=token.expires_in - 60)
 
-        logger.info(f"Token refreshed via AWS SSO OIDC, expires: {self._expires_at.isoformat()}")
+        logger.info(f"Token refreshed via {source_name}, expires: {self._expires_at.isoformat()}")
 
-        # Save to file or SQLite depending on configuration
-        if self._sqlite_db:
-            self._save_credentials_to_sqlite()
-        else:
-            self._save_credentials_to_file()
+        # Save to file or SQLite depending on configuration (off the event loop)
+        await self._persist_credentials()
 
     async def get_access_token(self) -> str:
         """
         Returns a valid access_token, refreshing it if necessary.
 
-        Thread-safe method using asyncio.Lock.
-        Automatically refreshes token if it has expired or is about to expire.
+        Token states:
+        - fresh: returned immediately, without taking any lock
+        - stale (expiring soon, still valid): returned immediately while a
+          refresh is started in the background
+        - expired or missing: caller waits for the refresh
+
+        The refresh runs as a shared in-flight future; concurrent callers
+        await that same future, so a burst of requests results in exactly
+        one refresh.
 
         For SQLite mode (kiro-cli): implements graceful degradation when refresh fails.
         If kiro-cli has been running and refreshing tokens in memory (without persisting
@@ -450,15 +594,72 @@ class KiroAuthManager(KiroCredentialsMixin):
         Raises:
             ValueError: If unable to obtain access token
         """
-        async with self._lock:
-            # Token is valid and not expiring soon - just return it
+        # Lock-free snapshot: each attribute read is atomic, and a stale read
+        # only costs a (deduplicated) refresh
+        token = self._access_token
+        expires_at_ts = self._expires_at_ts
+        if token and expires_at_ts is not None:
+            remaining = expires_at_ts - time.time()
+            # Fresh: token is valid and not expiring soon - just return it
+            if remaining > TOKEN_REFRESH_THRESHOLD:
+                return token
+            # Stale: token is still valid, so serve it and refresh in the background
+            if remaining > 0:
+                self._start_refresh()
+                return token
+
+        # Expired (or missing): wait for the shared refresh.
+        # Shield so a cancelled caller does not cancel the refresh for everyone else
+        return await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self) -> asyncio.Future:
+        """
+        Returns the in-flight refresh future, starting one if none is running.
+
+        Returns:
+            Future resolving to the refreshed access token
+        """
+        refresh = self._refresh_future
+        if refresh is None or refresh.done():
+            refresh = asyncio.ensure_future(self._refresh_and_return())
+            refresh.add_done_callback(self._log_refresh_failure)
+            self._refresh_future = refresh
+        return refresh
+
+    @staticmethod
+    def _log_refresh_failure(future: asyncio.Future) -> None:
+        """
+        Logs a failed refresh future.
+
+        Also marks the exception as retrieved, so a stale-path refresh that
+        nobody awaits does not emit "exception was never retrieved".
+        """
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Token refresh failed: {future.exception()}")
+
+    async def _refresh_and_return(self) -> str:
+        """
+        Refreshes the token under the lock and returns the access token.
+
+        Runs as the shared in-flight future created by get_access_token().
+
+        Returns:
+            Valid access token
+
+        Raises:
+            ValueError: If unable to obtain access token
+        """
+        async with self._refresh_lock:
+            # Re-check: background refresh or force_refresh may have won the lock first
             if self._access_token and not self.is_token_expiring_soon():
                 return self._access_token
 
-            # SQLite mode: reload credentials first, kiro-cli might have updated them
-            if self._sqlite_db and self.is_token_expiring_soon():
+            # SQLite mode: reload credentials first, kiro-cli might have updated them.
+            # Throttled so a burst of requests in the refresh window reads the DB once
+            if self._sqlite_db and self.is_token_expiring_soon() and self._sqlite_reload_due():
                 logger.debug("SQLite mode: reloading credentials before refresh attempt")
-                self._load_credentials_from_sqlite(self._sqlite_db)
+                await self._reload_credentials_from_sqlite()
+                self._last_sqlite_reload_ts = time.monotonic()
                 # Check if reloaded token is now valid
                 if self._access_token and not self.is_token_expiring_soon():
                     logger.debug("SQLite reload provided fresh token, no refresh needed")
@@ -498,6 +699,16 @@ class KiroAuthManager(KiroCredentialsMixin):
 
             return self._access_token
 
+    def _sqlite_reload_due(self) -> bool:
+        """
+        Checks whether the pre-refresh SQLite reload may run again.
+
+        Returns:
+            True if no reload happened in the last SQLITE_RELOAD_MIN_INTERVAL seconds
+        """
+        last = self._last_sqlite_reload_ts
+        return last is None or time.monotonic() - last >= SQLITE_RELOAD_MIN_INTERVAL
+
     async def force_refresh(self) -> str:
         """
         Forces a token refresh.
@@ -507,10 +718,49 @@ class KiroAuthManager(KiroCredentialsMixin):
         Returns:
             New access token
         """
-        async with self._lock:
+        async with self._refresh_lock:
             await self._refresh_token_request()
             return self._access_token
 
+    def _seconds_until_refresh_due(self) -> float:
+        """
+        Returns seconds until the token enters the refresh window.
+
+        Returns:
+            Seconds until expires_at - TOKEN_REFRESH_THRESHOLD; zero or negative
+            if the token is already expiring soon or has no expiration info
+        """
+        if self._expires_at_ts is None:
+            return 0.0
+        return self._expires_at_ts - time.time() - TOKEN_REFRESH_THRESHOLD
+
+    async def _wait_for_shutdown(self, timeout: float) -> bool:
+        """
+        Sleeps for up to timeout seconds, waking early on shutdown.
+
+        Args:
+            timeout: Maximum time to sleep in seconds
+
+        Returns:
+            True if shutdown was requested, False if the timeout elapsed
+        """
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def _next_refresh_backoff(self) -> float:
+        """
+        Doubles the retry backoff and returns the jittered delay to sleep.
+
+        Returns:
+            Delay in seconds: backoff plus up to 50% random jitter
+        """
+        backoff = min(self._refresh_backoff * 2, _REFRESH_BACKOFF_MAX)
+        self._refresh_backoff = backoff
+        return backoff + random.uniform(0, backoff * 0.5)
+
     async def _background_token_refresh(self) -> None:
         """
         Background task that proactively refreshes token before expiry.
@@ -518,26 +768,42 @@ class KiroAuthManager(KiroCredentialsMixin):
         Prevents the scenario where the server is idle, the token expires,
         and the next request hangs waiting for a slow/failed refresh.
 
+        Instead of polling every BACKGROUND_REFRESH_INTERVAL, the task sleeps
+        until the token is within a random jitter (up to 30s) of the refresh
+        window, capped at BACKGROUND_REFRESH_INTERVAL, and refreshes once it
+        is that close. If the token is already in the window it refreshes
+        immediately. Shutdown wakes the sleep right away.
+        Failed refreshes are retried with exponential backoff plus jitter
+        (capped at 5 minutes) so a fleet doesn't retry in lockstep.
+
         FIXED: Moved expiration check INSIDE the lock to prevent race conditions.
         """
         logger.info("Background token refresh task started (single-token mode)")
 
-        while True:
+        while not self._shutdown_event.is_set():
             try:
-                await asyncio.sleep(BACKGROUND_REFRESH_INTERVAL)
+                # Refresh up to 30s early so a fleet doesn't refresh in lockstep;
+                # the same jitter widens the refresh check below, so waking early
+                # actually refreshes instead of polling until the window opens
+                jitter = random.uniform(0, 30)
+                due_in = self._seconds_until_refresh_due() - jitter
+                if due_in > 0:
+                    sleep_for = min(BACKGROUND_REFRESH_INTERVAL, due_in)
+                    logger.debug(f"Background refresh: next check in {sleep_for:.0f}s")
+                    if await self._wait_for_shutdown(sleep_for):
+                        break
 
-                if self._shutdown:
-                    break
+                refresh_failed = False
 
                 # FIXED: Check expiration INSIDE the lock to avoid race condition
                 # Previously we checked outside the lock, which could cause
                 # token to expire before we acquired the lock
-                async with self._lock:
-                    if self._shutdown:
+                async with self._refresh_lock:
+                    if self._shutdown_event.is_set():
                         break
 
                     # Check if token needs refresh
-                    if self.is_token_expiring_soon():
+                    if self._seconds_until_refresh_due() <= jitter:
                         logger.info("Background refresh: token expiring soon, refreshing...")
                         try:
                             await self._refresh_token_request()
@@ -545,38 +811,59 @@ class KiroAuthManager(KiroCredentialsMixin):
                         except Exception as refresh_error:
                             logger.error(f"Background refresh failed: {refresh_error}")
                             # Don't log full traceback for expected network errors
+                            refresh_failed = True
                     else:
                         logger.debug("Background refresh: token still valid, skipping")
 
+                # Token is still in the refresh window after a failure, so wait
+                # before retrying instead of spinning on the deadline
+                if refresh_failed:
+                    if await self._wait_for_shutdown(self._next_refresh_backoff()):
+                        break
+                else:
+                    self._refresh_backoff = _REFRESH_BACKOFF_INITIAL
+
             except asyncio.CancelledError:
                 logger.info("Background token refresh task cancelled")
                 break
             except Exception as e:
                 logger.error(f"Background refresh error: {e}")
-                # Brief sleep before retry to avoid spinning on persistent errors
-                await asyncio.sleep(30)
-
-            if self._shutdown:
-                break
+                # Back off before retry to avoid spinning on persistent errors
+                if await self._wait_for_shutdown(self._next_refresh_backoff()):
+                    break
 
         logger.info("Background token refresh task stopped")
 
     def start_background_refresh(self) -> None:
         """Start background token refresh task."""
-        if not hasattr(self, '_background_task') or self._background_task is None or self._background_task.done():
-            self._shutdown = False
+        task = self._background_task
+        if task is None or task.done():
+            self._shutdown_event.clear()
             self._background_task = asyncio.create_task(self._background_token_refresh())
             logger.info("Background token refresh enabled (single-token mode)")
 
     async def stop_background_refresh(self) -> None:
-        """Stop background token refresh task."""
-        self._shutdown = True
-        if hasattr(self, '_background_task') and self._background_task and not self._background_task.done():
-            self._background_task.cancel()
+        """
+        Stop background token refresh task and release the manager's resources.
+
+        Also closes the refresh HTTP client and the cached SQLite connection,
+        so it is the shutdown hook for managers that never started background
+        refresh too.
+        """
+        self._shutdown_event.set()
+        task = self._background_task
+        if task is not None and not task.done():
+            task.cancel()
             try:
-                await self._background_task
+                await task
             except asyncio.CancelledError:
                 pass
+        client = self._http_client
+        if client is not None:
+            self._http_client = None
+            await client.aclose()
+        with self._sqlite_lock:
+            self._close_sqlite_connection()
         logger.info("Background token refresh disabled")
 
     @property
@@ -24,15 +24,31 @@ Extracted from auth.py to keep file sizes manageable.
 Contains all SQLite and JSON file credential I/O methods.
 """
 
+import asyncio
+import atexit
+import io
 import json
+import mmap
+import os
 import sqlite3
+import stat
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set, Tuple
 
 from loguru import logger
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
 from kiro.config import get_kiro_refresh_url, get_kiro_api_host, get_kiro_q_host
+from kiro.utils import json_dumps_bytes, json_loads
 
 
 # Supported SQLite token keys (searched in priority order)
@@ -48,6 +64,232 @@ SQLITE_REGISTRATION_KEYS = [
     "codewhisperer:odic:device-registration",
 ]
 
+# Fetches every supported token and registration row in one statement;
+# the winner of each group is picked in Python by priority order
+_SELECT_AUTH_KEYS_SQL = (
+    "SELECT key, value FROM auth_kv WHERE key IN ("
+    + ",".join("?" * (len(SQLITE_TOKEN_KEYS) + len(SQLITE_REGISTRATION_KEYS)))
+    + ")"
+)
+_SELECT_AUTH_KEYS_PARAMS = tuple(SQLITE_TOKEN_KEYS + SQLITE_REGISTRATION_KEYS)
+
+# Credential fields copied straight onto the host instance, by source, as
+# (payload field, attribute) pairs. Fields that need extra handling (region,
+# expiry, clientIdHash) are not listed
+_SQLITE_TOKEN_FIELD_ATTRS = (
+    ("access_token", "_access_token"),
+    ("refresh_token", "_refresh_token"),
+    ("profile_arn", "_profile_arn"),
+    ("scopes", "_scopes"),
+)
+_SQLITE_REGISTRATION_FIELD_ATTRS = (
+    ("client_id", "_client_id"),
+    ("client_secret", "_client_secret"),
+)
+_FILE_FIELD_ATTRS = (
+    ("refreshToken", "_refresh_token"),
+    ("accessToken", "_access_token"),
+    ("profileArn", "_profile_arn"),
+    ("clientId", "_client_id"),
+    ("clientSecret", "_client_secret"),
+)
+_ENTERPRISE_REGISTRATION_FIELD_ATTRS = (
+    ("clientId", "_client_id"),
+    ("clientSecret", "_client_secret"),
+)
+
+# Stored token values above this size are stream-parsed with ijson (when
+# installed), stopping once every field we use has been seen. Typical values
+# are well under 1 KB, where a full orjson/json parse is faster
+SQLITE_STREAM_PARSE_MIN_BYTES = 64 * 1024
+
+# Top-level token fields the SQLite loader reads
+_SQLITE_TOKEN_FIELDS = frozenset(
+    field for field, _ in _SQLITE_TOKEN_FIELD_ATTRS
+) | {"region", "expires_at"}
+
+
+def _parse_sqlite_token_value(value: "str | bytes") -> dict:
+    """
+    Parses a stored token JSON value, keeping only the fields the loader uses.
+
+    Large values (kiro-cli may store long scopes arrays or provider metadata)
+    are walked with ijson.kvitems and parsing stops as soon as every field in
+    _SQLITE_TOKEN_FIELDS has been seen. Small values, or any value when ijson
+    isn't installed, are parsed in full.
+
+    Args:
+        value: Raw JSON from the auth_kv value column
+
+    Returns:
+        Parsed token data (only known fields when stream-parsed)
+    """
+    if ijson is None or len(value) < SQLITE_STREAM_PARSE_MIN_BYTES:
+        return json_loads(value)
+
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    data: dict = {}
+    remaining = set(_SQLITE_TOKEN_FIELDS)
+    for key, item in ijson.kvitems(io.BytesIO(value), ""):
+        if key in remaining:
+            data[key] = item
+            remaining.discard(key)
+            if not remaining:
+                break
+    return data
+
+
+def _parse_iso_z_shim(value: str) -> datetime:
+    """Parses an ISO-8601 string, accepting a trailing 'Z' for UTC (Python < 3.11)."""
+    if value.endswith("Z"):
+        return datetime.fromisoformat(value[:-1] + "+00:00")
+    return datetime.fromisoformat(value)
+
+
+# Parses ISO-8601 expiry strings. Python 3.11+ fromisoformat accepts the
+# trailing "Z" natively, so the shim is only bound on older versions
+_parse_iso = (
+    datetime.fromisoformat if sys.version_info >= (3, 11) else _parse_iso_z_shim
+)
+
+
+# How long a statement waits on a lock held by kiro-cli before failing
+_SQLITE_BUSY_TIMEOUT_MS = 5000
+
+# SQLite 3.35+ can report which row an UPDATE touched via RETURNING
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Token write statement: updates the key we loaded from (first parameter,
+# may be NULL) if it exists, otherwise the highest-priority supported key
+# that exists. One statement covers both cases, and the SQL is a constant
+# so the connection's statement cache reuses the prepared statement
+_UPDATE_TOKEN_SQL = (
+    "UPDATE auth_kv SET value = ? WHERE key = ("
+    "SELECT key FROM auth_kv WHERE key IN ("
+    + ",".join("?" * (len(SQLITE_TOKEN_KEYS) + 1))
+    + ") ORDER BY CASE key WHEN ? THEN -1 "
+    + " ".join(f"WHEN ? THEN {i}" for i in range(len(SQLITE_TOKEN_KEYS)))
+    + " END LIMIT 1)"
+    + (" RETURNING key" if _SQLITE_HAS_RETURNING else "")
+)
+_TOKEN_KEYS_PARAMS = tuple(SQLITE_TOKEN_KEYS)
+
+
+# Credential files at least this large are parsed straight from an mmap of
+# the file instead of a bytes copy (Enterprise SSO cache files can embed
+# large JWTs); below it the mmap setup costs more than the copy it saves
+CREDS_FILE_MMAP_MIN_BYTES = 8 * 1024
+
+
+def _read_json_file(path: Path, size: int) -> dict:
+    """
+    Reads and parses a JSON file, via mmap when it is large.
+
+    Args:
+        path: File to read
+        size: File size from the caller's stat()
+
+    Returns:
+        Parsed file contents
+    """
+    if size < CREDS_FILE_MMAP_MIN_BYTES:
+        return json_loads(path.read_bytes())
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return json_loads(view)
+
+
+# Parsed JSON credential files, keyed on (path, st_mtime_ns, st_size) so a
+# rewritten file misses the cache. Shared by every manager in the process;
+# entries are read-only (callers copy before mutating)
+_CREDS_FILE_CACHE: "OrderedDict[Tuple[str, int, int], dict]" = OrderedDict()
+_CREDS_FILE_CACHE_MAXSIZE = 32
+_creds_file_cache_lock = threading.Lock()
+
+
+def _read_json_file_cached(path: Path) -> dict:
+    """
+    Reads and parses a JSON credentials file, reusing the parse while unchanged.
+
+    Args:
+        path: Resolved path to the JSON file
+
+    Returns:
+        Parsed file contents (shared, must not be mutated)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    st = os.stat(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    with _creds_file_cache_lock:
+        data = _CREDS_FILE_CACHE.get(key)
+        if data is not None:
+            _CREDS_FILE_CACHE.move_to_end(key)
+            return data
+
+    data = _read_json_file(path, st.st_size)
+    with _creds_file_cache_lock:
+        _CREDS_FILE_CACHE[key] = data
+        if len(_CREDS_FILE_CACHE) > _CREDS_FILE_CACHE_MAXSIZE:
+            _CREDS_FILE_CACHE.popitem(last=False)
+    return data
+
+
+def _invalidate_json_file_cache(path: Path) -> None:
+    """Drops every cached parse of path (called after the gateway rewrites it)."""
+    name = str(path)
+    with _creds_file_cache_lock:
+        for key in [k for k in _CREDS_FILE_CACHE if k[0] == name]:
+            del _CREDS_FILE_CACHE[key]
+
+
+def _write_file_atomic(path: Path, payload: bytes, mode: int) -> None:
+    """
+    Replaces path with payload via a fsynced temp file and os.replace.
+
+    Readers see either the old or the new file, never a torn write. The path
+    is resolved first so a symlinked file keeps its link and the target is
+    replaced, and each writer gets its own temp file from mkstemp so
+    concurrent savers cannot interleave into the same one.
+
+    Args:
+        path: Destination file
+        payload: Complete new file contents
+        mode: Permission bits for the new file
+    """
+    path = path.resolve()
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        os.chmod(tmp_name, mode)
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+# Every cached connection opened by the mixin that hasn't been closed yet;
+# closed at interpreter exit so WAL state is checkpointed cleanly
+_open_sqlite_connections: Set[sqlite3.Connection] = set()
+
+
+@atexit.register
+def _close_open_sqlite_connections() -> None:
+    """Closes cached SQLite connections still open at interpreter exit."""
+    for conn in list(_open_sqlite_connections):
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
 
 class KiroCredentialsMixin:
     """
@@ -59,9 +301,106 @@ class KiroCredentialsMixin:
         _refresh_token, _access_token, _expires_at, _profile_arn,
         _region, _refresh_url, _api_host, _q_host,
         _client_id, _client_secret, _scopes, _sso_region,
-        _client_id_hash, _sqlite_token_key, _creds_file, _sqlite_db
+        _client_id_hash, _sqlite_token_key, _creds_file, _sqlite_db,
+        _sqlite_conn, _sqlite_lock, _creds_file_path, _creds_file_mirror,
+        _token_data_buf, _last_saved_sig
+
+    Declares empty __slots__ so the host class can be fully slotted.
     """
 
+    __slots__ = ()
+
+    def _get_sqlite_connection(self, path: Path) -> sqlite3.Connection:
+        """
+        Returns the persistent connection to the kiro-cli database.
+
+        Opened lazily on first use and reused for every later load and save,
+        so a refresh costs one cursor instead of opening the DB, -wal and -shm
+        files again. The connection is in autocommit mode (each UPDATE is its
+        own transaction) and WAL journal mode is requested once so reads don't
+        block kiro-cli writes. busy_timeout is also set as a pragma so the
+        wait applies to the journal mode switch and every later statement.
+
+        Callers must hold self._sqlite_lock: the connection is shared between
+        the event loop thread and asyncio.to_thread workers.
+
+        Args:
+            path: Resolved path to the SQLite database file
+
+        Returns:
+            Open sqlite3 connection
+        """
+        conn = self._sqlite_conn
+        if conn is None:
+            conn = sqlite3.connect(
+                str(path),
+                timeout=_SQLITE_BUSY_TIMEOUT_MS / 1000,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            try:
+                conn.execute(f"PRAGMA busy_timeout={_SQLITE_BUSY_TIMEOUT_MS}")
+                journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+                if journal_mode.lower() != "wal":
+                    logger.debug(f"SQLite journal mode on {path} stays {journal_mode}")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
+            except sqlite3.Error as e:
+                logger.debug(f"Could not apply SQLite pragmas on {path}: {e}")
+            self._sqlite_conn = conn
+            _open_sqlite_connections.add(conn)
+        return conn
+
+    def _open_sqlite_connection(self, db_path: str) -> Optional[sqlite3.Connection]:
+        """
+        Returns the cached connection, opening it if the database file exists.
+
+        Path resolution and the existence check (sqlite3.connect would
+        otherwise create an empty database) only run when no connection is
+        cached yet. Callers must hold self._sqlite_lock.
+
+        Args:
+            db_path: Path to the SQLite database file (may start with ~)
+
+        Returns:
+            Open connection, or None if the database file does not exist
+        """
+        if self._sqlite_conn is not None:
+            return self._sqlite_conn
+        path = Path(db_path).expanduser()
+        if not path.exists():
+            return None
+        return self._get_sqlite_connection(path)
+
+    def _close_sqlite_connection(self) -> None:
+        """Closes the persistent SQLite connection, if open."""
+        conn = self._sqlite_conn
+        if conn is not None:
+            self._sqlite_conn = None
+            _open_sqlite_connections.discard(conn)
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.debug(f"Error closing SQLite connection: {e}")
+
+    def _apply_fields(self, data: dict, field_attrs: Tuple[Tuple[str, str], ...]) -> None:
+        """
+        Copies the known, non-null fields in data onto the matching attributes.
+
+        One pass over the fixed field table with a single dict probe per
+        field; unknown payload keys are never visited. Null values leave the
+        current attribute (e.g. a constructor argument) untouched.
+
+        Args:
+            data: Parsed credential payload
+            field_attrs: (payload field name, instance attribute) pairs
+        """
+        get = data.get
+        for field, attr in field_attrs:
+            value = get(field)
+            if value is not None:
+                setattr(self, attr, value)
+
     def _load_credentials_from_sqlite(self, db_path: str) -> None:
         """
         Loads credentials from kiro-cli SQLite database.
@@ -82,33 +421,49 @@ class KiroCredentialsMixin:
             db_path: Path to SQLite database file
         """
         try:
-            path = Path(db_path).expanduser()
-            if not path.exists():
-                logger.warning(f"SQLite database not found: {db_path}")
-                return
+            with self._sqlite_lock:
+                conn = self._open_sqlite_connection(db_path)
+                if conn is None:
+                    logger.warning(f"SQLite database not found: {db_path}")
+                    return
+                self._read_sqlite_credentials(conn)
+            logger.info(f"Credentials loaded from SQLite database: {db_path}")
 
-            conn = sqlite3.connect(str(path))
-            cursor = conn.cursor()
+        except sqlite3.Error as e:
+            # Drop the cached connection, the next access reopens it
+            with self._sqlite_lock:
+                self._close_sqlite_connection()
+            logger.error(f"SQLite error loading credentials: {e}")
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON decode error in SQLite data: {e}")
+        except Exception as e:
+            logger.error(f"Error loading credentials from SQLite: {e}")
 
-            # Try all possible token keys in priority order
-            token_row = None
+    def _read_sqlite_credentials(self, conn: sqlite3.Connection) -> None:
+        """
+        Reads token and device registration rows into the host instance.
+
+        Args:
+            conn: Open connection to the kiro-cli database
+        """
+        cursor = conn.cursor()
+        try:
+            cursor.execute(_SELECT_AUTH_KEYS_SQL, _SELECT_AUTH_KEYS_PARAMS)
+            rows = dict(cursor.fetchall())
+
+            # Pick the first present token key in priority order
+            token_value = None
             for key in SQLITE_TOKEN_KEYS:
-                cursor.execute("SELECT value FROM auth_kv WHERE key = ?", (key,))
-                token_row = cursor.fetchone()
-                if token_row:
+                token_value = rows.get(key)
+                if token_value:
                     self._sqlite_token_key = key
                     logger.debug(f"Loaded credentials from SQLite key: {key}")
                     break
 
-            if token_row:
-                token_data = json.loads(token_row[0])
+            if token_value:
+                token_data = _parse_sqlite_token_value(token_value)
                 if token_data:
-                    if 'access_token' in token_data:
-                        self._access_token = token_data['access_token']
-                    if 'refresh_token' in token_data:
-                        self._refresh_token = token_data['refresh_token']
-                    if 'profile_arn' in token_data:
-                        self._profile_arn = token_data['profile_arn']
+                    self._apply_fields(token_data, _SQLITE_TOKEN_FIELD_ATTRS)
                     if 'region' in token_data:
                         # Store SSO region for OIDC token refresh only.
                         # The CodeWhisperer API is only available in us-east-1,
@@ -118,51 +473,32 @@ class KiroCredentialsMixin:
                             f"SSO region from SQLite: {self._sso_region} "
                             f"(API stays at {self._region})"
                         )
-                    if 'scopes' in token_data:
-                        self._scopes = token_data['scopes']
                     if 'expires_at' in token_data:
                         try:
-                            expires_str = token_data['expires_at']
-                            if expires_str.endswith('Z'):
-                                self._expires_at = datetime.fromisoformat(
-                                    expires_str.replace('Z', '+00:00')
-                                )
-                            else:
-                                self._expires_at = datetime.fromisoformat(expires_str)
+                            self._expires_at = _parse_iso(token_data['expires_at'])
                         except Exception as e:
                             logger.warning(f"Failed to parse expires_at from SQLite: {e}")
 
             # Load device registration (client_id, client_secret)
-            registration_row = None
+            registration_value = None
             for key in SQLITE_REGISTRATION_KEYS:
-                cursor.execute("SELECT value FROM auth_kv WHERE key = ?", (key,))
-                registration_row = cursor.fetchone()
-                if registration_row:
+                registration_value = rows.get(key)
+                if registration_value:
                     logger.debug(f"Loaded device registration from SQLite key: {key}")
                     break
 
-            if registration_row:
-                registration_data = json.loads(registration_row[0])
+            if registration_value:
+                registration_data = json_loads(registration_value)
                 if registration_data:
-                    if 'client_id' in registration_data:
-                        self._client_id = registration_data['client_id']
-                    if 'client_secret' in registration_data:
-                        self._client_secret = registration_data['client_secret']
+                    self._apply_fields(registration_data, _SQLITE_REGISTRATION_FIELD_ATTRS)
                     if 'region' in registration_data and not self._sso_region:
                         self._sso_region = registration_data['region']
                         logger.debug(
                             f"SSO region from device-registration: {self._sso_region}"
                         )
 
-            conn.close()
-            logger.info(f"Credentials loaded from SQLite database: {db_path}")
-
-        except sqlite3.Error as e:
-            logger.error(f"SQLite error loading credentials: {e}")
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error in SQLite data: {e}")
-        except Exception as e:
-            logger.error(f"Error loading credentials from SQLite: {e}")
+        finally:
+            cursor.close()
 
     def _load_credentials_from_file(self, file_path: str) -> None:
         """
@@ -181,20 +517,20 @@ class KiroCredentialsMixin:
             file_path: Path to JSON file
         """
         try:
-            path = Path(file_path).expanduser()
-            if not path.exists():
+            try:
+                data = _read_json_file_cached(Path(file_path).expanduser())
+            except FileNotFoundError:
                 logger.warning(f"Credentials file not found: {file_path}")
                 return
 
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # clientIdHash first: explicit clientId/clientSecret in the file
+            # override the values from the enterprise device registration
+            if 'clientIdHash' in data:
+                self._client_id_hash = data['clientIdHash']
+                self._load_enterprise_device_registration(self._client_id_hash)
+
+            self._apply_fields(data, _FILE_FIELD_ATTRS)
 
-            if 'refreshToken' in data:
-                self._refresh_token = data['refreshToken']
-            if 'accessToken' in data:
-                self._access_token = data['accessToken']
-            if 'profileArn' in data:
-                self._profile_arn = data['profileArn']
             if 'region' in data:
                 self._region = data['region']
                 self._refresh_url = get_kiro_refresh_url(self._region)
@@ -205,24 +541,9 @@ class KiroCredentialsMixin:
                     f"api_host={self._api_host}, q_host={self._q_host}"
                 )
 
-            if 'clientIdHash' in data:
-                self._client_id_hash = data['clientIdHash']
-                self._load_enterprise_device_registration(self._client_id_hash)
-
-            if 'clientId' in data:
-                self._client_id = data['clientId']
-            if 'clientSecret' in data:
-                self._client_secret = data['clientSecret']
-
             if 'expiresAt' in data:
                 try:
-                    expires_str = data['expiresAt']
-                    if expires_str.endswith('Z'):
-                        self._expires_at = datetime.fromisoformat(
-                            expires_str.replace('Z', '+00:00')
-                        )
-                    else:
-                        self._expires_at = datetime.fromisoformat(expires_str)
+                    self._expires_at = _parse_iso(data['expiresAt'])
                 except Exception as e:
                     logger.warning(f"Failed to parse expiresAt: {e}")
 
@@ -245,36 +566,73 @@ class KiroCredentialsMixin:
             device_reg_path = (
                 Path.home() / ".aws" / "sso" / "cache" / f"{client_id_hash}.json"
             )
-            if not device_reg_path.exists():
+            try:
+                device_data = _read_json_file_cached(device_reg_path)
+            except FileNotFoundError:
                 logger.warning(
                     f"Enterprise device registration file not found: {device_reg_path}"
                 )
                 return
 
-            with open(device_reg_path, 'r', encoding='utf-8') as f:
-                device_data = json.load(f)
-
-            if 'clientId' in device_data:
-                self._client_id = device_data['clientId']
-            if 'clientSecret' in device_data:
-                self._client_secret = device_data['clientSecret']
+            self._apply_fields(device_data, _ENTERPRISE_REGISTRATION_FIELD_ATTRS)
 
             logger.info(f"Enterprise device registration loaded from {device_reg_path}")
 
         except Exception as e:
             logger.error(f"Error loading enterprise device registration: {e}")
 
+    def _credentials_signature(self) -> tuple:
+        """Returns the persisted credential fields, to detect a no-op save."""
+        scopes = self._scopes
+        return (
+            self._access_token,
+            self._refresh_token,
+            self._expires_at,
+            self._profile_arn,
+            self._sso_region or self._region,
+            tuple(scopes) if scopes else None,
+        )
+
+    def _read_creds_file_for_update(self, path: Path) -> Tuple[dict, int]:
+        """
+        Returns a private copy of the credentials file data and its file mode.
+
+        If the file is still exactly as our last save left it (same mtime and
+        size), the in-memory mirror is returned and nothing is read or parsed.
+
+        Args:
+            path: Resolved credentials file path
+
+        Returns:
+            Tuple of (mutable file data, permission bits for the rewrite)
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return {}, 0o600
+        mode = stat.S_IMODE(st.st_mode)
+        mirror = self._creds_file_mirror
+        if mirror is not None and mirror[0] == st.st_mtime_ns and mirror[1] == st.st_size:
+            return mirror[2], mode
+        return dict(_read_json_file_cached(path)), mode
+
     def _save_credentials_to_file(self) -> None:
-        """Saves updated credentials to the JSON file, preserving other fields."""
-        if not self._creds_file:
+        """
+        Saves updated credentials to the JSON file, preserving other fields.
+
+        The file is replaced atomically, so a crash mid-save cannot leave a
+        truncated file behind.
+        """
+        path = self._creds_file_path
+        if path is None:
+            return
+        signature = self._credentials_signature()
+        if signature == self._last_saved_sig:
+            logger.debug("Credentials unchanged since last save, skipping file write")
             return
 
         try:
-            path = Path(self._creds_file).expanduser()
-            existing_data: dict = {}
-            if path.exists():
-                with open(path, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
+            existing_data, mode = self._read_creds_file_for_update(path)
 
             existing_data['accessToken'] = self._access_token
             existing_data['refreshToken'] = self._refresh_token
@@ -283,14 +641,35 @@ class KiroCredentialsMixin:
             if self._profile_arn:
                 existing_data['profileArn'] = self._profile_arn
 
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(existing_data, f, indent=2, ensure_ascii=False)
+            _write_file_atomic(path, json_dumps_bytes(existing_data, indent=True), mode)
+            _invalidate_json_file_cache(path)
+            st = os.stat(path)
+            self._creds_file_mirror = (st.st_mtime_ns, st.st_size, existing_data)
+            self._last_saved_sig = signature
 
             logger.debug(f"Credentials saved to {self._creds_file}")
 
         except Exception as e:
             logger.error(f"Error saving credentials: {e}")
 
+    async def _persist_credentials(self) -> None:
+        """
+        Saves credentials to SQLite or the JSON file from a worker thread.
+
+        Both savers block on disk I/O (fsync, SQLite write lock), so they run
+        via asyncio.to_thread and the event loop keeps serving requests.
+        Concurrent savers are serialized by _sqlite_lock and by the refresh
+        single-flight, so no extra asyncio lock is needed.
+        """
+        if self._sqlite_db:
+            await asyncio.to_thread(self._save_credentials_to_sqlite)
+        else:
+            await asyncio.to_thread(self._save_credentials_to_file)
+
+    async def _reload_credentials_from_sqlite(self) -> None:
+        """Reloads credentials from the SQLite database from a worker thread."""
+        await asyncio.to_thread(self._load_credentials_from_sqlite, self._sqlite_db)
+
     def _save_credentials_to_sqlite(self) -> None:
         """
         Saves updated credentials back to SQLite database.
@@ -298,69 +677,120 @@ class KiroCredentialsMixin:
         Persists tokens refreshed by the gateway so they are available
         after restart or for other processes reading the same database.
 
-        Strategy: save to the key we loaded from (_sqlite_token_key).
-        Falls back to trying all supported keys if that fails.
+        Strategy: save to the key we loaded from (_sqlite_token_key),
+        otherwise to the highest-priority supported key that exists.
+
+        The token payload is built in a dict reused across saves
+        (_token_data_buf), filled under _sqlite_lock so concurrent savers
+        cannot interleave.
         """
         if not self._sqlite_db:
             return
+        signature = self._credentials_signature()
+        if signature == self._last_saved_sig:
+            logger.debug("Credentials unchanged since last save, skipping SQLite write")
+            return
 
         try:
-            path = Path(self._sqlite_db).expanduser()
-            if not path.exists():
-                logger.warning(
-                    f"SQLite database not found for writing: {self._sqlite_db}"
-                )
-                return
-
-            conn = sqlite3.connect(str(path), timeout=5.0)
-            cursor = conn.cursor()
-
-            token_data: dict = {
-                "access_token": self._access_token,
-                "refresh_token": self._refresh_token,
-                "expires_at": self._expires_at.isoformat() if self._expires_at else None,
-                "region": self._sso_region or self._region,
-            }
-            if self._scopes:
-                token_data["scopes"] = self._scopes
-
-            token_json = json.dumps(token_data)
-
-            if self._sqlite_token_key:
-                cursor.execute(
-                    "UPDATE auth_kv SET value = ? WHERE key = ?",
-                    (token_json, self._sqlite_token_key),
-                )
-                if cursor.rowcount > 0:
-                    conn.commit()
-                    conn.close()
-                    logger.debug(
-                        f"Credentials saved to SQLite key: {self._sqlite_token_key}"
-                    )
-                    return
-                else:
+            with self._sqlite_lock:
+                conn = self._open_sqlite_connection(self._sqlite_db)
+                if conn is None:
                     logger.warning(
-                        f"Failed to update SQLite key: {self._sqlite_token_key}, "
-                        "trying fallback"
+                        f"SQLite database not found for writing: {self._sqlite_db}"
                     )
+                    return
 
-            for key in SQLITE_TOKEN_KEYS:
-                cursor.execute(
-                    "UPDATE auth_kv SET value = ? WHERE key = ?",
-                    (token_json, key),
+                token_data = self._token_data_buf
+                token_data.clear()
+                token_data["access_token"] = self._access_token
+                token_data["refresh_token"] = self._refresh_token
+                token_data["expires_at"] = (
+                    self._expires_at.isoformat() if self._expires_at else None
                 )
-                if cursor.rowcount > 0:
-                    conn.commit()
-                    conn.close()
-                    logger.debug(f"Credentials saved to SQLite key: {key} (fallback)")
-                    return
+                token_data["region"] = self._sso_region or self._region
+                if self._scopes:
+                    token_data["scopes"] = self._scopes
 
-            conn.close()
-            logger.warning(
-                "Failed to save credentials to SQLite: no matching keys found"
-            )
+                # Stored as TEXT (kiro-cli reads the column as a string), not BLOB
+                token_json = json_dumps_bytes(token_data).decode("utf-8")
+                saved = self._write_sqlite_token(conn, token_json)
+
+            if saved:
+                self._last_saved_sig = signature
+            else:
+                logger.warning(
+                    "Failed to save credentials to SQLite: no matching keys found"
+                )
 
         except sqlite3.Error as e:
+            # Drop the cached connection, the next access reopens it
+            with self._sqlite_lock:
+                self._close_sqlite_connection()
             logger.error(f"SQLite error saving credentials: {e}")
         except Exception as e:
             logger.error(f"Error saving credentials to SQLite: {e}")
+
+    def _write_sqlite_token(self, conn: sqlite3.Connection, token_json: str) -> bool:
+        """
+        Writes the token JSON in an explicit BEGIN IMMEDIATE transaction.
+
+        _UPDATE_TOKEN_SQL is a single statement, so it is atomic on its own;
+        the explicit transaction is kept only so the RETURNING rows are read
+        before the commit rather than while an autocommit statement is still
+        open.
+
+        Args:
+            conn: Open autocommit connection to the kiro-cli database
+            token_json: Serialized token data
+
+        Returns:
+            True if a row was updated, False if no supported key exists
+        """
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                saved = self._update_token_rows(cursor, token_json)
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+            return saved
+        finally:
+            cursor.close()
+
+    def _update_token_rows(self, cursor: sqlite3.Cursor, token_json: str) -> bool:
+        """
+        Updates the key we loaded from, or the first existing key by priority.
+
+        When the database reports the updated key (RETURNING), it becomes
+        _sqlite_token_key so later saves target it directly.
+
+        Args:
+            cursor: Cursor inside an open write transaction
+            token_json: Serialized token data
+
+        Returns:
+            True if a row was updated, False if no supported key exists
+        """
+        preferred = self._sqlite_token_key
+        cursor.execute(
+            _UPDATE_TOKEN_SQL,
+            (token_json, preferred, *_TOKEN_KEYS_PARAMS, preferred, *_TOKEN_KEYS_PARAMS),
+        )
+        if not _SQLITE_HAS_RETURNING:
+            return cursor.rowcount > 0
+
+        # Drain the RETURNING rows so the statement completes before COMMIT
+        rows = cursor.fetchall()
+        if not rows:
+            return False
+        key = rows[0][0]
+        if key != preferred:
+            if preferred:
+                logger.warning(
+                    f"Failed to update SQLite key: {preferred}, saved to fallback key: {key}"
+                )
+            self._sqlite_token_key = key
+        logger.debug(f"Credentials saved to SQLite key: {key}")
+        return True
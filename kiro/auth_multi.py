@@ -26,10 +26,19 @@ refresh tokens, and the TokenInfo dataclass used to track token health.
 """
 
 import asyncio
+import hashlib
+import heapq
+import importlib.util
+import itertools
+import os
+import random
+import time
+from contextlib import contextmanager
 from enum import Enum
 from dataclasses import dataclass
-from datetime import datetime, timezone, timedelta
-from typing import Optional, List
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, Optional, List, Tuple
 
 import httpx
 from loguru import logger
@@ -41,7 +50,39 @@ from kiro.config import (
     get_kiro_api_host,
     get_kiro_q_host,
 )
-from kiro.utils import get_machine_fingerprint
+from kiro.auth_credentials import _write_file_atomic
+from kiro.utils import get_machine_fingerprint, json_dumps_bytes, json_loads
+
+try:
+    import fcntl
+except ImportError:  # Windows: the token cache is used without a cross-process lock
+    fcntl = None
+
+
+# Upper bound on concurrent refresh requests issued by refresh_all_tokens,
+# so large pools do not stampede the auth endpoint.
+_REFRESH_CONCURRENCY = 8
+
+# Backoff after a token's 1st, 2nd and 3rd+ consecutive failure (seconds),
+# plus up to 10% random jitter so failed tokens don't retry in lockstep
+_FAILURE_BACKOFFS = (5 * 60, 30 * 60, 2 * 60 * 60)
+_FAILURE_BACKOFF_JITTER = 0.1
+
+# Minimum time between two refresh attempts of the same token (seconds), so
+# a failure storm cannot hammer the auth endpoint in a loop. Applies to every
+# refresh path; an attempt inside the gap is skipped, never slept on
+_MIN_REFRESH_GAP = 2.0
+
+# Cached access tokens closer than this to expiry are not restored on startup
+_TOKEN_CACHE_MIN_VALIDITY = 60
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class RefreshThrottledError(Exception):
+    """Raised when a token was already refreshed less than _MIN_REFRESH_GAP ago."""
+    pass
 
 
 class AuthType(Enum):
@@ -62,19 +103,33 @@ class AuthType(Enum):
 
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenInfo:
-    """Information about a single refresh token with health tracking."""
+    """
+    Information about a single refresh token with health tracking.
+
+    Timestamps are Unix epoch seconds (time.time()), so the rotation and
+    expiry checks compare plain floats; they are converted to ISO strings
+    only for status output.
+    """
     refresh_token: str
     access_token: Optional[str] = None
-    expires_at: Optional[datetime] = None
+    expires_at: Optional[float] = None
     is_failed: bool = False
     failure_count: int = 0
-    last_failure: Optional[datetime] = None
-    last_refresh: Optional[datetime] = None
+    last_failure: Optional[float] = None
+    backoff_until: Optional[float] = None
+    last_refresh: Optional[float] = None
     profile_arn: Optional[str] = None
 
 
+def _epoch_to_iso(value: Optional[float]) -> Optional[str]:
+    """Formats an epoch timestamp as an ISO-8601 UTC string (None passes through)."""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
+
+
 # Multi-Token Support (based on user's implementation that ran 30 days)
 # ==================================================================================================
 
@@ -103,6 +158,7 @@ class MultiTokenAuthManager:
         refresh_tokens: Optional[List[str]] = None,
         profile_arn: Optional[str] = None,
         region: str = "us-east-1",
+        token_cache_file: Optional[str] = None,
     ):
         """
         Initialize multi-token auth manager.
@@ -111,6 +167,9 @@ class MultiTokenAuthManager:
             refresh_tokens: List of refresh tokens
             profile_arn: AWS CodeWhisperer profile ARN
             region: AWS region (default: us-east-1)
+            token_cache_file: Optional JSON file shared between gateway
+                processes; refreshed tokens are saved there and restored
+                on startup instead of being refreshed again
         """
         # Initialize token pool
         self._tokens: List[TokenInfo] = []
@@ -123,6 +182,17 @@ class MultiTokenAuthManager:
         # Current active token index
         self._active_index = 0 if self._tokens else -1
 
+        # Rotation order: min-heap of (ready_at, seq, index). ready_at is 0.0
+        # for healthy tokens or the backoff deadline of a failed one; seq
+        # keeps ready tokens in least-recently-used (round-robin) order.
+        # Entries whose seq no longer matches _heap_seq[index] are stale
+        self._ready_heap: List[Tuple[float, int, int]] = []
+        self._heap_seq: List[int] = [0] * len(self._tokens)
+        self._heap_counter = itertools.count()
+        # time.monotonic() of the last refresh POST per token (see _do_refresh)
+        self._last_refresh_attempt: List[float] = [float("-inf")] * len(self._tokens)
+        self._rebuild_ready_heap(self._active_index + 1)
+
         # Request counter for account rotation
         self._request_counter = 0
         self._requests_per_account = 3  # Rotate every 3 requests
@@ -133,7 +203,11 @@ class MultiTokenAuthManager:
         self._region = region
         self._lock = asyncio.Lock()
         self._background_task: Optional[asyncio.Task] = None
+        self._refresh_future: Optional[asyncio.Future] = None
         self._shutdown = False
+        self._http_client: Optional[httpx.AsyncClient] = None
+        # get_token_status: per-token (fields, rendered dict), see there
+        self._status_cache: List[Optional[Tuple[tuple, dict]]] = [None] * len(self._tokens)
 
         # Dynamic URLs based on region
         self._refresh_url = get_kiro_refresh_url(region)
@@ -142,6 +216,23 @@ class MultiTokenAuthManager:
 
         # Fingerprint for User-Agent
         self._fingerprint = get_machine_fingerprint()
+        # Refresh request headers never change, so build them once
+        self._refresh_headers = {
+            "Content-Type": "application/json",
+            "User-Agent": f"KiroGateway-{self._fingerprint[:16]}",
+        }
+
+        # Cache entries are keyed by a hash of the configured refresh token,
+        # which stays stable even after the token itself is rotated
+        self._token_ids = [
+            hashlib.sha256(token.refresh_token.encode()).hexdigest()[:16]
+            for token in self._tokens
+        ]
+        self._token_cache_file = (
+            Path(token_cache_file).expanduser() if token_cache_file else None
+        )
+        if self._token_cache_file is not None:
+            self._load_token_cache()
 
         if self._tokens:
             logger.info(f"MultiTokenAuthManager initialized with {len(self._tokens)} tokens")
@@ -154,10 +245,42 @@ class MultiTokenAuthManager:
             return None
         return self._tokens[self._active_index]
 
+    @staticmethod
+    def _ready_at(token: TokenInfo) -> float:
+        """Returns when a token may be used again (0.0 if it is healthy)."""
+        if token.is_failed and token.backoff_until:
+            return token.backoff_until
+        return 0.0
+
+    def _schedule_token(self, index: int, ready_at: float) -> None:
+        """Queues a token at the back of the rotation order, invalidating its old entry."""
+        seq = next(self._heap_counter)
+        self._heap_seq[index] = seq
+        heapq.heappush(self._ready_heap, (ready_at, seq, index))
+        # Drop stale entries once they outnumber live ones
+        if len(self._ready_heap) > 4 * len(self._tokens):
+            self._ready_heap = [
+                entry for entry in self._ready_heap if self._heap_seq[entry[2]] == entry[1]
+            ]
+            heapq.heapify(self._ready_heap)
+
+    def _rebuild_ready_heap(self, start: int) -> None:
+        """Rebuilds the rotation order cyclically from index start."""
+        self._ready_heap = []
+        count = len(self._tokens)
+        for i in range(count):
+            index = (start + i) % count
+            self._schedule_token(index, self._ready_at(self._tokens[index]))
+
     def _rotate_to_next_token(self) -> bool:
         """
         Rotate to the next available token.
 
+        The current token goes to the back of the rotation heap and the least
+        recently used token whose backoff has expired is popped, in
+        O(log N) instead of a scan over the whole pool. A heap entry whose
+        token failed since it was queued is re-queued at its backoff deadline.
+
         Returns:
             True if rotation successful, False if no more tokens available
         """
@@ -165,40 +288,187 @@ class MultiTokenAuthManager:
             return False
 
         original_index = self._active_index
+        now = time.time()
+        if original_index >= 0:
+            self._schedule_token(original_index, self._ready_at(self._tokens[original_index]))
+
+        heap = self._ready_heap
+        while heap:
+            ready_at, seq, index = heap[0]
+            if seq != self._heap_seq[index]:
+                heapq.heappop(heap)
+                continue
+            if ready_at > now:
+                break
 
-        # Try all tokens in order, starting from the one after the current active
-        for i in range(1, len(self._tokens) + 1):
-            next_index = (original_index + i) % len(self._tokens)
-            token = self._tokens[next_index]
-
-            # Skip tokens that are marked as failed
-            if token.is_failed and token.last_failure:
-                time_since_failure = datetime.now(timezone.utc) - token.last_failure
-
-                # Exponential backoff based on failure count
-                if token.failure_count == 1:
-                    backoff = timedelta(minutes=5)
-                elif token.failure_count == 2:
-                    backoff = timedelta(minutes=30)
-                else:  # 3 or more failures
-                    backoff = timedelta(hours=2)
-
-                if time_since_failure < backoff:
-                    continue
+            # Re-check the live state: the token may have failed after it was queued
+            token_ready_at = self._ready_at(self._tokens[index])
+            if token_ready_at > now:
+                self._schedule_token(index, token_ready_at)
+                continue
 
-            self._active_index = next_index
+            self._schedule_token(index, token_ready_at)
+            self._active_index = index
             logger.info(f"Rotated to token {self._active_index + 1}/{len(self._tokens)}")
             return True
 
         # Reset failures if all are in backoff (staggered to avoid thundering herd)
         for i, token in enumerate(self._tokens):
             token.is_failed = False
+        self._rebuild_ready_heap(original_index + 1)
 
         if original_index >= 0:
             self._active_index = original_index
 
         return False
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Returns the HTTP client shared by all token refreshes of this manager.
+
+        Created lazily and recreated if closed. The keep-alive pool scales
+        with the number of tokens, so concurrent refreshes from
+        refresh_all_tokens never wait for a free connection. With h2
+        installed the client also offers HTTP/2, and when the auth host
+        negotiates it the POSTs multiplex over a single connection; hosts
+        that answer with HTTP/1.1 still get the full pool.
+        """
+        client = self._http_client
+        if client is None or client.is_closed:
+            pool_size = len(self._tokens)
+            limits = httpx.Limits(
+                max_keepalive_connections=max(8, pool_size),
+                max_connections=max(16, 2 * pool_size),
+                keepalive_expiry=300,
+            )
+            client = httpx.AsyncClient(timeout=30, limits=limits, http2=_HTTP2_AVAILABLE)
+            self._http_client = client
+        return client
+
+    @staticmethod
+    def _mark_token_failed(token: TokenInfo) -> None:
+        """
+        Marks a token as failed and sets the deadline of its backoff window.
+
+        The backoff grows with consecutive failures (5min, 30min, 2h) and is
+        computed once here, so rotation only compares a float per token.
+        """
+        token.is_failed = True
+        token.failure_count += 1
+        now = time.time()
+        token.last_failure = now
+        backoff = _FAILURE_BACKOFFS[min(token.failure_count, len(_FAILURE_BACKOFFS)) - 1]
+        token.backoff_until = now + backoff + random.uniform(0, backoff * _FAILURE_BACKOFF_JITTER)
+
+    @contextmanager
+    def _token_cache_locked(self, exclusive: bool) -> Iterator[None]:
+        """
+        Holds an advisory lock on the token cache's sidecar .lock file.
+
+        The cache itself is replaced atomically on every save, so the lock
+        lives on a separate file whose inode never changes. No-op without fcntl.
+        """
+        if fcntl is None:
+            yield
+            return
+        lock_path = self._token_cache_file.with_name(self._token_cache_file.name + ".lock")
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            os.close(fd)  # closing the descriptor releases the lock
+
+    def _read_token_cache(self) -> Dict[str, dict]:
+        """Reads the cache file, returning {} if it is missing or unreadable."""
+        try:
+            entries = json_loads(self._token_cache_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable token cache {self._token_cache_file}: {e}")
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _load_token_cache(self) -> None:
+        """
+        Restores tokens saved by this or another gateway process.
+
+        Rotated refresh tokens are always restored; access tokens only if
+        they are valid for more than _TOKEN_CACHE_MIN_VALIDITY seconds.
+        """
+        try:
+            self._token_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with self._token_cache_locked(exclusive=False):
+                entries = self._read_token_cache()
+        except OSError as e:
+            logger.warning(f"Token cache {self._token_cache_file} unavailable: {e}")
+            return
+
+        now = time.time()
+        restored = 0
+        for token_id, token in zip(self._token_ids, self._tokens):
+            entry = entries.get(token_id)
+            if not isinstance(entry, dict):
+                continue
+            if entry.get("refresh_token"):
+                token.refresh_token = entry["refresh_token"]
+            expires_at = entry.get("expires_at")
+            if (
+                entry.get("access_token")
+                and isinstance(expires_at, (int, float))
+                and expires_at - now > _TOKEN_CACHE_MIN_VALIDITY
+            ):
+                token.access_token = entry["access_token"]
+                token.expires_at = float(expires_at)
+                token.profile_arn = entry.get("profile_arn") or token.profile_arn
+                restored += 1
+
+        if restored:
+            logger.info(f"Restored {restored}/{len(self._tokens)} access tokens from {self._token_cache_file}")
+
+    def _write_token_cache(self, snapshot: Dict[str, dict]) -> None:
+        """
+        Merges snapshot into the cache file under the exclusive lock.
+
+        An entry already in the file wins if it expires later, i.e. another
+        process refreshed that token more recently than we did.
+        """
+        try:
+            with self._token_cache_locked(exclusive=True):
+                entries = self._read_token_cache()
+                for token_id, entry in snapshot.items():
+                    current = entries.get(token_id)
+                    if (
+                        isinstance(current, dict)
+                        and isinstance(current.get("expires_at"), (int, float))
+                        and current["expires_at"] > entry["expires_at"]
+                    ):
+                        continue
+                    entries[token_id] = entry
+                _write_file_atomic(self._token_cache_file, json_dumps_bytes(entries), 0o600)
+        except Exception as e:
+            logger.warning(f"Error saving token cache {self._token_cache_file}: {e}")
+
+    async def _persist_token_cache(self) -> None:
+        """Saves tokens holding an access token to the cache file (if configured)."""
+        if self._token_cache_file is None:
+            return
+        # Snapshot on the event loop so the worker thread never sees a
+        # token half-way through a refresh
+        snapshot = {
+            token_id: {
+                "refresh_token": token.refresh_token,
+                "access_token": token.access_token,
+                "expires_at": token.expires_at,
+                "profile_arn": token.profile_arn,
+            }
+            for token_id, token in zip(self._token_ids, self._tokens)
+            if token.access_token and token.expires_at
+        }
+        if snapshot:
+            await asyncio.to_thread(self._write_token_cache, snapshot)
+
     def _mask_token(self, token: Optional[str]) -> str:
         """Mask a token for safe logging (shows first 8 chars only)."""
         if not token:
@@ -211,9 +481,7 @@ class MultiTokenAuthManager:
         if not token or not token.expires_at:
             return True
 
-        now = datetime.now(timezone.utc)
-        threshold = now.timestamp() + TOKEN_REFRESH_THRESHOLD
-        return token.expires_at.timestamp() <= threshold
+        return token.expires_at - time.time() <= TOKEN_REFRESH_THRESHOLD
 
     def is_token_fresh_for_streaming(self, min_validity_seconds: float = 600) -> bool:
         """
@@ -230,10 +498,61 @@ class MultiTokenAuthManager:
         if not token or not token.expires_at:
             return False
 
-        now = datetime.now(timezone.utc)
-        time_until_expiry = (token.expires_at - now).total_seconds()
+        return token.expires_at - time.time() >= min_validity_seconds
+
+    async def _do_refresh(self, index: int) -> bool:
+        """
+        Performs one refresh request for the token at index.
+
+        On success the token's access/refresh token, profile ARN and expiry
+        are updated and a failed token is made eligible for rotation again.
+        Attempts on the same token are at least _MIN_REFRESH_GAP apart on
+        every refresh path (on-demand, forced, background).
+
+        Returns:
+            True on success, False if the response has no accessToken
+
+        Raises:
+            RefreshThrottledError: Token was refreshed less than _MIN_REFRESH_GAP ago
+            httpx.HTTPStatusError: Auth endpoint returned an error status
+            Exception: Network or decoding errors
+        """
+        now_mono = time.monotonic()
+        if now_mono - self._last_refresh_attempt[index] < _MIN_REFRESH_GAP:
+            raise RefreshThrottledError(f"Token {index + 1} refreshed less than {_MIN_REFRESH_GAP}s ago")
+        self._last_refresh_attempt[index] = now_mono
+
+        token = self._tokens[index]
+        response = await self._get_http_client().post(
+            self._refresh_url,
+            content=json_dumps_bytes({"refreshToken": token.refresh_token}),
+            headers=self._refresh_headers,
+        )
+        response.raise_for_status()
+        data = json_loads(response.content)
+
+        new_access_token = data.get("accessToken")
+        if not new_access_token:
+            return False
 
-        return time_until_expiry >= min_validity_seconds
+        token.access_token = new_access_token
+        new_refresh_token = data.get("refreshToken")
+        if new_refresh_token:
+            token.refresh_token = new_refresh_token
+        new_profile_arn = data.get("profileArn")
+        if new_profile_arn:
+            token.profile_arn = new_profile_arn
+
+        # Calculate expiration time with buffer (minus 60 seconds for safety)
+        now = time.time()
+        token.expires_at = now + data.get("expiresIn", 3600) - 60
+        token.last_refresh = now
+        if token.is_failed:
+            # Recovered before its backoff deadline: make it eligible again
+            self._schedule_token(index, 0.0)
+        token.is_failed = False
+        token.failure_count = 0
+        return True
 
     async def _refresh_single_token(self, index: int) -> bool:
         """Refresh a specific token by index."""
@@ -244,59 +563,26 @@ class MultiTokenAuthManager:
         masked = self._mask_token(token.refresh_token)
         logger.debug(f"Refreshing token {index + 1}/{len(self._tokens)} (token: {masked})")
 
-        payload = {"refreshToken": token.refresh_token}
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": f"KiroGateway-{self._fingerprint[:16]}",
-        }
-
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.post(
-                    self._refresh_url, json=payload, headers=headers
-                )
-                response.raise_for_status()
-                data = response.json()
-
-            new_access_token = data.get("accessToken")
-            new_refresh_token = data.get("refreshToken")
-            expires_in = data.get("expiresIn", 3600)
-            new_profile_arn = data.get("profileArn")
-
-            if not new_access_token:
+            if not await self._do_refresh(index):
                 logger.warning(f"Token {index + 1}: No accessToken in response")
                 return False
-
-            token.access_token = new_access_token
-            if new_refresh_token:
-                token.refresh_token = new_refresh_token
-            if new_profile_arn:
-                token.profile_arn = new_profile_arn
-
-            token.expires_at = datetime.fromtimestamp(
-                datetime.now(timezone.utc).timestamp() + expires_in - 60,
-                tz=timezone.utc
-            )
-            token.last_refresh = datetime.now(timezone.utc)
-            token.is_failed = False
-            token.failure_count = 0
-
-            logger.info(f"Token {index + 1}/{len(self._tokens)} refreshed successfully")
-            return True
-
+        except RefreshThrottledError as e:
+            # Another path just refreshed this token: report its current state
+            logger.debug(str(e))
+            return self._has_usable_access_token(token, time.time())
         except httpx.HTTPStatusError as e:
             logger.warning(f"Token {index + 1} refresh failed: HTTP {e.response.status_code}")
-            token.is_failed = True
-            token.failure_count += 1
-            token.last_failure = datetime.now(timezone.utc)
+            self._mark_token_failed(token)
             return False
         except Exception as e:
             logger.warning(f"Token {index + 1} refresh error: {e}")
-            token.is_failed = True
-            token.failure_count += 1
-            token.last_failure = datetime.now(timezone.utc)
+            self._mark_token_failed(token)
             return False
 
+        logger.info(f"Token {index + 1}/{len(self._tokens)} refreshed successfully")
+        return True
+
     async def _refresh_token_request(self) -> None:
         """Refresh the active token with rotation on failure."""
         if not self._tokens:
@@ -305,54 +591,35 @@ class MultiTokenAuthManager:
         last_error = None
 
         for attempt in range(len(self._tokens)):
-            token = self._tokens[self._active_index]
+            index = self._active_index
+            token = self._tokens[index]
 
-            logger.info(f"Refreshing token {self._active_index + 1}/{len(self._tokens)}...")
-
-            payload = {"refreshToken": token.refresh_token}
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": f"KiroGateway-{self._fingerprint[:16]}",
-            }
+            logger.info(f"Refreshing token {index + 1}/{len(self._tokens)}...")
 
             try:
-                async with httpx.AsyncClient(timeout=30) as client:
-                    response = await client.post(
-                        self._refresh_url, json=payload, headers=headers
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-
-                new_access_token = data.get("accessToken")
-                new_refresh_token = data.get("refreshToken")
-                expires_in = data.get("expiresIn", 3600)
-                new_profile_arn = data.get("profileArn")
-
-                if not new_access_token:
-                    raise ValueError(f"Response does not contain accessToken: {data}")
-
-                token.access_token = new_access_token
-                if new_refresh_token:
-                    token.refresh_token = new_refresh_token
-                if new_profile_arn:
-                    token.profile_arn = new_profile_arn
-                    self._profile_arn = new_profile_arn
-
-                # Calculate expiration time with buffer (minus 60 seconds for safety)
-                token.expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in - 60)
-
-                token.is_failed = False
-                token.failure_count = 0
+                if not await self._do_refresh(index):
+                    raise ValueError("Response does not contain accessToken")
+                if token.profile_arn:
+                    self._profile_arn = token.profile_arn
 
-                logger.info(f"Token {self._active_index + 1}/{len(self._tokens)} refreshed, expires: {token.expires_at.isoformat()}")
+                logger.info(f"Token {index + 1}/{len(self._tokens)} refreshed, expires: {_epoch_to_iso(token.expires_at)}")
+                await self._persist_token_cache()
                 return
 
+            except RefreshThrottledError as e:
+                # Refreshed moments ago: keep it if that refresh succeeded,
+                # otherwise move on to the next token without marking it again
+                if self._has_usable_access_token(token, time.time()):
+                    return
+                logger.debug(str(e))
+                last_error = e
+
+                if not self._rotate_to_next_token():
+                    break
             except httpx.HTTPStatusError as e:
                 if e.response.status_code in (401, 403):
-                    logger.warning(f"Token {self._active_index + 1} failed: {e.response.status_code}")
-                    token.is_failed = True
-                    token.failure_count += 1
-                    token.last_failure = datetime.now(timezone.utc)
+                    logger.warning(f"Token {index + 1} failed: {e.response.status_code}")
+                    self._mark_token_failed(token)
                     last_error = e
 
                     if not self._rotate_to_next_token():
@@ -361,9 +628,7 @@ class MultiTokenAuthManager:
                     raise
             except Exception as e:
                 logger.error(f"Error refreshing token: {e}")
-                token.is_failed = True
-                token.failure_count += 1
-                token.last_failure = datetime.now(timezone.utc)
+                self._mark_token_failed(token)
                 last_error = e
 
                 if not self._rotate_to_next_token():
@@ -374,19 +639,75 @@ class MultiTokenAuthManager:
     async def get_access_token(self) -> str:
         """
         Get valid access token from active token, refreshing if needed.
-        
+
+        Token states:
+        - fresh: returned immediately, without taking the lock
+        - stale (expiring soon, still valid): returned immediately while a
+          refresh is started in the background
+        - expired or missing: caller waits for the refresh
+
+        The refresh runs as a shared in-flight future, so a burst of
+        requests results in exactly one refresh.
+
         Note: Rotation happens in mark_request_completed(), not here,
         to avoid interfering with ongoing streaming requests.
         """
+        # Track active request to prevent rotation during streams. There is
+        # no await before the fast-path return, so no lock is needed
+        self._active_requests += 1
+
+        token = self._get_active_token()
+        if token and token.access_token and token.expires_at:
+            remaining = token.expires_at - time.time()
+            # Fresh: valid and not expiring soon
+            if remaining > TOKEN_REFRESH_THRESHOLD:
+                return token.access_token
+            # Stale: still valid, so serve it and refresh in the background
+            if remaining > 0:
+                self._start_refresh()
+                return token.access_token
+
+        logger.debug(f"Request started: active_requests={self._active_requests}, using token {self._active_index + 1}/{len(self._tokens)}")
+        # Shield so a cancelled caller does not cancel the refresh for everyone else
+        return await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self) -> asyncio.Future:
+        """
+        Returns the in-flight refresh future, starting one if none is running.
+
+        Returns:
+            Future resolving to the refreshed access token
+        """
+        refresh = self._refresh_future
+        if refresh is None or refresh.done():
+            refresh = asyncio.ensure_future(self._refresh_and_return())
+            refresh.add_done_callback(self._log_refresh_failure)
+            self._refresh_future = refresh
+        return refresh
+
+    @staticmethod
+    def _log_refresh_failure(future: asyncio.Future) -> None:
+        """Logs a failed refresh future (and marks its exception as retrieved)."""
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Token refresh failed: {future.exception()}")
+
+    async def _refresh_and_return(self) -> str:
+        """
+        Refreshes the active token under the lock and returns its access token.
+
+        Runs as the shared in-flight future created by get_access_token().
+
+        Raises:
+            ValueError: If unable to obtain access token
+        """
         async with self._lock:
-            # Track active request to prevent rotation during streams
-            self._active_requests += 1
-            logger.debug(f"Request started: active_requests={self._active_requests}, using token {self._active_index + 1}/{len(self._tokens)}")
-            
+            # Re-check: force_refresh or refresh_all_tokens may have won the lock first
+            token = self._get_active_token()
+            if token and token.access_token and not self.is_token_expiring_soon():
+                return token.access_token
+
+            await self._refresh_token_request()
             token = self._get_active_token()
-            if not token or not token.access_token or self.is_token_expiring_soon():
-                await self._refresh_token_request()
-                token = self._get_active_token()
 
             if not token or not token.access_token:
                 raise ValueError("Failed to obtain access token")
@@ -396,23 +717,30 @@ class MultiTokenAuthManager:
     async def mark_request_completed(self) -> None:
         """
         Mark a request as completed and potentially rotate accounts.
+
+        Runs without awaiting anything, so the counters need no lock on the
+        event loop. While a refresh holds the lock, rotation is deferred to
+        the next completed request instead of switching tokens mid-refresh.
         """
-        async with self._lock:
-            # Decrement active request counter
-            if self._active_requests > 0:
-                self._active_requests -= 1
-            
-            # Track completed requests for rotation
-            self._completed_requests += 1
-            
-            logger.info(f" mark_request_completed: active={self._active_requests}, completed={self._completed_requests}")
-            
-            # Rotate every N completed requests (regardless of active requests)
-            if self._completed_requests >= self._requests_per_account and len(self._tokens) > 1:
-                # Rotate to next account
-                if self._rotate_to_next_token():
-                    logger.info(f" ROTATED to account {self._active_index + 1} after {self._completed_requests} completed requests")
-                self._completed_requests = 0  # Reset counter after rotation
+        # Decrement active request counter
+        if self._active_requests > 0:
+            self._active_requests -= 1
+        
+        # Track completed requests for rotation
+        self._completed_requests += 1
+        
+        logger.info(f" mark_request_completed: active={self._active_requests}, completed={self._completed_requests}")
+        
+        # Rotate every N completed requests (regardless of active requests)
+        if (
+            self._completed_requests >= self._requests_per_account
+            and len(self._tokens) > 1
+            and not self._lock.locked()
+        ):
+            # Rotate to next account
+            if self._rotate_to_next_token():
+                logger.info(f" ROTATED to account {self._active_index + 1} after {self._completed_requests} completed requests")
+            self._completed_requests = 0  # Reset counter after rotation
 
     async def force_refresh(self) -> str:
         """Force refresh the active token."""
@@ -424,10 +752,30 @@ class MultiTokenAuthManager:
             # NOTE: Do NOT reset request counter here - it prevents rotation
             return token.access_token
 
-    async def refresh_all_tokens(self) -> dict:
+    @staticmethod
+    def _has_usable_access_token(token: TokenInfo, now: float) -> bool:
+        """Check if a token is not failed and holds an access token that has not expired."""
+        if token.is_failed or not token.access_token or not token.expires_at:
+            return False
+        return token.expires_at > now
+
+    @staticmethod
+    def _is_refresh_due(token: TokenInfo, now: float) -> bool:
+        """Check if a token has no usable access token or expires within the threshold."""
+        if token.is_failed or not token.access_token or not token.expires_at:
+            return True
+        return token.expires_at - now <= TOKEN_REFRESH_THRESHOLD
+
+    async def refresh_all_tokens(self, only_due: bool = False) -> dict:
         """
         Refresh ALL tokens concurrently to keep them healthy.
 
+        At most _REFRESH_CONCURRENCY refresh requests are in flight at once.
+
+        Args:
+            only_due: Skip tokens that are healthy and not expiring soon;
+                skipped tokens are reported as healthy
+
         Returns:
             Dict with refresh results for each token
         """
@@ -435,14 +783,28 @@ class MultiTokenAuthManager:
             return {}
 
         results = {}
+        semaphore = asyncio.Semaphore(_REFRESH_CONCURRENCY)
+
+        async def bounded_refresh(index: int) -> bool:
+            async with semaphore:
+                return await self._refresh_single_token(index)
 
         async with self._lock:
-            # Refresh all tokens concurrently
-            tasks = [self._refresh_single_token(i) for i in range(len(self._tokens))]
-            refresh_results = await asyncio.gather(*tasks, return_exceptions=True)
+            now = time.time()
+            indices = [
+                i for i, token in enumerate(self._tokens)
+                if not only_due or self._is_refresh_due(token, now)
+            ]
+            refresh_results = await asyncio.gather(
+                *(bounded_refresh(i) for i in indices), return_exceptions=True
+            )
+            outcomes = dict(zip(indices, refresh_results))
+            if indices:
+                await self._persist_token_cache()
 
-            for i, result in enumerate(refresh_results):
+            for i in range(len(self._tokens)):
                 token_id = f"token_{i + 1}"
+                result = outcomes.get(i, True)
                 if isinstance(result, Exception):
                     results[token_id] = "failed"
                 else:
@@ -457,18 +819,22 @@ class MultiTokenAuthManager:
         Background task that periodically refreshes all tokens.
 
         FIXED: Improved timing and error handling:
-        - Initial refresh waits for app startup (60 seconds)
+        - Initial refresh waits for app startup (30-90 seconds)
         - Checks shutdown flag more frequently
         - Individual token health monitoring
+
+        Every delay is randomized (initial, interval +/-20%, error retry) so
+        gateway replicas started together don't refresh in lockstep.
         """
         logger.info("Background token refresh task started")
 
         # Initial delay to ensure app is fully started
-        await asyncio.sleep(60)
+        await asyncio.sleep(random.uniform(30, 90))
 
-        # Initial refresh of all tokens
+        # Initial refresh; tokens restored from the cache file are still
+        # valid and skipped, all others have no access token and are due
         try:
-            results = await self.refresh_all_tokens()
+            results = await self.refresh_all_tokens(only_due=True)
             healthy = sum(1 for v in results.values() if v == "healthy")
             logger.info(f"Initial token refresh: {healthy}/{len(results)} healthy")
         except Exception as e:
@@ -476,14 +842,18 @@ class MultiTokenAuthManager:
 
         while True:
             try:
-                await asyncio.sleep(BACKGROUND_REFRESH_INTERVAL)
+                await asyncio.sleep(
+                    random.uniform(
+                        BACKGROUND_REFRESH_INTERVAL * 0.8, BACKGROUND_REFRESH_INTERVAL * 1.2
+                    )
+                )
 
                 # Check shutdown flag BEFORE and AFTER sleep
                 if self._shutdown:
                     break
 
-                logger.info("Running scheduled token refresh for all tokens...")
-                results = await self.refresh_all_tokens()
+                logger.info("Running scheduled token refresh for due tokens...")
+                results = await self.refresh_all_tokens(only_due=True)
 
                 healthy = sum(1 for v in results.values() if v == "healthy")
                 failed = len(results) - healthy
@@ -498,7 +868,7 @@ class MultiTokenAuthManager:
             except Exception as e:
                 logger.error(f"Background refresh error: {e}")
                 # Brief sleep before retry to avoid spinning on persistent errors
-                await asyncio.sleep(30)
+                await asyncio.sleep(random.uniform(15, 45))
 
             # Check again after each iteration to avoid race
             if self._shutdown:
@@ -522,26 +892,47 @@ class MultiTokenAuthManager:
                 await self._background_task
             except asyncio.CancelledError:
                 pass
+        client = self._http_client
+        if client is not None:
+            self._http_client = None
+            await client.aclose()
         logger.info("Background token refresh disabled")
 
     def get_token_status(self) -> List[dict]:
         """
         Get status of all tokens for health monitoring.
 
+        Each token's dict is rendered once and reused until one of the
+        fields it reports changes, so polling the status endpoint does not
+        re-format timestamps for idle tokens. Treat the dicts as read-only.
+
         Returns:
             List of token status dicts
         """
         status = []
+        cache = self._status_cache
         for i, token in enumerate(self._tokens):
-            status.append({
-                "index": i + 1,
-                "active": i == self._active_index,
-                "has_access_token": bool(token.access_token),
-                "expires_at": token.expires_at.isoformat() if token.expires_at else None,
-                "last_refresh": token.last_refresh.isoformat() if token.last_refresh else None,
-                "is_failed": token.is_failed,
-                "failure_count": token.failure_count,
-            })
+            key = (
+                i == self._active_index,
+                bool(token.access_token),
+                token.expires_at,
+                token.last_refresh,
+                token.is_failed,
+                token.failure_count,
+            )
+            cached = cache[i]
+            if cached is None or cached[0] != key:
+                active, has_access_token, expires_at, last_refresh, is_failed, failure_count = key
+                cached = cache[i] = (key, {
+                    "index": i + 1,
+                    "active": active,
+                    "has_access_token": has_access_token,
+                    "expires_at": _epoch_to_iso(expires_at),
+                    "last_refresh": _epoch_to_iso(last_refresh),
+                    "is_failed": is_failed,
+                    "failure_count": failure_count,
+                })
+            status.append(cached[1])
         return status
 
     @property
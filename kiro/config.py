@@ -194,6 +194,12 @@ REFRESH_TOKEN: str = REFRESH_TOKENS[0] if REFRESH_TOKENS else ""
 # Tokens expire in ~60 minutes, so we refresh well before that
 BACKGROUND_REFRESH_INTERVAL: int = int(os.getenv("BACKGROUND_REFRESH_INTERVAL", "1200"))  # 20 minutes instead of 10 minutes
 
+# Cache file shared by gateway processes in multi-account mode (optional)
+# Refreshed tokens are written here and reused on startup, so workers
+# restarting together don't each refresh every token. Disabled when empty
+_raw_multi_token_cache_file = _get_raw_env_value("MULTI_TOKEN_CACHE_FILE") or os.getenv("MULTI_TOKEN_CACHE_FILE", "")
+MULTI_TOKEN_CACHE_FILE: str = str(Path(_raw_multi_token_cache_file)) if _raw_multi_token_cache_file else ""
+
 # Profile ARN for AWS CodeWhisperer
 PROFILE_ARN: str = os.getenv("PROFILE_ARN", "")
 
@@ -241,6 +247,11 @@ KIRO_Q_HOST_TEMPLATE: str = "https://q.{region}.amazonaws.com"
 # Tokens typically expire in ~60 minutes, so we refresh well before that
 TOKEN_REFRESH_THRESHOLD: int = 1800  # 30 minutes instead of 10 minutes
 
+# Minimum time between SQLite credential reloads before a refresh (in seconds)
+# Requests arriving inside the refresh window would otherwise re-read the
+# kiro-cli database one after another
+SQLITE_RELOAD_MIN_INTERVAL: float = 10.0
+
 # ==================================================================================================
 # Connection Pool Configuration
 # ==================================================================================================
@@ -196,7 +196,7 @@ def extract_images_from_tool_results(content: Any) -> List[Dict[str, Any]]:
             images.extend(tool_result_images)
 
     if images:
-        logger.debug(f"Extracted {len(images)} image(s) from tool_result content")
+        logger.debug("Extracted {} image(s) from tool_result content", len(images))
 
     return images
 
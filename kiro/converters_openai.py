@@ -105,7 +105,7 @@ def _extract_images_from_tool_message(content: Any) -> List[Dict[str, Any]]:
     images = extract_images_from_content(content)
     
     if images:
-        logger.debug(f"Extracted {len(images)} image(s) from tool message content")
+        logger.debug("Extracted {} image(s) from tool message content", len(images))
     
     return images
 
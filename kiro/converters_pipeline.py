@@ -20,6 +20,8 @@
 """Message normalization and Kiro payload building pipeline."""
 
 import json
+from itertools import chain, groupby
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
@@ -27,7 +29,7 @@ from loguru import logger
 from kiro.config import FAKE_REASONING_ENABLED, FAKE_REASONING_MAX_TOKENS
 from kiro.converters_core import (
     UnifiedMessage, UnifiedTool, KiroPayloadResult,
-    extract_text_content, extract_images_from_content,
+    extract_message_text, extract_images_from_content,
     get_thinking_system_prompt_addition, get_truncation_recovery_system_addition,
     inject_thinking_tags,
 )
@@ -39,6 +41,141 @@ from kiro.converters_tools import (
 )
 
 
+# Synthetic placeholder messages inserted to satisfy Kiro API role rules.
+# Shared by every request: messages are never modified in place by the
+# pipeline (changes always produce copies), so one instance of each suffices
+_SYNTHETIC_USER = UnifiedMessage(role="user", content="(empty)")
+_SYNTHETIC_ASSISTANT = UnifiedMessage(role="assistant", content="(empty)")
+
+# Roles supported by Kiro API in history; anything else is normalized to user
+_VALID_ROLES = frozenset({"user", "assistant"})
+
+
+def _tool_content_as_text(msg: UnifiedMessage) -> UnifiedMessage:
+    """
+    Returns a copy of msg with its tool_calls/tool_results rendered as text.
+
+    Images are preserved (e.g., screenshots from MCP tools).
+    """
+    # Start with existing text content
+    existing_content = extract_message_text(msg)
+    
+    # Convert tool_calls to text (for assistant messages)
+    tool_text = tool_calls_to_text(msg.tool_calls) if msg.tool_calls else ""
+    
+    # Convert tool_results to text (for user messages)
+    result_text = tool_results_to_text(msg.tool_results) if msg.tool_results else ""
+    
+    # Join the non-empty parts with double newline (a single part is returned as is)
+    content = "\n\n".join(filter(None, (existing_content, tool_text, result_text)))
+    
+    return UnifiedMessage(
+        role=msg.role,
+        content=content or "(empty)",
+        tool_calls=None,
+        tool_results=None,
+        images=msg.images
+    )
+
+
+def _orphaned_tool_results_as_text(msg: UnifiedMessage) -> UnifiedMessage:
+    """
+    Returns a copy of msg with its tool_results appended to the content as text.
+
+    Used when no assistant message with tool_calls precedes msg: the original
+    tool names and arguments are unknown, so no valid synthetic assistant
+    message can be created (Kiro API validates tool names).
+    """
+    # Lazy: the tool ID list is only built when DEBUG logging is enabled
+    logger.opt(lazy=True).debug(
+        "Converting {} orphaned tool_results to text "
+        "(no preceding assistant message with tool_calls). Tool IDs: {}",
+        lambda: len(msg.tool_results),
+        lambda: [tr.get("tool_use_id", "unknown") for tr in msg.tool_results],
+    )
+    
+    # Convert tool_results to text representation
+    tool_results_text = tool_results_to_text(msg.tool_results)
+    
+    # Append to existing content
+    original_content = extract_message_text(msg) or ""
+    if original_content and tool_results_text:
+        new_content = f"{original_content}\n\n{tool_results_text}"
+    elif tool_results_text:
+        new_content = tool_results_text
+    else:
+        new_content = original_content
+    
+    return UnifiedMessage(
+        role=msg.role,
+        content=new_content,
+        tool_calls=msg.tool_calls,
+        tool_results=None,  # Remove orphaned tool_results (now in text)
+        images=msg.images
+    )
+
+
+def _merge_run(run: List[UnifiedMessage]) -> UnifiedMessage:
+    """
+    Merges a run of adjacent same-role messages into one message.
+    
+    The result equals merging the messages pairwise from left to right, but
+    texts are joined once and tool lists concatenated once, instead of
+    rebuilding a growing string and a new message for every merge step.
+    
+    - Only string/None contents: texts joined with newlines
+    - Any list content: a list of content blocks, where the leading non-list
+      messages become one text block and later ones a text block each
+    - tool_calls (assistant) / tool_results (user) of all messages concatenated
+    - Everything else (e.g. images) is taken from the first message
+    """
+    first = run[0]
+    if len(run) == 1:
+        return first
+    
+    # Content: messages before the first list content are joined as text
+    split = next((i for i, m in enumerate(run) if isinstance(m.content, list)), len(run))
+    head_text = "\n".join([extract_message_text(m) for m in run[:split]])
+    if split == len(run):
+        new_content = head_text
+    else:
+        new_content = [{"type": "text", "text": head_text}] if split else []
+        for m in run[split:]:
+            if isinstance(m.content, list):
+                new_content.extend(m.content)
+            else:
+                new_content.append({"type": "text", "text": extract_message_text(m)})
+    
+    # Merged tool_calls for assistant messages, tool_results for user messages
+    new_tool_calls = first.tool_calls
+    new_tool_results = first.tool_results
+    rest = run[1:]
+    if first.role == "assistant" and any(m.tool_calls for m in rest):
+        new_tool_calls = list(chain(first.tool_calls or (), *(m.tool_calls for m in rest if m.tool_calls)))
+    elif first.role == "user" and any(m.tool_results for m in rest):
+        new_tool_results = list(chain(first.tool_results or (), *(m.tool_results for m in rest if m.tool_results)))
+    
+    # Direct construction: dataclasses.replace() would enumerate the fields
+    return UnifiedMessage(
+        role=first.role,
+        content=new_content,
+        tool_calls=new_tool_calls,
+        tool_results=new_tool_results,
+        images=first.images,
+    )
+
+
+def _with_user_role(msg: UnifiedMessage) -> UnifiedMessage:
+    """Returns a copy of msg with its (unknown) role replaced by 'user'."""
+    return UnifiedMessage(
+        role="user",
+        content=msg.content,
+        tool_calls=msg.tool_calls,
+        tool_results=msg.tool_results,
+        images=msg.images
+    )
+
+
 def strip_all_tool_content(messages: List[UnifiedMessage]) -> Tuple[List[UnifiedMessage], bool]:
     """
     Strips ALL tool-related content from messages, converting it to text representation.
@@ -61,63 +198,25 @@ def strip_all_tool_content(messages: List[UnifiedMessage]) -> Tuple[List[Unified
     if not messages:
         return [], False
     
-    result = []
-    total_tool_calls_stripped = 0
-    total_tool_results_stripped = 0
+    # Fast path: chat-only requests have no tool content to convert
+    if not any(msg.tool_calls or msg.tool_results for msg in messages):
+        return messages, False
     
-    for msg in messages:
-        # Check if this message has any tool content
-        has_tool_calls = bool(msg.tool_calls)
-        has_tool_results = bool(msg.tool_results)
-        
-        if has_tool_calls or has_tool_results:
-            if has_tool_calls:
-                total_tool_calls_stripped += len(msg.tool_calls)
-            if has_tool_results:
-                total_tool_results_stripped += len(msg.tool_results)
-            
-            # Start with existing text content
-            existing_content = extract_text_content(msg.content)
-            content_parts = []
-            
-            if existing_content:
-                content_parts.append(existing_content)
-            
-            # Convert tool_calls to text (for assistant messages)
-            if has_tool_calls:
-                tool_text = tool_calls_to_text(msg.tool_calls)
-                if tool_text:
-                    content_parts.append(tool_text)
-            
-            # Convert tool_results to text (for user messages)
-            if has_tool_results:
-                result_text = tool_results_to_text(msg.tool_results)
-                if result_text:
-                    content_parts.append(result_text)
-            
-            # Join all parts with double newline
-            content = "\n\n".join(content_parts) if content_parts else "(empty)"
-            
-            # Create a copy of the message without tool content but with text representation
-            # IMPORTANT: Preserve images from the original message (e.g., screenshots from MCP tools)
-            cleaned_msg = UnifiedMessage(
-                role=msg.role,
-                content=content,
-                tool_calls=None,
-                tool_results=None,
-                images=msg.images
-            )
-            result.append(cleaned_msg)
-        else:
-            result.append(msg)
+    # Messages with any tool content are replaced by their text representation
+    result = [
+        _tool_content_as_text(msg) if msg.tool_calls or msg.tool_results else msg
+        for msg in messages
+    ]
+    total_tool_calls_stripped = sum(len(msg.tool_calls) for msg in messages if msg.tool_calls)
+    total_tool_results_stripped = sum(len(msg.tool_results) for msg in messages if msg.tool_results)
     
     had_tool_content = total_tool_calls_stripped > 0 or total_tool_results_stripped > 0
     
     # Log summary once (DEBUG level - this is normal for clients like Cline/Roo/Cursor)
     if had_tool_content:
         logger.debug(
-            f"Converted tool content to text (no tools defined): "
-            f"{total_tool_calls_stripped} tool_calls, {total_tool_results_stripped} tool_results"
+            "Converted tool content to text (no tools defined): {} tool_calls, {} tool_results",
+            total_tool_calls_stripped, total_tool_results_stripped,
         )
     
     return result, had_tool_content
@@ -147,54 +246,20 @@ def ensure_assistant_before_tool_results(messages: List[UnifiedMessage]) -> Tupl
     if not messages:
         return [], False
     
-    result = []
-    converted_any_tool_results = False
-    
-    for msg in messages:
-        # Check if this message has tool_results
-        if msg.tool_results:
-            # Check if the previous message is an assistant with tool_calls
-            has_preceding_assistant = (
-                result and
-                result[-1].role == "assistant" and
-                result[-1].tool_calls
-            )
-            
-            if not has_preceding_assistant:
-                # We cannot create a valid synthetic assistant message because we don't know
-                # the original tool name and arguments. Kiro API validates tool names.
-                # Convert tool_results to text to preserve context for the model.
-                logger.debug(
-                    f"Converting {len(msg.tool_results)} orphaned tool_results to text "
-                    f"(no preceding assistant message with tool_calls). "
-                    f"Tool IDs: {[tr.get('tool_use_id', 'unknown') for tr in msg.tool_results]}"
-                )
-                
-                # Convert tool_results to text representation
-                tool_results_text = tool_results_to_text(msg.tool_results)
-                
-                # Append to existing content
-                original_content = extract_text_content(msg.content) or ""
-                if original_content and tool_results_text:
-                    new_content = f"{original_content}\n\n{tool_results_text}"
-                elif tool_results_text:
-                    new_content = tool_results_text
-                else:
-                    new_content = original_content
-                
-                # Create a copy of the message with tool_results converted to text
-                cleaned_msg = UnifiedMessage(
-                    role=msg.role,
-                    content=new_content,
-                    tool_calls=msg.tool_calls,
-                    tool_results=None,  # Remove orphaned tool_results (now in text)
-                    images=msg.images
-                )
-                result.append(cleaned_msg)
-                converted_any_tool_results = True
-                continue
-        
-        result.append(msg)
+    # Fast path: nothing can be orphaned without tool_results
+    if not any(msg.tool_results for msg in messages):
+        return messages, False
+    
+    # Tool_results without a preceding assistant message with tool_calls are
+    # converted to text to preserve context for the model. The conversion
+    # keeps role and tool_calls, so the input predecessor can be checked
+    result = [
+        _orphaned_tool_results_as_text(msg)
+        if msg.tool_results and not (prev is not None and prev.role == "assistant" and prev.tool_calls)
+        else msg
+        for prev, msg in zip(chain((None,), messages), messages)
+    ]
+    converted_any_tool_results = any(new is not old for new, old in zip(result, messages))
     
     return result, converted_any_tool_results
 
@@ -215,79 +280,45 @@ def merge_adjacent_messages(messages: List[UnifiedMessage]) -> List[UnifiedMessa
     if not messages:
         return []
     
-    merged = []
-    # Statistics for summary logging
-    merge_counts = {"user": 0, "assistant": 0}
-    total_tool_calls_merged = 0
-    total_tool_results_merged = 0
-    
-    for msg in messages:
-        if not merged:
-            merged.append(msg)
-            continue
-        
-        last = merged[-1]
-        if msg.role == last.role:
-            # Compute merged content (immutable)
-            if isinstance(last.content, list) and isinstance(msg.content, list):
-                new_content = last.content + msg.content
-            elif isinstance(last.content, list):
-                new_content = last.content + [{"type": "text", "text": extract_text_content(msg.content)}]
-            elif isinstance(msg.content, list):
-                new_content = [{"type": "text", "text": extract_text_content(last.content)}] + msg.content
-            else:
-                last_text = extract_text_content(last.content)
-                current_text = extract_text_content(msg.content)
-                new_content = f"{last_text}\n{current_text}"
-
-            # Compute merged tool_calls for assistant messages (immutable)
-            new_tool_calls = last.tool_calls
-            if msg.role == "assistant" and msg.tool_calls:
-                base = list(last.tool_calls) if last.tool_calls else []
-                new_tool_calls = base + list(msg.tool_calls)
-                total_tool_calls_merged += len(msg.tool_calls)
-
-            # Compute merged tool_results for user messages (immutable)
-            new_tool_results = last.tool_results
-            if msg.role == "user" and msg.tool_results:
-                base = list(last.tool_results) if last.tool_results else []
-                new_tool_results = base + list(msg.tool_results)
-                total_tool_results_merged += len(msg.tool_results)
-
-            # Replace last entry with a new immutable object
-            from dataclasses import replace as dc_replace
-            merged[-1] = dc_replace(
-                last,
-                content=new_content,
-                tool_calls=new_tool_calls,
-                tool_results=new_tool_results,
-            )
-
-            # Count merges by role
-            if msg.role in merge_counts:
-                merge_counts[msg.role] += 1
-        else:
-            merged.append(msg)
+    runs = [list(group) for _, group in groupby(messages, key=attrgetter("role"))]
+    # One new immutable object per run
+    merged = [_merge_run(run) for run in runs]
     
     # Log summary if any merges occurred
-    total_merges = sum(merge_counts.values())
-    if total_merges > 0:
-        parts = []
-        for role, count in merge_counts.items():
-            if count > 0:
-                parts.append(f"{count} {role}")
-        merge_summary = ", ".join(parts)
+    if len(runs) < len(messages):
+        # Statistics for summary logging
+        merge_counts = {"user": 0, "assistant": 0}
+        total_tool_calls_merged = 0
+        total_tool_results_merged = 0
+        for run in runs:
+            role = run[0].role
+            if len(run) > 1 and role in merge_counts:
+                # Count merges by role
+                merge_counts[role] += len(run) - 1
+            for msg in run[1:]:
+                if role == "assistant" and msg.tool_calls:
+                    total_tool_calls_merged += len(msg.tool_calls)
+                if role == "user" and msg.tool_results:
+                    total_tool_results_merged += len(msg.tool_results)
         
-        extras = []
-        if total_tool_calls_merged > 0:
-            extras.append(f"{total_tool_calls_merged} tool_calls")
-        if total_tool_results_merged > 0:
-            extras.append(f"{total_tool_results_merged} tool_results")
-        
-        if extras:
-            logger.debug(f"Merged {total_merges} adjacent messages ({merge_summary}), including {', '.join(extras)}")
-        else:
-            logger.debug(f"Merged {total_merges} adjacent messages ({merge_summary})")
+        total_merges = sum(merge_counts.values())
+        if total_merges > 0:
+            parts = []
+            for role, count in merge_counts.items():
+                if count > 0:
+                    parts.append(f"{count} {role}")
+            merge_summary = ", ".join(parts)
+            
+            extras = []
+            if total_tool_calls_merged > 0:
+                extras.append(f"{total_tool_calls_merged} tool_calls")
+            if total_tool_results_merged > 0:
+                extras.append(f"{total_tool_results_merged} tool_results")
+            
+            if extras:
+                logger.debug("Merged {} adjacent messages ({}), including {}", total_merges, merge_summary, ", ".join(extras))
+            else:
+                logger.debug("Merged {} adjacent messages ({})", total_merges, merge_summary)
     
     return merged
 
@@ -326,18 +357,14 @@ def ensure_first_message_is_user(messages: List[UnifiedMessage]) -> List[Unified
     
     if messages[0].role != "user":
         logger.debug(
-            f"First message is '{messages[0].role}', prepending synthetic user message "
-            f"(Kiro API requires conversations to start with user)"
+            "First message is '{}', prepending synthetic user message "
+            "(Kiro API requires conversations to start with user)",
+            messages[0].role,
         )
         
-        # Create minimal synthetic user message (matches LiteLLM behavior)
+        # Minimal synthetic user message (matches LiteLLM behavior)
         # Using "(empty)" as minimal valid content to avoid disrupting conversation context
-        synthetic_user = UnifiedMessage(
-            role="user",
-            content="(empty)"
-        )
-        
-        return [synthetic_user] + messages
+        return [_SYNTHETIC_USER] + messages
     
     return messages
 
@@ -373,26 +400,18 @@ def normalize_message_roles(messages: List[UnifiedMessage]) -> List[UnifiedMessa
     if not messages:
         return messages
     
-    normalized = []
-    converted_count = 0
+    # Fast path: only user/assistant roles (the common case)
+    if all(msg.role in _VALID_ROLES for msg in messages):
+        return messages
     
-    for msg in messages:
-        if msg.role not in ("user", "assistant"):
-            logger.debug(f"Normalizing role '{msg.role}' to 'user'")
-            normalized_msg = UnifiedMessage(
-                role="user",
-                content=msg.content,
-                tool_calls=msg.tool_calls,
-                tool_results=msg.tool_results,
-                images=msg.images
-            )
-            normalized.append(normalized_msg)
-            converted_count += 1
-        else:
-            normalized.append(msg)
+    normalized = [
+        msg if msg.role in _VALID_ROLES else _with_user_role(msg)
+        for msg in messages
+    ]
+    converted_count = sum(1 for msg in messages if msg.role not in _VALID_ROLES)
     
     if converted_count > 0:
-        logger.debug(f"Normalized {converted_count} message(s) with unknown roles to 'user'")
+        logger.debug("Normalized {} message(s) with unknown roles to 'user'", converted_count)
     
     return normalized
 
@@ -439,17 +458,87 @@ def ensure_alternating_roles(messages: List[UnifiedMessage]) -> List[UnifiedMess
         
         # If both current and previous are user → insert synthetic assistant
         if msg.role == "user" and prev_role == "user":
-            synthetic_assistant = UnifiedMessage(
-                role="assistant",
-                content="(empty)"  # Consistent with build_kiro_history() placeholder
-            )
-            result.append(synthetic_assistant)
+            # "(empty)" is consistent with build_kiro_history() placeholder
+            result.append(_SYNTHETIC_ASSISTANT)
             synthetic_count += 1
         
         result.append(msg)
     
     if synthetic_count > 0:
-        logger.debug(f"Inserted {synthetic_count} synthetic assistant message(s) to ensure alternation")
+        logger.debug("Inserted {} synthetic assistant message(s) to ensure alternation", synthetic_count)
+    
+    return result
+
+
+def _normalize_messages(messages: List[UnifiedMessage], tools_defined: bool) -> List[UnifiedMessage]:
+    """
+    Runs the message normalization steps of build_kiro_payload in one pass.
+    
+    Produces the same list as strip_all_tool_content (no tools defined) or
+    ensure_assistant_before_tool_results (tools defined), followed by
+    merge_adjacent_messages, ensure_first_message_is_user,
+    normalize_message_roles and ensure_alternating_roles - but walks the
+    messages once and builds only the final list.
+    
+    Each same-role run is collected and merged when it ends; the merged message
+    then goes through the user-first, role normalization and alternation checks.
+    Like the sequential steps, runs are detected on the original roles and
+    normalization happens after merging.
+    
+    Args:
+        messages: List of messages in unified format
+        tools_defined: Whether the request defines any tools
+    
+    Returns:
+        List of messages ready for build_kiro_history
+    """
+    result: List[UnifiedMessage] = []
+    prev: Optional[UnifiedMessage] = None  # Previous message after tool handling
+    run: List[UnifiedMessage] = []  # Current run of same-role messages
+    converted_count = merge_count = normalized_count = synthetic_count = 0
+    
+    def emit(msg: UnifiedMessage) -> None:
+        nonlocal normalized_count, synthetic_count
+        # Kiro API requires the conversation to start with user (issue #60)
+        if not result and msg.role != "user":
+            result.append(_SYNTHETIC_USER)
+        # Unknown roles become user (issue #64)
+        if msg.role not in _VALID_ROLES:
+            msg = _with_user_role(msg)
+            normalized_count += 1
+        # Consecutive user messages get a synthetic assistant between them
+        if msg.role == "user" and result and result[-1].role == "user":
+            result.append(_SYNTHETIC_ASSISTANT)
+            synthetic_count += 1
+        result.append(msg)
+    
+    for msg in messages:
+        if not tools_defined:
+            # Kiro API rejects toolResults when no tools are defined
+            if msg.tool_calls or msg.tool_results:
+                msg = _tool_content_as_text(msg)
+                converted_count += 1
+        elif msg.tool_results and not (prev is not None and prev.role == "assistant" and prev.tool_calls):
+            msg = _orphaned_tool_results_as_text(msg)
+            converted_count += 1
+        prev = msg
+        
+        if run and run[0].role != msg.role:
+            merge_count += len(run) - 1
+            emit(_merge_run(run))
+            run = []
+        run.append(msg)
+    
+    if run:
+        merge_count += len(run) - 1
+        emit(_merge_run(run))
+    
+    if converted_count or merge_count or normalized_count or synthetic_count:
+        logger.debug(
+            "Normalized messages: {} with tool content converted to text, {} merged, "
+            "{} roles normalized, {} synthetic assistant(s) inserted",
+            converted_count, merge_count, normalized_count, synthetic_count,
+        )
     
     return result
 
@@ -458,7 +547,11 @@ def ensure_alternating_roles(messages: List[UnifiedMessage]) -> List[UnifiedMess
 # Kiro History Building
 # ==================================================================================================
 
-def build_kiro_history(messages: List[UnifiedMessage], model_id: str) -> List[Dict[str, Any]]:
+def build_kiro_history(
+    messages: List[UnifiedMessage],
+    model_id: str,
+    first_user_prefix: str = "",
+) -> List[Dict[str, Any]]:
     """
     Builds history array for Kiro API from unified messages.
     
@@ -471,15 +564,25 @@ def build_kiro_history(messages: List[UnifiedMessage], model_id: str) -> List[Di
     Args:
         messages: List of messages in unified format (with normalized roles)
         model_id: Internal Kiro model ID
+        first_user_prefix: Text (e.g. system prompt) to prepend to the content
+            of the first message if it is a user message; that message is then
+            sent as text only, without images or tool results from its content blocks
     
     Returns:
         List of dictionaries for history field in Kiro API
     """
     history = []
+    prefix = first_user_prefix
     
     for msg in messages:
         if msg.role == "user":
-            content = extract_text_content(msg.content)
+            content = extract_message_text(msg)
+            # Content blocks are scanned for images and tool results below; a
+            # prefixed message is sent as flattened text, so its blocks are not
+            content_blocks = msg.content if isinstance(msg.content, list) else None
+            if prefix:
+                content = f"{prefix}\n\n{content}"
+                content_blocks = None
             
             # Fallback for empty content - Kiro API requires non-empty content
             if not content:
@@ -494,34 +597,32 @@ def build_kiro_history(messages: List[UnifiedMessage], model_id: str) -> List[Di
             # Process images - extract from message or content
             # IMPORTANT: images go directly into userInputMessage, NOT into userInputMessageContext
             # This matches the native Kiro IDE format
-            images = msg.images or extract_images_from_content(msg.content)
+            images = msg.images
+            if not images and content_blocks is not None:
+                images = extract_images_from_content(content_blocks)
             if images:
                 kiro_images = convert_images_to_kiro_format(images)
                 if kiro_images:
                     user_input["images"] = kiro_images
             
-            # Build userInputMessageContext for tools and toolResults only
-            user_input_context: Dict[str, Any] = {}
-            
             # Process tool_results - convert to Kiro format if present
             if msg.tool_results:
                 kiro_tool_results = convert_tool_results_to_kiro_format(msg.tool_results)
-                if kiro_tool_results:
-                    user_input_context["toolResults"] = kiro_tool_results
-            else:
+            elif content_blocks is not None:
                 # Try to extract from content (already in Kiro format)
-                tool_results = extract_tool_results_from_content(msg.content)
-                if tool_results:
-                    user_input_context["toolResults"] = tool_results
+                kiro_tool_results = extract_tool_results_from_content(content_blocks)
+            else:
+                kiro_tool_results = None
             
-            # Add context if not empty (contains toolResults only, not images)
-            if user_input_context:
-                user_input["userInputMessageContext"] = user_input_context
+            # userInputMessageContext holds toolResults only (not images),
+            # so it is only built when there are tool results
+            if kiro_tool_results:
+                user_input["userInputMessageContext"] = {"toolResults": kiro_tool_results}
             
             history.append({"userInputMessage": user_input})
             
         elif msg.role == "assistant":
-            content = extract_text_content(msg.content)
+            content = extract_message_text(msg)
             
             # Fallback for empty content - Kiro API requires non-empty content
             if not content:
@@ -535,6 +636,9 @@ def build_kiro_history(messages: List[UnifiedMessage], model_id: str) -> List[Di
                 assistant_response["toolUses"] = tool_uses
             
             history.append({"assistantResponseMessage": assistant_response})
+        
+        # The prefix only ever applies to the first message
+        prefix = ""
     
     return history
 
@@ -579,46 +683,29 @@ def build_kiro_payload(
     # Validate tool names against Kiro API 64-character limit
     validate_tool_names(processed_tools)
     
-    # Add tool documentation to system prompt if present
-    full_system_prompt = system_prompt
-    if tool_documentation:
-        full_system_prompt = full_system_prompt + tool_documentation if full_system_prompt else tool_documentation.strip()
-    
-    # Add thinking mode legitimization to system prompt if enabled
-    thinking_system_addition = get_thinking_system_prompt_addition()
-    if thinking_system_addition:
-        full_system_prompt = full_system_prompt + thinking_system_addition if full_system_prompt else thinking_system_addition.strip()
-    
-    # Add truncation recovery legitimization to system prompt if enabled
-    truncation_system_addition = get_truncation_recovery_system_addition()
-    if truncation_system_addition:
-        full_system_prompt = full_system_prompt + truncation_system_addition if full_system_prompt else truncation_system_addition.strip()
-    
-    # If no tools are defined, strip ALL tool-related content from messages
-    # Kiro API rejects requests with toolResults but no tools
-    if not tools:
-        messages_without_tools, had_tool_content = strip_all_tool_content(messages)
-        messages_with_assistants = messages_without_tools
-        converted_tool_results = had_tool_content
+    # Add tool documentation, thinking mode legitimization and truncation
+    # recovery legitimization (each if present/enabled) to the system prompt.
+    # Parts are joined once, so a large prompt is not copied per addition
+    additions = [
+        addition for addition in (
+            tool_documentation,
+            get_thinking_system_prompt_addition(),
+            get_truncation_recovery_system_addition(),
+        )
+        if addition
+    ]
+    if not additions:
+        full_system_prompt = system_prompt
+    elif system_prompt:
+        full_system_prompt = "".join([system_prompt, *additions])
     else:
-        # Ensure assistant messages exist before tool_results (Kiro API requirement)
-        # Also returns flag if any tool_results were converted (to skip thinking tag injection)
-        messages_with_assistants, converted_tool_results = ensure_assistant_before_tool_results(messages)
-    
-    # Merge adjacent messages with the same role
-    merged_messages = merge_adjacent_messages(messages_with_assistants)
+        # No system prompt: the first addition starts the prompt, without its separator
+        additions[0] = additions[0].strip()
+        full_system_prompt = "".join(additions)
     
-    # Ensure first message is from user (Kiro API requirement, fixes issue #60)
-    merged_messages = ensure_first_message_is_user(merged_messages)
-    
-    # Normalize unknown roles to 'user' (fixes issue #64)
-    # This must happen BEFORE ensure_alternating_roles() so that consecutive
-    # messages with unknown roles (e.g., 'developer') are properly detected
-    merged_messages = normalize_message_roles(merged_messages)
-    
-    # Ensure alternating user/assistant roles (fixes issue #64)
-    # Insert synthetic assistant messages between consecutive user messages
-    merged_messages = ensure_alternating_roles(merged_messages)
+    # Tool content handling, merging of adjacent same-role messages,
+    # user-first order, role normalization and role alternation - in one pass
+    merged_messages = _normalize_messages(messages, tools_defined=bool(tools))
     
     if not merged_messages:
         raise ValueError("No messages to send")
@@ -626,22 +713,13 @@ def build_kiro_payload(
     # Build history (all messages except the last one)
     history_messages = merged_messages[:-1] if len(merged_messages) > 1 else []
     
-    # If there's a system prompt, add it to the first user message in history
-    if full_system_prompt and history_messages:
-        first_msg = history_messages[0]
-        if first_msg.role == "user":
-            from dataclasses import replace as dc_replace
-            original_content = extract_text_content(first_msg.content)
-            history_messages = [
-                dc_replace(first_msg, content=f"{full_system_prompt}\n\n{original_content}"),
-                *history_messages[1:],
-            ]
-    
-    history = build_kiro_history(history_messages, model_id)
+    # If there's a system prompt, it is added to the first user message in history
+    # (prepended while building its history entry, without copying the messages)
+    history = build_kiro_history(history_messages, model_id, first_user_prefix=full_system_prompt or "")
     
     # Current message (the last one)
     current_message = merged_messages[-1]
-    current_content = extract_text_content(current_message.content)
+    current_content = extract_message_text(current_message)
     
     # If system prompt exists but history is empty - add to current message
     if full_system_prompt and not history:
@@ -664,32 +742,37 @@ def build_kiro_payload(
     # Process images in current message - extract from message or content
     # IMPORTANT: images go directly into userInputMessage, NOT into userInputMessageContext
     # This matches the native Kiro IDE format
-    images = current_message.images or extract_images_from_content(current_message.content)
+    images = current_message.images
+    if not images and isinstance(current_message.content, list):
+        images = extract_images_from_content(current_message.content)
     kiro_images = None
     if images:
         kiro_images = convert_images_to_kiro_format(images)
         if kiro_images:
-            logger.debug(f"Added {len(kiro_images)} image(s) to current message")
+            logger.debug("Added {} image(s) to current message", len(kiro_images))
     
-    # Build user_input_context for tools and toolResults only (NOT images)
-    user_input_context: Dict[str, Any] = {}
-    
-    # Add tools if present
-    kiro_tools = convert_tools_to_kiro_format(processed_tools)
-    if kiro_tools:
-        user_input_context["tools"] = kiro_tools
+    # Tools if present
+    kiro_tools = convert_tools_to_kiro_format(processed_tools) if processed_tools else None
     
     # Process tool_results in current message - convert to Kiro format if present
     if current_message.tool_results:
         # Convert unified format to Kiro format
         kiro_tool_results = convert_tool_results_to_kiro_format(current_message.tool_results)
+    elif isinstance(current_message.content, list):
+        # Try to extract from content (already in Kiro format)
+        kiro_tool_results = extract_tool_results_from_content(current_message.content)
+    else:
+        kiro_tool_results = None
+    
+    # Build user_input_context for tools and toolResults only (NOT images),
+    # only when there is something to put in it (plain chat turns have neither)
+    user_input_context: Optional[Dict[str, Any]] = None
+    if kiro_tools or kiro_tool_results:
+        user_input_context = {}
+        if kiro_tools:
+            user_input_context["tools"] = kiro_tools
         if kiro_tool_results:
             user_input_context["toolResults"] = kiro_tool_results
-    else:
-        # Try to extract from content (already in Kiro format)
-        tool_results = extract_tool_results_from_content(current_message.content)
-        if tool_results:
-            user_input_context["toolResults"] = tool_results
     
     # Inject thinking tags if enabled (only for the current/last user message)
     if inject_thinking and current_message.role == "user":
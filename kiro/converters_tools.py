@@ -19,19 +19,28 @@
 
 """Tool processing utilities for Kiro API conversion."""
 
-import json
+import functools
+import hashlib
 from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
 import kiro.converters_core as _converters_core_module
 from kiro.converters_core import UnifiedMessage, UnifiedTool, extract_text_content
+from kiro.utils import json_dumps_bytes, json_loads
 
 
 # ==================================================================================================
 # JSON Schema Sanitization
 # ==================================================================================================
 
+# Sanitized schemas keyed by a digest of the original schema's JSON.
+# Clients send the same tool definitions with every request, so after the
+# first request each schema costs one serialization instead of a rebuild
+_SANITIZED_SCHEMA_CACHE: Dict[bytes, Dict[str, Any]] = {}
+_SANITIZED_SCHEMA_CACHE_MAX_SIZE = 512
+
+
 def sanitize_json_schema(schema: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Sanitizes JSON Schema from fields that Kiro API doesn't accept.
@@ -41,6 +50,8 @@ def sanitize_json_schema(schema: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     - additionalProperties is present in schema
     
     This function recursively processes the schema and removes problematic fields.
+    Results are cached by schema content, so the returned schema may be shared
+    between calls and must not be modified.
     
     Args:
         schema: JSON Schema to sanitize
@@ -51,29 +62,55 @@ def sanitize_json_schema(schema: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     if not schema:
         return {}
     
+    try:
+        key = hashlib.blake2b(json_dumps_bytes(schema), digest_size=16).digest()
+    except TypeError:
+        # Not JSON-serializable (should not happen for request data) - no caching
+        return _sanitize_json_schema(schema)
+    
+    cached = _SANITIZED_SCHEMA_CACHE.get(key)
+    if cached is None:
+        cached = _sanitize_json_schema(schema)
+        if len(_SANITIZED_SCHEMA_CACHE) >= _SANITIZED_SCHEMA_CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _SANITIZED_SCHEMA_CACHE[next(iter(_SANITIZED_SCHEMA_CACHE))]
+        _SANITIZED_SCHEMA_CACHE[key] = cached
+    return cached
+
+
+def _sanitize_json_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Builds the sanitized copy of a schema (uncached, see sanitize_json_schema).
+
+    Single pass per level: each value is type-checked once with exact type
+    tests (request schemas are plain JSON dicts/lists), and only the keys
+    that are kept are copied.
+    """
     result = {}
     
     for key, value in schema.items():
-        # Skip empty required arrays
-        if key == "required" and isinstance(value, list) and len(value) == 0:
-            continue
-        
         # Skip additionalProperties - Kiro API doesn't support it
         if key == "additionalProperties":
             continue
         
-        # Recursively process nested objects
-        if key == "properties" and isinstance(value, dict):
-            result[key] = {
-                prop_name: sanitize_json_schema(prop_value) if isinstance(prop_value, dict) else prop_value
-                for prop_name, prop_value in value.items()
-            }
-        elif isinstance(value, dict):
-            result[key] = sanitize_json_schema(value)
-        elif isinstance(value, list):
+        value_type = type(value)
+        if value_type is dict:
+            if key == "properties":
+                # Property names are not schema keywords - only their schemas are processed
+                result[key] = {
+                    prop_name: _sanitize_json_schema(prop_value) if type(prop_value) is dict else prop_value
+                    for prop_name, prop_value in value.items()
+                }
+            else:
+                # Recursively process nested objects
+                result[key] = _sanitize_json_schema(value)
+        elif value_type is list:
+            # Skip empty required arrays
+            if not value and key == "required":
+                continue
             # Process lists (e.g., anyOf, oneOf)
             result[key] = [
-                sanitize_json_schema(item) if isinstance(item, dict) else item
+                _sanitize_json_schema(item) if type(item) is dict else item
                 for item in value
             ]
         else:
@@ -86,6 +123,13 @@ def sanitize_json_schema(schema: Optional[Dict[str, Any]]) -> Dict[str, Any]:
 # Tool Processing
 # ==================================================================================================
 
+_TOOL_DOCUMENTATION_HEADER = (
+    "\n\n---\n"
+    "# Tool Documentation\n"
+    "The following tools have detailed documentation that couldn't fit in the tool definition.\n\n"
+)
+
+
 def process_tools_with_long_descriptions(
     tools: Optional[List[UnifiedTool]]
 ) -> Tuple[Optional[List[UnifiedTool]], str]:
@@ -108,27 +152,35 @@ def process_tools_with_long_descriptions(
         return None, ""
     
     # If limit is disabled (0), return tools unchanged
-    if _converters_core_module.TOOL_DESCRIPTION_MAX_LENGTH <= 0:
+    max_length = _converters_core_module.TOOL_DESCRIPTION_MAX_LENGTH
+    if max_length <= 0:
+        return tools, ""
+    
+    # Fast path: all descriptions fit (the usual case) - return tools unchanged
+    if all(len(tool.description or "") <= max_length for tool in tools):
         return tools, ""
     
-    tool_documentation_parts = []
+    # Documentation fragments for the system prompt, joined once at the end
+    tool_documentation_parts: List[str] = []
     processed_tools = []
     
     for tool in tools:
         description = tool.description or ""
         
-        if len(description) <= _converters_core_module.TOOL_DESCRIPTION_MAX_LENGTH:
+        if len(description) <= max_length:
             # Description is short - leave as is
             processed_tools.append(tool)
         else:
             # Description is too long - move to system prompt
             logger.debug(
-                f"Tool '{tool.name}' has long description ({len(description)} chars > {_converters_core_module.TOOL_DESCRIPTION_MAX_LENGTH}), "
-                f"moving to system prompt"
+                "Tool '{}' has long description ({} chars > {}), moving to system prompt",
+                tool.name, len(description), max_length,
             )
             
-            # Create documentation for system prompt
-            tool_documentation_parts.append(f"## Tool: {tool.name}\n\n{description}")
+            # Create documentation for system prompt (sections separated by ---)
+            if tool_documentation_parts:
+                tool_documentation_parts.append("\n\n---\n\n")
+            tool_documentation_parts += ("## Tool: ", tool.name, "\n\n", description)
             
             # Create copy of tool with reference description
             reference_description = f"[Full documentation in system prompt under '## Tool: {tool.name}']"
@@ -140,15 +192,11 @@ def process_tools_with_long_descriptions(
             )
             processed_tools.append(processed_tool)
     
-    # Form final documentation
+    # Form final documentation: the header and all fragments in a single join,
+    # so long descriptions are copied once rather than once per concatenation
     tool_documentation = ""
     if tool_documentation_parts:
-        tool_documentation = (
-            "\n\n---\n"
-            "# Tool Documentation\n"
-            "The following tools have detailed documentation that couldn't fit in the tool definition.\n\n"
-            + "\n\n---\n\n".join(tool_documentation_parts)
-        )
+        tool_documentation = "".join([_TOOL_DOCUMENTATION_HEADER, *tool_documentation_parts])
     
     return processed_tools if processed_tools else None, tool_documentation
 
@@ -217,7 +265,7 @@ def convert_tools_to_kiro_format(tools: Optional[List[UnifiedTool]]) -> List[Dic
         description = tool.description
         if not description or not description.strip():
             description = f"Tool: {tool.name}"
-            logger.debug(f"Tool '{tool.name}' has empty description, using placeholder")
+            logger.debug("Tool '{}' has empty description, using placeholder", tool.name)
         
         kiro_tools.append({
             "toolSpecification": {
@@ -272,20 +320,20 @@ def convert_images_to_kiro_format(images: Optional[List[Dict[str, Any]]]) -> Lis
         # Strip data URL prefix if present (some clients send "data:image/jpeg;base64,..." in data field)
         # Kiro API expects pure base64 without the prefix
         if data.startswith("data:"):
-            try:
-                header, actual_data = data.split(",", 1)
-                # Extract media type from header if present
-                media_part = header.split(";")[0]  # "data:image/jpeg"
-                extracted_media_type = media_part.replace("data:", "")
+            # partition() splits once without building intermediate lists
+            header, sep, actual_data = data.partition(",")
+            if sep:
+                # Extract media type from header if present: "data:image/jpeg;base64"
+                extracted_media_type = header.partition(";")[0][5:]
                 if extracted_media_type:
                     media_type = extracted_media_type
                 data = actual_data
-                logger.debug(f"Stripped data URL prefix, extracted media_type: {media_type}")
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse data URL prefix: {e}")
+                logger.debug("Stripped data URL prefix, extracted media_type: {}", media_type)
+            else:
+                logger.warning("Failed to parse data URL prefix: no ',' separator")
         
         # Extract format from media_type: "image/jpeg" -> "jpeg"
-        format_str = media_type.split("/")[-1] if "/" in media_type else media_type
+        format_str = media_type.rpartition("/")[2]
         
         kiro_images.append({
             "format": format_str,
@@ -295,7 +343,7 @@ def convert_images_to_kiro_format(images: Optional[List[Dict[str, Any]]]) -> Lis
         })
     
     if kiro_images:
-        logger.debug(f"Converted {len(kiro_images)} image(s) to Kiro format")
+        logger.debug("Converted {} image(s) to Kiro format", len(kiro_images))
     
     return kiro_images
 
@@ -351,18 +399,44 @@ def extract_tool_results_from_content(content: Any) -> List[Dict[str, Any]]:
     Returns:
         List of tool results in Kiro format
     """
-    tool_results = []
-    
-    if isinstance(content, list):
-        for item in content:
-            if isinstance(item, dict) and item.get("type") == "tool_result":
-                tool_results.append({
-                    "content": [{"text": extract_text_content(item.get("content", "")) or "(empty result)"}],
-                    "status": "success",
-                    "toolUseId": item.get("tool_use_id", "")
-                })
+    if type(content) is not list:
+        return []
     
-    return tool_results
+    # Exact type checks: content blocks are plain JSON dicts
+    return [
+        {
+            "content": [{"text": extract_text_content(item.get("content", "")) or "(empty result)"}],
+            "status": "success",
+            "toolUseId": item.get("tool_use_id", "")
+        }
+        for item in content
+        if type(item) is dict and item.get("type") == "tool_result"
+    ]
+
+
+# Arguments longer than this are parsed without caching, which bounds the
+# memory held by the parse cache (at most maxsize * limit characters)
+_CACHED_ARGUMENTS_MAX_LENGTH = 8192
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached_arguments(arguments: str) -> Any:
+    """Parses a tool call arguments string (memoized, see _parse_tool_arguments)."""
+    return json_loads(arguments)
+
+
+def _parse_tool_arguments(arguments: str) -> Any:
+    """
+    Parses OpenAI tool call arguments (a JSON string).
+
+    Agent clients resend the whole conversation with every request, so the
+    same tool calls are parsed again on each turn. Short argument strings
+    are memoized; the parsed value may be shared between calls and must not
+    be modified.
+    """
+    if len(arguments) > _CACHED_ARGUMENTS_MAX_LENGTH:
+        return json_loads(arguments)
+    return _parse_cached_arguments(arguments)
 
 
 def extract_tool_uses_from_message(
@@ -393,7 +467,7 @@ def extract_tool_uses_from_message(
                 arguments = func.get("arguments", "{}")
                 # Handle both string (OpenAI) and dict (Anthropic unified) formats
                 if isinstance(arguments, str):
-                    input_data = json.loads(arguments) if arguments else {}
+                    input_data = _parse_tool_arguments(arguments) if arguments else {}
                 else:
                     input_data = arguments if arguments else {}
                 tool_uses.append({
@@ -403,14 +477,16 @@ def extract_tool_uses_from_message(
                 })
     
     # From content blocks (Anthropic format)
-    if isinstance(content, list):
-        for item in content:
-            if isinstance(item, dict) and item.get("type") == "tool_use":
-                tool_uses.append({
-                    "name": item.get("name", ""),
-                    "input": item.get("input", {}),
-                    "toolUseId": item.get("id", "")
-                })
+    if type(content) is list:
+        tool_uses.extend(
+            {
+                "name": item.get("name", ""),
+                "input": item.get("input", {}),
+                "toolUseId": item.get("id", "")
+            }
+            for item in content
+            if type(item) is dict and item.get("type") == "tool_use"
+        )
     
     return tool_uses
 
@@ -419,6 +495,22 @@ def extract_tool_uses_from_message(
 # Tool Content to Text Conversion (for stripping when no tools defined)
 # ==================================================================================================
 
+def _arguments_to_text(arguments: Any) -> str:
+    """
+    Renders tool call arguments as text.
+
+    OpenAI arguments already are a JSON string; Anthropic (unified) arguments
+    are a dict and are serialized as compact JSON with the shared encoder
+    (orjson when installed) rather than shown as a Python repr.
+    """
+    if isinstance(arguments, str):
+        return arguments
+    try:
+        return json_dumps_bytes(arguments).decode("utf-8")
+    except TypeError:
+        return str(arguments)
+
+
 def tool_calls_to_text(tool_calls: List[Dict[str, Any]]) -> str:
     """
     Converts tool_calls to human-readable text representation.
@@ -444,7 +536,7 @@ def tool_calls_to_text(tool_calls: List[Dict[str, Any]]) -> str:
     for tc in tool_calls:
         func = tc.get("function", {})
         name = func.get("name", "unknown")
-        arguments = func.get("arguments", "{}")
+        arguments = _arguments_to_text(func.get("arguments", "{}"))
         tool_id = tc.get("id", "")
         
         # Format: [Tool: name] (id)\narguments
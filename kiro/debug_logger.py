@@ -40,6 +40,7 @@ from typing import Optional
 from loguru import logger
 
 from kiro.config import DEBUG_MODE, DEBUG_DIR
+from kiro.utils import json_dumps_bytes
 
 
 class DebugLogger:
@@ -185,6 +186,18 @@ class DebugLogger:
             # "errors" mode - buffer
             self._kiro_request_body_buffer = body
 
+    def log_kiro_request_payload(self, payload: dict):
+        """
+        Saves the Kiro request payload.
+        
+        The payload is only serialized when debug logging is enabled,
+        so requests pay nothing for it in "off" mode.
+        """
+        if not self._is_enabled():
+            return
+
+        self.log_kiro_request_body(json_dumps_bytes(payload))
+
     def log_raw_chunk(self, chunk: bytes):
         """
         Appends raw response chunk (from provider).
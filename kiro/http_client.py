@@ -44,7 +44,7 @@ from kiro.config import (
     HTTP_POOL_KEEPALIVE_EXPIRY
 )
 from kiro.auth import KiroAuthManager
-from kiro.utils import get_kiro_headers
+from kiro.utils import get_kiro_headers, json_dumps_bytes
 from kiro.network_errors import classify_network_error, get_short_error_message, NetworkErrorInfo
 
 
@@ -219,6 +219,11 @@ class KiroHttpClient:
         max_retries = FIRST_TOKEN_MAX_RETRIES if stream else MAX_RETRIES
 
         client = await self._get_client(stream=stream)
+        
+        # Serialize the body once for all attempts (orjson when installed);
+        # Content-Type: application/json is set by get_kiro_headers()
+        body = json_dumps_bytes(json_data)
+        
         last_error = None
         last_error_info: Optional[NetworkErrorInfo] = None
 
@@ -242,12 +247,12 @@ class KiroHttpClient:
                 if stream:
                     # Prevent CLOSE_WAIT connection leak (issue #38)
                     headers["Connection"] = "close"
-                    req = client.build_request(method, url, json=json_data, headers=headers)
+                    req = client.build_request(method, url, content=body, headers=headers)
                     logger.debug("Sending request to Kiro API...")
                     response = await client.send(req, stream=True)
                 else:
                     logger.debug("Sending request to Kiro API...")
-                    response = await client.request(method, url, json=json_data, headers=headers)
+                    response = await client.request(method, url, content=body, headers=headers)
                 
                 # Check status
                 if response.status_code == 200:
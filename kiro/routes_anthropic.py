@@ -43,7 +43,8 @@ from kiro.models_anthropic import (
     AnthropicErrorResponse,
     AnthropicErrorDetail,
 )
-from kiro.auth import KiroAuthManager, MultiTokenAuthManager, AuthType
+from kiro.auth import KiroAuthManager
+from kiro.auth_multi import MultiTokenAuthManager, AuthType
 from kiro.cache import ModelInfoCache
 from kiro.converters_anthropic import anthropic_to_kiro
 from kiro.streaming_anthropic import (
@@ -297,11 +298,10 @@ async def messages(
             }
         )
     
-    # Log Kiro payload
+    # Log Kiro payload (serialized only when debug logging is enabled)
     try:
-        kiro_request_body = json.dumps(kiro_payload, ensure_ascii=False, indent=2).encode('utf-8')
         if debug_logger:
-            debug_logger.log_kiro_request_body(kiro_request_body)
+            debug_logger.log_kiro_request_payload(kiro_payload)
     except Exception as e:
         logger.warning(f"Failed to log Kiro request: {e}")
     
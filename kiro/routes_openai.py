@@ -45,7 +45,8 @@ from kiro.models_openai import (
     ModelList,
     ChatCompletionRequest,
 )
-from kiro.auth import KiroAuthManager, MultiTokenAuthManager, AuthType
+from kiro.auth import KiroAuthManager
+from kiro.auth_multi import MultiTokenAuthManager, AuthType
 from kiro.cache import ModelInfoCache
 from kiro.model_resolver import ModelResolver
 from kiro.converters_openai import build_kiro_payload
@@ -264,11 +265,10 @@ async def chat_completions(request: Request, request_data: ChatCompletionRequest
         logger.warning(f"Payload build error: {e}")
         raise HTTPException(status_code=400, detail="Invalid request parameters")
     
-    # Log Kiro payload
+    # Log Kiro payload (serialized only when debug logging is enabled)
     try:
-        kiro_request_body = json.dumps(kiro_payload, ensure_ascii=False, indent=2).encode('utf-8')
         if debug_logger:
-            debug_logger.log_kiro_request_body(kiro_request_body)
+            debug_logger.log_kiro_request_payload(kiro_payload)
     except Exception as e:
         logger.warning(f"Failed to log Kiro request: {e}")
     
@@ -24,6 +24,7 @@ Contains functions for fingerprint generation, header formatting,
 and other common utilities.
 """
 
+import functools
 import hashlib
 import json
 import uuid
@@ -31,15 +32,63 @@ from typing import TYPE_CHECKING, List, Dict, Any
 
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 if TYPE_CHECKING:
     from kiro.auth import KiroAuthManager
 
 
+def json_loads(data: "bytes | str | memoryview") -> Any:
+    """
+    Parses JSON from bytes, str or a memoryview.
+
+    Uses orjson when installed (decodes UTF-8 straight from the buffer),
+    otherwise falls back to the stdlib json module.
+
+    Args:
+        data: Raw JSON document (e.g. response.content or an mmap view)
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serializes an object to UTF-8 JSON bytes.
+
+    Uses orjson when installed, otherwise the stdlib json module.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with 2-space indentation (for files people read)
+
+    Returns:
+        Encoded JSON document, compact unless indent is set
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if indent else orjson.dumps(obj)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+@functools.cache
 def get_machine_fingerprint() -> str:
     """
     Generates a unique machine fingerprint based on hostname and username.
     
     Used for User-Agent formation to identify a specific gateway installation.
+    Computed once per process: hostname and username don't change at runtime,
+    and every auth manager instance needs the same value.
     
     Returns:
         SHA256 hash of the string "{hostname}-{username}-kiro-gateway"
@@ -66,6 +66,7 @@ from kiro.config import (
     REGION,
     KIRO_CREDS_FILE,
     KIRO_CLI_DB_FILE,
+    MULTI_TOKEN_CACHE_FILE,
     PROXY_API_KEY,
     LOG_LEVEL,
     SERVER_HOST,
@@ -81,7 +82,8 @@ from kiro.config import (
     RATE_LIMIT_RPM,
     _warn_timeout_configuration,
 )
-from kiro.auth import KiroAuthManager, MultiTokenAuthManager
+from kiro.auth import KiroAuthManager
+from kiro.auth_multi import MultiTokenAuthManager
 from kiro.cache import ModelInfoCache
 from kiro.model_resolver import ModelResolver
 from kiro.routes_openai import router as openai_router
@@ -350,6 +352,7 @@ async def lifespan(app: FastAPI):
             refresh_tokens=REFRESH_TOKENS,
             profile_arn=PROFILE_ARN,
             region=REGION,
+            token_cache_file=MULTI_TOKEN_CACHE_FILE or None,
         )
         # Start background refresh for all tokens
         app.state.auth_manager.start_background_refresh()
@@ -376,7 +379,7 @@ async def lifespan(app: FastAPI):
     try:
         token = await app.state.auth_manager.get_access_token()
         from kiro.utils import get_kiro_headers
-        from kiro.auth import AuthType
+        from kiro.auth_multi import AuthType
         headers = get_kiro_headers(app.state.auth_manager, token)
         
         # Build params - profileArn is only needed for Kiro Desktop auth
@@ -97,6 +97,18 @@ def block_all_network_calls(monkeypatch):
     monkeypatch.setattr(httpx.AsyncClient, "stream", original_stream)
 
 
+@pytest.fixture(autouse=True)
+def clear_credentials_file_cache():
+    """
+    Clears the process-level cache of parsed credential files between tests.
+    """
+    from kiro.auth_credentials import _CREDS_FILE_CACHE
+
+    _CREDS_FILE_CACHE.clear()
+    yield
+    _CREDS_FILE_CACHE.clear()
+
+
 # =============================================================================
 # Environment Fixtures
 # =============================================================================
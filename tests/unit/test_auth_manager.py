@@ -7,6 +7,8 @@ Tests token management logic for Kiro without real network requests.
 
 import asyncio
 import json
+import mmap
+import os
 import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, Mock, patch
@@ -80,6 +82,21 @@ class TestKiroAuthManagerInitialization:
         assert manager._fingerprint is not None
         assert len(manager._fingerprint) == 64  # SHA256 hex digest
 
+    def test_initialization_uses_slots(self):
+        """
+        What it does: Verifies KiroAuthManager instances have no __dict__.
+        Purpose: Keep per-instance memory small in multi-account pools.
+        """
+        print("Setup: Creating KiroAuthManager...")
+        manager = KiroAuthManager(refresh_token="test_token")
+
+        print("Verification: No per-instance __dict__...")
+        assert not hasattr(manager, "__dict__")
+
+        print("Verification: Unknown attributes are rejected...")
+        with pytest.raises(AttributeError):
+            manager._not_a_slot = 1
+
 
 class TestKiroAuthManagerCredentialsFile:
     """Tests for loading credentials from file."""
@@ -123,10 +140,204 @@ class TestKiroAuthManagerCredentialsFile:
         print(f"Comparing refresh_token: Expected 'fallback_token', Got '{manager._refresh_token}'")
         assert manager._refresh_token == "fallback_token"
 
+    def test_null_fields_in_file_keep_existing_values(self, tmp_path):
+        """
+        What it does: Verifies null JSON fields do not overwrite values passed to the constructor.
+        Purpose: The field table only applies fields that carry a value.
+        """
+        creds_file = tmp_path / "creds.json"
+        creds_file.write_text(json.dumps({"refreshToken": None, "accessToken": "file_access"}))
+
+        manager = KiroAuthManager(refresh_token="ctor_refresh", creds_file=str(creds_file))
+
+        print(f"Comparing refresh_token: Expected 'ctor_refresh', Got '{manager._refresh_token}'")
+        assert manager._refresh_token == "ctor_refresh"
+        assert manager._access_token == "file_access"
+
+    def test_save_credentials_creates_missing_file(self, tmp_path):
+        """
+        What it does: Verifies saving works when the credentials file does not exist yet.
+        Purpose: The EAFP read of existing data must treat a missing file as empty.
+        """
+        creds_file = tmp_path / "new_creds.json"
+        manager = KiroAuthManager(refresh_token="refresh", creds_file=str(creds_file))
+        assert manager._creds_file_path == creds_file
+
+        manager._access_token = "saved_token"
+        manager._save_credentials_to_file()
+
+        print("Verification: File created with the saved token...")
+        saved = json.loads(creds_file.read_text())
+        assert saved["accessToken"] == "saved_token"
+        assert saved["refreshToken"] == "refresh"
+
+    def test_save_replaces_file_atomically(self, tmp_path):
+        """
+        What it does: Verifies the save goes through a temp file and keeps the file mode.
+        Purpose: A crash mid-save must not leave a truncated credentials file.
+        """
+        creds_file = tmp_path / "creds.json"
+        creds_file.write_text(json.dumps({"refreshToken": "old", "custom": "kept"}))
+        creds_file.chmod(0o600)
+        manager = KiroAuthManager(creds_file=str(creds_file))
+
+        manager._access_token = "saved_token"
+        with patch("kiro.auth_credentials.os.replace", wraps=os.replace) as mock_replace:
+            manager._save_credentials_to_file()
+
+        print("Verification: Temp file renamed over the original...")
+        mock_replace.assert_called_once()
+        assert [p.name for p in tmp_path.iterdir()] == ["creds.json"]
+        assert creds_file.stat().st_mode & 0o777 == 0o600
+        saved = json.loads(creds_file.read_text())
+        assert saved["accessToken"] == "saved_token"
+        assert saved["custom"] == "kept"
+
+    def test_save_through_symlink_updates_target(self, tmp_path):
+        """
+        What it does: Verifies saving via a symlinked credentials path rewrites the target.
+        Purpose: The link must survive so the shared file keeps receiving updates.
+        """
+        target = tmp_path / "shared" / "creds.json"
+        target.parent.mkdir()
+        target.write_text(json.dumps({"refreshToken": "old"}))
+        link = tmp_path / "creds.json"
+        link.symlink_to(target)
+        manager = KiroAuthManager(creds_file=str(link))
+
+        manager._access_token = "saved_token"
+        manager._save_credentials_to_file()
+
+        print("Verification: Link kept, target rewritten...")
+        assert link.is_symlink()
+        assert json.loads(target.read_text())["accessToken"] == "saved_token"
+
+    def test_repeated_save_skips_reading_file(self, temp_creds_file):
+        """
+        What it does: Verifies the second save reuses the in-memory mirror of the file.
+        Purpose: Only the first save should read and parse the existing file.
+        """
+        manager = KiroAuthManager(creds_file=temp_creds_file)
+        manager._save_credentials_to_file()
+
+        manager._access_token = "second_token"
+        with patch("kiro.auth_credentials._read_json_file_cached") as mock_read:
+            manager._save_credentials_to_file()
+
+        print(f"File read calls on second save: {mock_read.call_count}")
+        mock_read.assert_not_called()
+        with open(temp_creds_file) as f:
+            assert json.load(f)["accessToken"] == "second_token"
+
+    def test_save_rereads_file_changed_externally(self, tmp_path):
+        """
+        What it does: Verifies fields written by another process between saves are preserved.
+        Purpose: The mirror must be discarded when the file no longer matches our last write.
+        """
+        creds_file = tmp_path / "creds.json"
+        creds_file.write_text(json.dumps({"refreshToken": "old"}))
+        manager = KiroAuthManager(creds_file=str(creds_file))
+        manager._save_credentials_to_file()
+
+        print("Action: Another process rewrites the file...")
+        data = json.loads(creds_file.read_text())
+        data["externalField"] = "value_from_ide"
+        creds_file.write_text(json.dumps(data))
+
+        manager._access_token = "refreshed_access_token"
+        manager._save_credentials_to_file()
+        saved = json.loads(creds_file.read_text())
+        assert saved["externalField"] == "value_from_ide"
+        assert saved["accessToken"] == "refreshed_access_token"
+
+    def test_unchanged_credentials_skip_file_write(self, temp_creds_file):
+        """
+        What it does: Verifies a save with the same credentials as the last save writes nothing.
+        Purpose: Steady-state saves between refreshes must not touch the disk.
+        """
+        manager = KiroAuthManager(creds_file=temp_creds_file)
+        manager._save_credentials_to_file()
+
+        with patch("kiro.auth_credentials._write_file_atomic") as mock_write:
+            manager._save_credentials_to_file()
+            print(f"Writes with unchanged credentials: {mock_write.call_count}")
+            mock_write.assert_not_called()
+
+            manager._access_token = "changed_access_token"
+            manager._save_credentials_to_file()
+            mock_write.assert_called_once()
+
+    def test_large_file_parsed_via_mmap(self, tmp_path):
+        """
+        What it does: Verifies a credentials file above the mmap threshold loads correctly.
+        Purpose: Large files are parsed from a memory map instead of a bytes copy.
+        """
+        from kiro.auth_credentials import CREDS_FILE_MMAP_MIN_BYTES
+
+        creds_file = tmp_path / "large_creds.json"
+        creds_file.write_text(json.dumps({
+            "refreshToken": "large_refresh_token",
+            "padding": "x" * CREDS_FILE_MMAP_MIN_BYTES,
+        }))
+
+        with patch("kiro.auth_credentials.mmap.mmap", wraps=mmap.mmap) as mock_mmap:
+            manager = KiroAuthManager(creds_file=str(creds_file))
+
+        print(f"mmap calls: {mock_mmap.call_count}")
+        mock_mmap.assert_called_once()
+        assert manager._refresh_token == "large_refresh_token"
+
+    def test_unchanged_file_parsed_once(self, temp_creds_file):
+        """
+        What it does: Verifies a second manager reuses the cached parse of an unchanged file.
+        Purpose: Repeated construction must not re-read identical credentials from disk.
+        """
+        KiroAuthManager(creds_file=temp_creds_file)
+
+        print("Action: Creating a second manager with the same file...")
+        with patch("kiro.auth_credentials.json_loads") as mock_loads:
+            manager = KiroAuthManager(creds_file=temp_creds_file)
+
+        print(f"json_loads calls: {mock_loads.call_count}")
+        mock_loads.assert_not_called()
+        assert manager._refresh_token == "file_refresh_token"
+
+    def test_rewritten_file_is_reloaded(self, temp_creds_file):
+        """
+        What it does: Verifies the cache misses after the file is rewritten.
+        Purpose: Changed credentials on disk must be picked up by new managers.
+        """
+        manager = KiroAuthManager(creds_file=temp_creds_file)
+        manager._refresh_token = "rotated_refresh_token"
+        manager._save_credentials_to_file()
+
+        print("Action: Creating a new manager after the save...")
+        reloaded = KiroAuthManager(creds_file=temp_creds_file)
+        print(f"Comparing refresh_token: Expected 'rotated_refresh_token', Got '{reloaded._refresh_token}'")
+        assert reloaded._refresh_token == "rotated_refresh_token"
+
 
 class TestKiroAuthManagerTokenExpiration:
     """Tests for token expiration checking."""
     
+    def test_setting_expires_at_updates_epoch_timestamp(self):
+        """
+        What it does: Verifies _expires_at assignment keeps _expires_at_ts in sync.
+        Purpose: Ensure hot-path checks see the same expiry as logging/serialization.
+        """
+        manager = KiroAuthManager(refresh_token="test_token")
+        expires = datetime.now(timezone.utc) + timedelta(hours=1)
+
+        print("Action: Setting _expires_at...")
+        manager._expires_at = expires
+        print(f"Comparing ts: Expected {expires.timestamp()}, Got {manager._expires_at_ts}")
+        assert manager._expires_at_ts == expires.timestamp()
+        assert manager._expires_at == expires
+
+        print("Action: Clearing _expires_at...")
+        manager._expires_at = None
+        assert manager._expires_at_ts is None
+    
     def test_is_token_expiring_soon_returns_true_when_no_expires_at(self):
         """
         What it does: Verifies that without expires_at token is considered expiring.
@@ -204,6 +415,7 @@ class TestKiroAuthManagerTokenRefresh:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_kiro_token_response())
+        mock_response.content = json.dumps(mock_kiro_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -239,6 +451,7 @@ class TestKiroAuthManagerTokenRefresh:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_kiro_token_response())
+        mock_response.content = json.dumps(mock_kiro_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -268,6 +481,7 @@ class TestKiroAuthManagerTokenRefresh:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value={"expiresIn": 3600})  # No accessToken!
+        mock_response.content = json.dumps({"expiresIn": 3600}).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -301,6 +515,67 @@ class TestKiroAuthManagerTokenRefresh:
         print(f"Verification: ValueError raised: {exc_info.value}")
         assert "Refresh token" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_refresh_saves_credentials_off_event_loop_thread(self, mock_kiro_token_response):
+        """
+        What it does: Verifies credentials are saved in a worker thread after refresh.
+        Purpose: Disk I/O must not block the event loop while the refresh lock is held.
+        """
+        import threading
+
+        print("Setup: Creating KiroAuthManager...")
+        manager = KiroAuthManager(refresh_token="test_refresh", region="us-east-1")
+        loop_thread = threading.get_ident()
+        save_threads = []
+
+        mock_response = AsyncMock()
+        mock_response.status_code = 200
+        mock_response.json = Mock(return_value=mock_kiro_token_response())
+        mock_response.content = json.dumps(mock_kiro_token_response()).encode()
+        mock_response.raise_for_status = Mock()
+
+        with patch('kiro.auth.httpx.AsyncClient') as mock_client_class, patch.object(
+            KiroAuthManager, '_save_credentials_to_file',
+            new=lambda self: save_threads.append(threading.get_ident())
+        ):
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(return_value=mock_response)
+            mock_client_class.return_value = mock_client
+
+            print("Action: Refreshing token...")
+            await manager._refresh_token_request()
+
+        print("Verification: Save ran once, outside the event loop thread...")
+        assert len(save_threads) == 1
+        assert save_threads[0] != loop_thread
+
+    def test_token_response_from_dict_defaults(self):
+        """
+        What it does: Verifies refresh responses are parsed into _TokenResponse with defaults.
+        Purpose: Ensure optional fields and the 3600s expiresIn default are applied.
+        """
+        from kiro.auth import _TokenResponse
+
+        token = _TokenResponse.from_dict({"accessToken": "abc"}, "Kiro Desktop Auth")
+        assert token.access_token == "abc"
+        assert token.refresh_token is None
+        assert token.profile_arn is None
+        assert token.expires_in == 3600
+
+        print("Verification: Parsed response is immutable...")
+        with pytest.raises(AttributeError):
+            token.access_token = "other"
+
+    def test_token_response_from_dict_requires_access_token(self):
+        """
+        What it does: Verifies a response without accessToken is rejected.
+        Purpose: Ensure the error names the auth endpoint.
+        """
+        from kiro.auth import _TokenResponse
+
+        with pytest.raises(ValueError, match="AWS SSO OIDC response does not contain accessToken"):
+            _TokenResponse.from_dict({"expiresIn": 3600}, "AWS SSO OIDC")
+
 
 class TestKiroAuthManagerGetAccessToken:
     """Tests for public get_access_token method."""
@@ -320,6 +595,7 @@ class TestKiroAuthManagerGetAccessToken:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_kiro_token_response())
+        mock_response.content = json.dumps(mock_kiro_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -388,7 +664,7 @@ class TestKiroAuthManagerGetAccessToken:
             manager._expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
         
         print("Setup: Patching _refresh_token_request to track calls...")
-        with patch.object(manager, '_refresh_token_request', side_effect=mock_refresh):
+        with patch.object(KiroAuthManager, '_refresh_token_request', side_effect=mock_refresh):
             print("Action: 5 parallel get_access_token() calls...")
             tokens = await asyncio.gather(*[
                 manager.get_access_token() for _ in range(5)
@@ -402,6 +678,101 @@ class TestKiroAuthManagerGetAccessToken:
             assert refresh_call_count == 1
 
 
+    @pytest.mark.asyncio
+    async def test_get_access_token_valid_token_does_not_wait_for_lock(self, valid_kiro_token):
+        """
+        What it does: Verifies a valid token is returned while the lock is held.
+        Purpose: Ensure the hot read path never queues behind a slow refresh.
+        """
+        print("Setup: Creating KiroAuthManager with valid token and held lock...")
+        manager = KiroAuthManager(refresh_token="test_refresh")
+        manager._access_token = valid_kiro_token
+        manager._expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+        async with manager._refresh_lock:
+            print("Action: Requesting token while lock is held...")
+            token = await asyncio.wait_for(manager.get_access_token(), timeout=1)
+
+        print(f"Comparing token: Expected '{valid_kiro_token}', Got '{token}'")
+        assert token == valid_kiro_token
+
+    @pytest.mark.asyncio
+    async def test_get_access_token_cancelled_caller_does_not_cancel_refresh(self, valid_kiro_token):
+        """
+        What it does: Verifies cancelling one waiter leaves the shared refresh running.
+        Purpose: Ensure other callers still receive the refreshed token.
+        """
+        print("Setup: Creating KiroAuthManager without token...")
+        manager = KiroAuthManager(refresh_token="test_refresh")
+        manager._access_token = None
+        manager._expires_at = None
+
+        async def mock_refresh():
+            await asyncio.sleep(0.1)
+            manager._access_token = valid_kiro_token
+            manager._expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+        with patch.object(KiroAuthManager, '_refresh_token_request', side_effect=mock_refresh):
+            first = asyncio.create_task(manager.get_access_token())
+            second = asyncio.create_task(manager.get_access_token())
+            await asyncio.sleep(0.01)
+
+            print("Action: Cancelling first caller...")
+            first.cancel()
+
+            print("Verification: Second caller still gets the token...")
+            assert await second == valid_kiro_token
+
+
+    @pytest.mark.asyncio
+    async def test_get_access_token_stale_returns_cached_and_refreshes_in_background(self):
+        """
+        What it does: Verifies a stale token is served while refresh runs in background.
+        Purpose: Ensure callers never block on refresh while the token is still valid.
+        """
+        print("Setup: Creating KiroAuthManager with stale token...")
+        manager = KiroAuthManager(refresh_token="test_refresh")
+        manager._access_token = "stale_token"
+        manager._expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+        assert manager.is_token_stale() is True
+
+        refresh_started = asyncio.Event()
+        release_refresh = asyncio.Event()
+
+        async def mock_refresh():
+            refresh_started.set()
+            await release_refresh.wait()
+            manager._access_token = "new_token"
+            manager._expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+        with patch.object(KiroAuthManager, '_refresh_token_request', side_effect=mock_refresh):
+            print("Action: Requesting token...")
+            token = await asyncio.wait_for(manager.get_access_token(), timeout=1)
+
+            print(f"Comparing token: Expected 'stale_token', Got '{token}'")
+            assert token == "stale_token"
+
+            await asyncio.wait_for(refresh_started.wait(), timeout=1)
+            release_refresh.set()
+            await manager._refresh_future
+
+        print("Verification: Background refresh replaced the token...")
+        assert await manager.get_access_token() == "new_token"
+
+    def test_is_token_stale_false_for_fresh_and_expired(self):
+        """
+        What it does: Verifies is_token_stale is False outside the refresh window.
+        Purpose: Ensure fresh tokens are not refreshed and expired ones block.
+        """
+        manager = KiroAuthManager(refresh_token="test_refresh")
+
+        manager._expires_at = datetime.now(timezone.utc) + timedelta(hours=2)
+        assert manager.is_token_stale() is False
+
+        manager._expires_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+        assert manager.is_token_stale() is False
+
+
 class TestKiroAuthManagerForceRefresh:
     """Tests for forced token refresh."""
     
@@ -420,6 +791,7 @@ class TestKiroAuthManagerForceRefresh:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_kiro_token_response())
+        mock_response.content = json.dumps(mock_kiro_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -440,6 +812,240 @@ class TestKiroAuthManagerForceRefresh:
             mock_client.post.assert_called_once()
 
 
+class TestKiroAuthManagerSharedHttpClient:
+    """Tests for the HTTP client reused by token refresh."""
+
+    @pytest.mark.parametrize("h2_available", [True, False])
+    def test_client_uses_http2_only_when_h2_installed(self, h2_available):
+        """
+        What it does: Verifies http2 is requested only when the h2 package is available.
+        Purpose: Multiplex refreshes over HTTP/2, falling back to HTTP/1.1 without h2.
+        """
+        manager = KiroAuthManager(refresh_token="test_refresh")
+        with patch('kiro.auth._HTTP2_AVAILABLE', h2_available), \
+                patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
+            manager._get_http_client()
+
+        print(f"Comparing http2: Expected {h2_available}, Got {mock_client_class.call_args[1]['http2']}")
+        assert mock_client_class.call_args[1]['http2'] is h2_available
+
+    @pytest.mark.asyncio
+    async def test_refreshes_reuse_same_client(self, mock_kiro_token_response):
+        """
+        What it does: Verifies consecutive refreshes of one manager reuse one HTTP client.
+        Purpose: Ensure connections are kept alive instead of re-created per refresh.
+        """
+        print("Setup: Creating KiroAuthManager...")
+        manager = KiroAuthManager(refresh_token="refresh_a")
+
+        mock_response = AsyncMock()
+        mock_response.status_code = 200
+        mock_response.json = Mock(return_value=mock_kiro_token_response())
+        mock_response.content = json.dumps(mock_kiro_token_response()).encode()
+        mock_response.raise_for_status = Mock()
+
+        with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.is_closed = False
+            mock_client.post = AsyncMock(return_value=mock_response)
+            mock_client_class.return_value = mock_client
+
+            print("Action: Refreshing three times...")
+            for _ in range(3):
+                await manager._refresh_token_request()
+
+            print(f"Verification: Client constructed once, Got {mock_client_class.call_count}")
+            assert mock_client_class.call_count == 1
+            assert mock_client.post.call_count == 3
+
+    def test_client_is_scoped_to_manager(self):
+        """
+        What it does: Verifies each manager gets its own HTTP client.
+        Purpose: A client bound to one manager's event loop must not leak into another.
+        """
+        manager_a = KiroAuthManager(refresh_token="refresh_a")
+        manager_b = KiroAuthManager(refresh_token="refresh_b")
+
+        with patch('kiro.auth.httpx.AsyncClient', side_effect=lambda **kwargs: Mock(is_closed=False)):
+            client_a = manager_a._get_http_client()
+            client_b = manager_b._get_http_client()
+
+        assert client_a is not client_b
+        assert manager_a._get_http_client() is client_a
+
+    @pytest.mark.asyncio
+    async def test_stop_background_refresh_closes_client_without_background_task(self):
+        """
+        What it does: Verifies stop closes the client even if background refresh never started.
+        Purpose: Managers that only refresh on demand must not leak their connections.
+        """
+        print("Setup: Creating manager with an open client, no background refresh...")
+        manager = KiroAuthManager(refresh_token="test_refresh")
+        mock_client = AsyncMock()
+        mock_client.is_closed = False
+        manager._http_client = mock_client
+
+        print("Action: Stopping background refresh...")
+        await manager.stop_background_refresh()
+
+        print("Verification: Client closed and reference dropped...")
+        mock_client.aclose.assert_awaited_once()
+        assert manager._http_client is None
+
+    @pytest.mark.asyncio
+    async def test_stop_background_refresh_closes_client(self):
+        """
+        What it does: Verifies the client is closed when background refresh stops.
+        Purpose: Ensure no connections leak after shutdown.
+        """
+        print("Setup: Creating manager and starting background refresh...")
+        manager = KiroAuthManager(refresh_token="test_refresh")
+        mock_client = AsyncMock()
+        mock_client.is_closed = False
+        manager._http_client = mock_client
+
+        with patch.object(KiroAuthManager, '_background_token_refresh', new=AsyncMock()):
+            manager.start_background_refresh()
+
+            print("Action: Stopping background refresh...")
+            await manager.stop_background_refresh()
+
+        print("Verification: Client closed and reference dropped...")
+        mock_client.aclose.assert_awaited_once()
+        assert manager._http_client is None
+
+
+class TestKiroAuthManagerBackgroundRefreshSchedule:
+    """Tests for deadline-driven background refresh scheduling."""
+
+    def test_refresh_due_in_tracks_expiry_minus_threshold(self):
+        """
+        What it does: Verifies the refresh deadline is expiry minus threshold.
+        Purpose: Ensure the background task wakes exactly when refresh becomes due.
+        """
+        print("Setup: Token expiring in threshold + 600 seconds...")
+        manager = KiroAuthManager(refresh_token="test_refresh")
+        manager._expires_at = datetime.now(timezone.utc) + timedelta(
+            seconds=TOKEN_REFRESH_THRESHOLD + 600
+        )
+
+        due_in = manager._seconds_until_refresh_due()
+        print(f"Comparing due_in: Expected ~600, Got {due_in}")
+        assert 590 <= due_in <= 600
+
+    def test_refresh_due_immediately_without_expiry(self):
+        """
+        What it does: Verifies missing expiry means refresh is due now.
+        Purpose: Ensure the background task does not sleep on unknown expiry.
+        """
+        manager = KiroAuthManager(refresh_token="test_refresh")
+        manager._expires_at = None
+        assert manager._seconds_until_refresh_due() <= 0
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_runs_immediately_when_due(self):
+        """
+        What it does: Verifies a token already in the refresh window is refreshed at once.
+        Purpose: Ensure no fixed-interval sleep happens before a due refresh.
+        """
+        print("Setup: Token expiring within threshold...")
+        manager = KiroAuthManager(refresh_token="test_refresh")
+        manager._access_token = "old_token"
+        manager._expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+        refreshed = asyncio.Event()
+
+        async def mock_refresh():
+            manager._expires_at = datetime.now(timezone.utc) + timedelta(hours=10)
+            refreshed.set()
+
+        with patch.object(KiroAuthManager, '_refresh_token_request', side_effect=mock_refresh):
+            manager.start_background_refresh()
+            print("Action: Waiting for refresh to happen...")
+            await asyncio.wait_for(refreshed.wait(), timeout=2)
+
+            print("Action: Stopping background refresh (must not wait for sleep)...")
+            await asyncio.wait_for(manager.stop_background_refresh(), timeout=2)
+
+        assert manager._background_task.done()
+
+    def test_refresh_backoff_doubles_with_jitter_and_caps(self):
+        """
+        What it does: Verifies retry backoff doubles per failure, jittered, capped at 5 min.
+        Purpose: Avoid a fleet of managers retrying a sick upstream in lockstep.
+        """
+        manager = KiroAuthManager(refresh_token="test_refresh")
+
+        print("Action: Computing consecutive backoff delays...")
+        delays = [manager._next_refresh_backoff() for _ in range(12)]
+        print(f"Delays: {[round(d, 1) for d in delays]}")
+
+        assert 2.0 <= delays[0] <= 3.0
+        assert 4.0 <= delays[1] <= 6.0
+        assert manager._refresh_backoff == 300.0
+        assert all(300.0 <= d <= 450.0 for d in delays[-3:])
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_backs_off_after_failure(self):
+        """
+        What it does: Verifies a failed background refresh sleeps for the backoff delay.
+        Purpose: Ensure failures use exponential backoff instead of a fixed 30s retry.
+        """
+        manager = KiroAuthManager(refresh_token="test_refresh")
+        manager._access_token = "old_token"
+        manager._expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+        waits = []
+
+        async def fake_wait(self, timeout):
+            waits.append(timeout)
+            return True  # Request shutdown after the first wait
+
+        with patch.object(
+            KiroAuthManager, '_refresh_token_request',
+            side_effect=httpx.ConnectError("DNS failure")
+        ), patch.object(KiroAuthManager, '_wait_for_shutdown', new=fake_wait):
+            await manager._background_token_refresh()
+
+        print(f"Waits: {waits}")
+        assert len(waits) == 1
+        assert 2.0 <= waits[0] <= 3.0
+        assert manager._refresh_backoff == 2.0
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_jittered_wakeup_refreshes(self):
+        """
+        What it does: Verifies waking up within the jitter of the window refreshes right away.
+        Purpose: The jitter must move the refresh earlier, not add extra polling wakeups.
+        """
+        manager = KiroAuthManager(refresh_token="test_refresh")
+        manager._access_token = "old_token"
+        manager._expires_at = datetime.now(timezone.utc) + timedelta(
+            seconds=TOKEN_REFRESH_THRESHOLD + 100
+        )
+        waits = []
+        refreshed = []
+
+        async def fake_wait(self, timeout):
+            waits.append(timeout)
+            if refreshed:
+                return True  # Request shutdown once the refresh happened
+            self._expires_at -= timedelta(seconds=timeout)  # Simulate the sleep
+            return False
+
+        async def fake_refresh(self):
+            refreshed.append(True)
+            self._expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+        with patch('kiro.auth.random.uniform', return_value=30.0), \
+             patch.object(KiroAuthManager, '_refresh_token_request', new=fake_refresh), \
+             patch.object(KiroAuthManager, '_wait_for_shutdown', new=fake_wait):
+            await manager._background_token_refresh()
+
+        print(f"Waits: {waits}")
+        assert refreshed == [True]
+        assert len(waits) == 2  # One sleep before the refresh, then shutdown
+        assert 65.0 <= waits[0] <= 70.0
+
+
 class TestKiroAuthManagerProperties:
     """Tests for KiroAuthManager properties."""
     
@@ -768,6 +1374,296 @@ class TestKiroAuthManagerSqliteCredentials:
         print(f"Comparing region: Expected 'us-east-1', Got '{manager._region}'")
         assert manager._region == "us-east-1"
 
+    def test_sqlite_connection_reused_across_reloads(self, temp_sqlite_db):
+        """
+        What it does: Verifies repeated reloads share one SQLite connection.
+        Purpose: Avoid reopening the database file on every reload.
+        """
+        print("Setup: Creating KiroAuthManager with SQLite...")
+        manager = KiroAuthManager(sqlite_db=temp_sqlite_db)
+        first_conn = manager._sqlite_conn
+        assert first_conn is not None
+
+        print("Action: Reloading credentials again...")
+        manager._load_credentials_from_sqlite(temp_sqlite_db)
+
+        print("Verification: Same connection object is used...")
+        assert manager._sqlite_conn is first_conn
+        assert manager._access_token == "sqlite_access_token"
+
+    def test_sqlite_load_uses_single_select(self, temp_sqlite_db):
+        """
+        What it does: Verifies token and registration rows are read with one SELECT.
+        Purpose: Avoid one statement per candidate key on every reload.
+        """
+        manager = KiroAuthManager(sqlite_db=temp_sqlite_db)
+        statements = []
+        manager._sqlite_conn.set_trace_callback(statements.append)
+
+        print("Action: Reloading credentials...")
+        manager._load_credentials_from_sqlite(temp_sqlite_db)
+
+        selects = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+        print(f"SELECT statements: {selects}")
+        assert len(selects) == 1
+        assert manager._access_token == "sqlite_access_token"
+        assert manager._sqlite_token_key == "kirocli:odic:token"
+
+    @pytest.mark.parametrize("parser_name", ["_parse_iso", "_parse_iso_z_shim"])
+    def test_expiry_parser_accepts_trailing_z(self, parser_name):
+        """
+        What it does: Verifies expiry parsing handles 'Z' and explicit offsets.
+        Purpose: Native 3.11+ fromisoformat and the older-Python shim must agree.
+        """
+        import kiro.auth_credentials as auth_credentials
+
+        parse = getattr(auth_credentials, parser_name)
+        expected = datetime(2099, 1, 1, 12, 30, tzinfo=timezone.utc)
+
+        assert parse("2099-01-01T12:30:00Z") == expected
+        assert parse("2099-01-01T12:30:00.000Z") == expected
+        assert parse("2099-01-01T12:30:00+00:00") == expected
+
+    def test_small_sqlite_token_value_parsed_in_full(self):
+        """
+        What it does: Verifies small token values skip the streaming parser.
+        Purpose: Full parsing is faster for the usual sub-kilobyte values.
+        """
+        from kiro.auth_credentials import _parse_sqlite_token_value
+
+        value = json.dumps({"access_token": "a", "extra": "kept"})
+        with patch('kiro.auth_credentials.ijson') as mock_ijson:
+            data = _parse_sqlite_token_value(value)
+
+        assert data == {"access_token": "a", "extra": "kept"}
+        mock_ijson.kvitems.assert_not_called()
+
+    def test_large_sqlite_token_value_stream_parsed(self):
+        """
+        What it does: Verifies large token values are stream-parsed down to known fields.
+        Purpose: Avoid materializing large unused payloads (scopes, metadata).
+        """
+        pytest.importorskip("ijson")
+        from kiro.auth_credentials import (
+            SQLITE_STREAM_PARSE_MIN_BYTES,
+            _parse_sqlite_token_value,
+        )
+
+        value = json.dumps({
+            "access_token": "big_access",
+            "refresh_token": "big_refresh",
+            "metadata": "x" * SQLITE_STREAM_PARSE_MIN_BYTES,
+            "expires_at": "2099-01-01T00:00:00Z",
+        })
+        data = _parse_sqlite_token_value(value)
+
+        assert data == {
+            "access_token": "big_access",
+            "refresh_token": "big_refresh",
+            "expires_at": "2099-01-01T00:00:00Z",
+        }
+
+    def test_sqlite_connection_pragmas(self, temp_sqlite_db):
+        """
+        What it does: Verifies the cached connection is opened with WAL and a busy timeout.
+        Purpose: Reads must not block kiro-cli writes, and lock waits must not fail instantly.
+        """
+        manager = KiroAuthManager(sqlite_db=temp_sqlite_db)
+        conn = manager._sqlite_conn
+
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        busy_timeout = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        print(f"journal_mode={journal_mode}, busy_timeout={busy_timeout}, synchronous={synchronous}")
+        assert journal_mode == "wal"
+        assert busy_timeout == 5000
+        assert synchronous == 1  # NORMAL
+
+    def test_sqlite_save_reuses_load_connection(self, temp_sqlite_db):
+        """
+        What it does: Verifies saving credentials uses the connection opened for loading.
+        Purpose: One long-lived connection serves loads and saves alike.
+        """
+        import sqlite3
+
+        print("Setup: Creating KiroAuthManager with SQLite...")
+        manager = KiroAuthManager(sqlite_db=temp_sqlite_db)
+        conn = manager._sqlite_conn
+
+        print("Action: Saving a new access token...")
+        manager._access_token = "saved_access_token"
+        manager._save_credentials_to_sqlite()
+
+        print("Verification: Same connection, and the write is visible to other readers...")
+        assert manager._sqlite_conn is conn
+        reader = sqlite3.connect(temp_sqlite_db)
+        row = reader.execute(
+            "SELECT value FROM auth_kv WHERE key = ?", (manager._sqlite_token_key,)
+        ).fetchone()
+        reader.close()
+        assert json.loads(row[0])["access_token"] == "saved_access_token"
+
+    def test_sqlite_save_runs_in_single_immediate_transaction(self, temp_sqlite_db):
+        """
+        What it does: Verifies a fallback save is one UPDATE inside one BEGIN IMMEDIATE transaction.
+        Purpose: One statement and one commit per save, even when the loaded key is gone.
+        """
+        manager = KiroAuthManager(sqlite_db=temp_sqlite_db)
+        manager._sqlite_token_key = "kirocli:social:token"  # Missing: forces the fallback
+        statements = []
+        manager._sqlite_conn.set_trace_callback(statements.append)
+
+        print("Action: Saving credentials...")
+        manager._save_credentials_to_sqlite()
+
+        keywords = [sql.split()[0].upper() for sql in statements]
+        print(f"Statements: {keywords}")
+        assert keywords == ["BEGIN", "UPDATE", "COMMIT"]
+        assert not manager._sqlite_conn.in_transaction
+
+    @pytest.mark.asyncio
+    async def test_persist_credentials_saves_off_event_loop(self, temp_sqlite_db):
+        """
+        What it does: Verifies the async save wrapper runs the SQLite save in a worker thread.
+        Purpose: The event loop must not block on the SQLite write.
+        """
+        import threading
+
+        manager = KiroAuthManager(sqlite_db=temp_sqlite_db)
+        loop_thread = threading.get_ident()
+        save_threads = []
+
+        def record_save(self):
+            save_threads.append(threading.get_ident())
+
+        with patch.object(KiroAuthManager, '_save_credentials_to_sqlite', record_save):
+            await manager._persist_credentials()
+
+        print(f"Save thread: {save_threads}, loop thread: {loop_thread}")
+        assert len(save_threads) == 1
+        assert save_threads[0] != loop_thread
+
+    def test_sqlite_save_reuses_payload_buffer_without_stale_fields(self, temp_sqlite_db):
+        """
+        What it does: Verifies the reused payload dict is cleared between saves.
+        Purpose: Fields from an earlier save (scopes) must not leak into the next one.
+        """
+        import sqlite3
+
+        manager = KiroAuthManager(sqlite_db=temp_sqlite_db)
+        buf = manager._token_data_buf
+        manager._scopes = ["codewhisperer:completions"]
+        manager._save_credentials_to_sqlite()
+
+        manager._scopes = None
+        manager._save_credentials_to_sqlite()
+
+        reader = sqlite3.connect(temp_sqlite_db)
+        row = reader.execute(
+            "SELECT value FROM auth_kv WHERE key = ?", (manager._sqlite_token_key,)
+        ).fetchone()
+        reader.close()
+        saved = json.loads(row[0])
+        print(f"Saved keys: {sorted(saved)}")
+        assert "scopes" not in saved
+        assert manager._token_data_buf is buf
+
+    def test_sqlite_unchanged_credentials_skip_write(self, temp_sqlite_db):
+        """
+        What it does: Verifies a repeated SQLite save with identical credentials is skipped.
+        Purpose: No write transaction when nothing changed since the last save.
+        """
+        manager = KiroAuthManager(sqlite_db=temp_sqlite_db)
+        manager._save_credentials_to_sqlite()
+
+        with patch.object(KiroAuthManager, '_write_sqlite_token') as mock_write:
+            manager._save_credentials_to_sqlite()
+
+        print(f"Writes with unchanged credentials: {mock_write.call_count}")
+        mock_write.assert_not_called()
+
+    def test_sqlite_fallback_save_tracks_updated_key(self, temp_sqlite_db):
+        """
+        What it does: Verifies the key actually written by a fallback save is remembered.
+        Purpose: Later saves should target the existing key directly.
+        """
+        from kiro.auth_credentials import _SQLITE_HAS_RETURNING
+
+        if not _SQLITE_HAS_RETURNING:
+            pytest.skip("SQLite without RETURNING support")
+        manager = KiroAuthManager(sqlite_db=temp_sqlite_db)
+        loaded_key = manager._sqlite_token_key
+        manager._sqlite_token_key = "kirocli:social:token"  # Missing: forces the fallback
+
+        manager._access_token = "fallback_access_token"
+        manager._save_credentials_to_sqlite()
+
+        print(f"Comparing key: Expected '{loaded_key}', Got '{manager._sqlite_token_key}'")
+        assert manager._sqlite_token_key == loaded_key
+
+    def test_open_sqlite_connections_closed_at_exit(self, temp_sqlite_db):
+        """
+        What it does: Verifies the atexit hook closes connections still open.
+        Purpose: Managers that are never stopped still release the database.
+        """
+        import sqlite3
+        from kiro.auth_credentials import (
+            _close_open_sqlite_connections,
+            _open_sqlite_connections,
+        )
+
+        manager = KiroAuthManager(sqlite_db=temp_sqlite_db)
+        conn = manager._sqlite_conn
+        assert conn in _open_sqlite_connections
+
+        _close_open_sqlite_connections()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    @pytest.mark.asyncio
+    async def test_stop_background_refresh_closes_sqlite_connection(self, temp_sqlite_db):
+        """
+        What it does: Verifies stop_background_refresh() closes the SQLite connection.
+        Purpose: Release the database handle on shutdown.
+        """
+        print("Setup: Creating KiroAuthManager with SQLite...")
+        manager = KiroAuthManager(sqlite_db=temp_sqlite_db)
+        assert manager._sqlite_conn is not None
+
+        print("Action: Stopping background refresh...")
+        await manager.stop_background_refresh()
+
+        print("Verification: Connection is closed and dropped...")
+        assert manager._sqlite_conn is None
+
+    @pytest.mark.asyncio
+    async def test_sqlite_reload_throttled_within_interval(self, temp_sqlite_db):
+        """
+        What it does: Verifies the pre-refresh SQLite reload runs at most once per interval.
+        Purpose: A burst of requests in the refresh window must not re-read the DB each time.
+        """
+        print("Setup: Creating KiroAuthManager with an expiring token...")
+        manager = KiroAuthManager(sqlite_db=temp_sqlite_db)
+        manager._expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+
+        with patch.object(
+            KiroAuthManager, '_load_credentials_from_sqlite'
+        ) as mock_load, patch.object(
+            KiroAuthManager, '_refresh_token_request', new=AsyncMock()
+        ):
+            print("Action: Running two refresh attempts back to back...")
+            await manager._refresh_and_return()
+            await manager._refresh_and_return()
+
+            print("Verification: SQLite was reloaded only once...")
+            assert mock_load.call_count == 1
+
+            print("Action: Simulating interval elapsed...")
+            manager._last_sqlite_reload_ts -= 11
+            await manager._refresh_and_return()
+            assert mock_load.call_count == 2
+
 
 # =============================================================================
 # Tests for _refresh_token_request() routing
@@ -787,8 +1683,8 @@ class TestKiroAuthManagerRefreshTokenRouting:
         assert manager.auth_type == AuthType.KIRO_DESKTOP
         
         print("Setup: Mocking _refresh_token_kiro_desktop...")
-        with patch.object(manager, '_refresh_token_kiro_desktop', new_callable=AsyncMock) as mock_desktop:
-            with patch.object(manager, '_refresh_token_aws_sso_oidc', new_callable=AsyncMock) as mock_sso:
+        with patch.object(KiroAuthManager, '_refresh_token_kiro_desktop', new_callable=AsyncMock) as mock_desktop:
+            with patch.object(KiroAuthManager, '_refresh_token_aws_sso_oidc', new_callable=AsyncMock) as mock_sso:
                 await manager._refresh_token_request()
                 
                 print("Verification: _refresh_token_kiro_desktop was called...")
@@ -812,8 +1708,8 @@ class TestKiroAuthManagerRefreshTokenRouting:
         assert manager.auth_type == AuthType.AWS_SSO_OIDC
         
         print("Setup: Mocking _refresh_token_aws_sso_oidc...")
-        with patch.object(manager, '_refresh_token_kiro_desktop', new_callable=AsyncMock) as mock_desktop:
-            with patch.object(manager, '_refresh_token_aws_sso_oidc', new_callable=AsyncMock) as mock_sso:
+        with patch.object(KiroAuthManager, '_refresh_token_kiro_desktop', new_callable=AsyncMock) as mock_desktop:
+            with patch.object(KiroAuthManager, '_refresh_token_aws_sso_oidc', new_callable=AsyncMock) as mock_sso:
                 await manager._refresh_token_request()
                 
                 print("Verification: _refresh_token_aws_sso_oidc was called...")
@@ -848,6 +1744,7 @@ class TestKiroAuthManagerAwsSsoOidcRefresh:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -947,6 +1844,7 @@ class TestKiroAuthManagerAwsSsoOidcRefresh:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -982,6 +1880,7 @@ class TestKiroAuthManagerAwsSsoOidcRefresh:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -1016,6 +1915,7 @@ class TestKiroAuthManagerAwsSsoOidcRefresh:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -1029,7 +1929,7 @@ class TestKiroAuthManagerAwsSsoOidcRefresh:
             
             print("Verification: grantType = refresh_token (camelCase in JSON)...")
             call_args = mock_client.post.call_args
-            json_payload = call_args[1].get('json', {})
+            json_payload = json.loads(call_args[1]['content'])
             print(f"Comparing grantType: Expected 'refresh_token', Got '{json_payload.get('grantType')}'")
             assert json_payload.get('grantType') == 'refresh_token'
     
@@ -1050,6 +1950,7 @@ class TestKiroAuthManagerAwsSsoOidcRefresh:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -1084,6 +1985,7 @@ class TestKiroAuthManagerAwsSsoOidcRefresh:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response(expires_in=7200))
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response(expires_in=7200)).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -1123,6 +2025,7 @@ class TestKiroAuthManagerAwsSsoOidcRefresh:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -1136,7 +2039,7 @@ class TestKiroAuthManagerAwsSsoOidcRefresh:
             
             print("Verification: scope NOT in JSON payload...")
             call_args = mock_client.post.call_args
-            json_payload = call_args[1].get('json', {})
+            json_payload = json.loads(call_args[1]['content'])
             print(f"Request JSON keys: {list(json_payload.keys())}")
             assert 'scope' not in json_payload, "scope should NOT be sent in refresh request"
             
@@ -1164,6 +2067,7 @@ class TestKiroAuthManagerAwsSsoOidcRefresh:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -1180,7 +2084,7 @@ class TestKiroAuthManagerAwsSsoOidcRefresh:
             
             print("Verification: scope NOT in request JSON payload...")
             call_args = mock_client.post.call_args
-            json_payload = call_args[1].get('json', {})
+            json_payload = json.loads(call_args[1]['content'])
             assert 'scope' not in json_payload
 
 
@@ -1340,6 +2244,7 @@ class TestKiroAuthManagerSsoRegionSeparation:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -1360,6 +2265,28 @@ class TestKiroAuthManagerSsoRegionSeparation:
             assert "ap-southeast-1" in url
             assert "us-east-1" not in url
     
+    def test_sso_url_cached_until_region_changes(self):
+        """
+        What it does: Verifies the OIDC URL is built once per SSO region.
+        Purpose: Skip the per-refresh URL build but follow region changes on reload.
+        """
+        manager = KiroAuthManager(
+            refresh_token="test_refresh",
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+        )
+
+        with patch('kiro.auth.get_aws_sso_oidc_url', side_effect=get_aws_sso_oidc_url) as mock_url:
+            first = manager._get_sso_url("us-east-1")
+            second = manager._get_sso_url("us-east-1")
+            assert first is second
+            assert mock_url.call_count == 1
+
+            print("Action: SSO region changes (e.g. SQLite reload)...")
+            third = manager._get_sso_url("eu-west-1")
+            assert third == "https://oidc.eu-west-1.amazonaws.com/token"
+            assert mock_url.call_count == 2
+
     @pytest.mark.asyncio
     async def test_oidc_refresh_falls_back_to_api_region_when_no_sso_region(self, mock_aws_sso_oidc_token_response):
         """
@@ -1380,6 +2307,7 @@ class TestKiroAuthManagerSsoRegionSeparation:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -1439,6 +2367,7 @@ class TestKiroAuthManagerSsoRegionSeparation:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -1449,7 +2378,7 @@ class TestKiroAuthManagerSsoRegionSeparation:
             mock_client_class.return_value = mock_client
             
             # Patch _load_credentials_from_sqlite to track if it's called
-            with patch.object(manager, '_load_credentials_from_sqlite') as mock_load:
+            with patch.object(KiroAuthManager, '_load_credentials_from_sqlite') as mock_load:
                 await manager._refresh_token_aws_sso_oidc()
                 
                 print("Verification: SQLite was NOT reloaded (success on first try)...")
@@ -1457,7 +2386,7 @@ class TestKiroAuthManagerSsoRegionSeparation:
                 
                 print("Verification: Request used in-memory token...")
                 call_args = mock_client.post.call_args
-                json_payload = call_args[1].get('json', {})
+                json_payload = json.loads(call_args[1]['content'])
                 print(f"Refresh token sent: {json_payload.get('refreshToken')}")
                 assert json_payload.get('refreshToken') == "memory_refresh_token"
     
@@ -1545,6 +2474,7 @@ class TestKiroAuthManagerSsoRegionSeparation:
         mock_error_response.status_code = 400
         mock_error_response.text = '{"error":"invalid_request","error_description":"Invalid request"}'
         mock_error_response.json = Mock(return_value={"error": "invalid_request"})
+        mock_error_response.content = json.dumps({"error": "invalid_request"}).encode()
         mock_error_response.raise_for_status = Mock(
             side_effect=httpx.HTTPStatusError(
                 "400 Bad Request",
@@ -1557,6 +2487,7 @@ class TestKiroAuthManagerSsoRegionSeparation:
         mock_success_response = AsyncMock()
         mock_success_response.status_code = 200
         mock_success_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_success_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_success_response.raise_for_status = Mock()
         
         call_count = 0
@@ -1565,7 +2496,7 @@ class TestKiroAuthManagerSsoRegionSeparation:
         async def mock_post(*args, **kwargs):
             nonlocal call_count
             call_count += 1
-            sent_tokens.append(kwargs.get('json', {}).get('refreshToken'))
+            sent_tokens.append(json.loads(kwargs['content']).get('refreshToken'))
             if call_count == 1:
                 return mock_error_response
             return mock_success_response
@@ -1628,7 +2559,7 @@ class TestKiroAuthManagerSsoRegionSeparation:
             mock_client.__aexit__ = AsyncMock(return_value=None)
             mock_client_class.return_value = mock_client
             
-            with patch.object(manager, '_load_credentials_from_sqlite') as mock_load:
+            with patch.object(KiroAuthManager, '_load_credentials_from_sqlite') as mock_load:
                 print("Action: Calling _refresh_token_aws_sso_oidc (expecting 500 error)...")
                 with pytest.raises(httpx.HTTPStatusError) as exc_info:
                     await manager._refresh_token_aws_sso_oidc()
@@ -1661,6 +2592,7 @@ class TestKiroAuthManagerSsoRegionSeparation:
         mock_error_response.status_code = 400
         mock_error_response.text = '{"error":"invalid_request"}'
         mock_error_response.json = Mock(return_value={"error": "invalid_request"})
+        mock_error_response.content = json.dumps({"error": "invalid_request"}).encode()
         mock_error_response.raise_for_status = Mock(
             side_effect=httpx.HTTPStatusError(
                 "400 Bad Request",
@@ -1824,12 +2756,17 @@ class TestKiroAuthManagerGracefulDegradation:
         print("Verification: Token is expiring soon...")
         assert manager.is_token_expiring_soon() is True
         
-        print("Action: Calling get_access_token()...")
+        print("Action: Calling get_access_token() (stale token is served)...")
         token = await manager.get_access_token()
+        assert token == "old_expiring_token"
+        
+        print("Action: Waiting for background refresh...")
+        token = await manager._refresh_future
         
         print("Verification: Got fresh token from SQLite reload...")
         print(f"Comparing token: Expected 'fresh_access_token', Got '{token}'")
         assert token == "fresh_access_token"
+        assert manager._access_token == "fresh_access_token"
     
     @pytest.mark.asyncio
     async def test_get_access_token_graceful_fallback_when_refresh_fails_but_token_valid(
@@ -1890,6 +2827,7 @@ class TestKiroAuthManagerGracefulDegradation:
         mock_error_response.status_code = 400
         mock_error_response.text = '{"error":"invalid_request"}'
         mock_error_response.json = Mock(return_value={"error": "invalid_request"})
+        mock_error_response.content = json.dumps({"error": "invalid_request"}).encode()
         mock_error_response.raise_for_status = Mock(
             side_effect=httpx.HTTPStatusError(
                 "400 Bad Request",
@@ -1970,6 +2908,7 @@ class TestKiroAuthManagerGracefulDegradation:
         mock_error_response.status_code = 400
         mock_error_response.text = '{"error":"invalid_request"}'
         mock_error_response.json = Mock(return_value={"error": "invalid_request"})
+        mock_error_response.content = json.dumps({"error": "invalid_request"}).encode()
         mock_error_response.raise_for_status = Mock(
             side_effect=httpx.HTTPStatusError(
                 "400 Bad Request",
@@ -2004,8 +2943,8 @@ class TestKiroAuthManagerGracefulDegradation:
             client_id="test_client_id",
             client_secret="test_client_secret"
         )
-        manager._access_token = "expiring_token"
-        manager._expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+        manager._access_token = "expired_token"
+        manager._expires_at = datetime.now(timezone.utc) - timedelta(minutes=1)
         
         print("Verification: No sqlite_db set...")
         assert manager._sqlite_db is None
@@ -2015,6 +2954,7 @@ class TestKiroAuthManagerGracefulDegradation:
         mock_error_response.status_code = 400
         mock_error_response.text = '{"error":"invalid_request"}'
         mock_error_response.json = Mock(return_value={"error": "invalid_request"})
+        mock_error_response.content = json.dumps({"error": "invalid_request"}).encode()
         mock_error_response.raise_for_status = Mock(
             side_effect=httpx.HTTPStatusError(
                 "400 Bad Request",
@@ -2211,6 +3151,7 @@ class TestKiroAuthManagerTokenPersistence:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -2287,6 +3228,7 @@ class TestKiroAuthManagerTokenPersistence:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_kiro_token_response())
+        mock_response.content = json.dumps(mock_kiro_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -2468,6 +3410,7 @@ class TestKiroAuthManagerSocialLogin:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_kiro_token_response())
+        mock_response.content = json.dumps(mock_kiro_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -2552,6 +3495,40 @@ class TestKiroAuthManagerSocialLogin:
         
         print(f"Comparing saved access_token: Expected 'new_fallback_token', Got '{saved_data['access_token']}'")
         assert saved_data['access_token'] == "new_fallback_token"
+
+    def test_save_credentials_fallback_updates_only_highest_priority_key(self, tmp_path):
+        """
+        What it does: Verifies the fallback write touches only the first existing key by priority.
+        Purpose: The single-statement fallback must match the old first-match loop.
+        """
+        import sqlite3
+
+        print("Setup: Creating SQLite database with social and legacy token keys...")
+        db_file = tmp_path / "data_priority.sqlite3"
+        conn = sqlite3.connect(str(db_file))
+        conn.execute("CREATE TABLE auth_kv (key TEXT PRIMARY KEY, value TEXT)")
+        for key in ("codewhisperer:odic:token", "kirocli:social:token"):
+            conn.execute(
+                "INSERT INTO auth_kv (key, value) VALUES (?, ?)",
+                (key, json.dumps({"access_token": f"old_{key}"})),
+            )
+        conn.commit()
+        conn.close()
+
+        manager = KiroAuthManager(refresh_token="test_refresh", sqlite_db=str(db_file))
+        manager._sqlite_token_key = "kirocli:odic:token"  # Missing from the DB
+        manager._access_token = "new_token"
+
+        print("Action: Saving credentials...")
+        manager._save_credentials_to_sqlite()
+
+        conn = sqlite3.connect(str(db_file))
+        values = {k: json.loads(v)["access_token"] for k, v in conn.execute("SELECT key, value FROM auth_kv")}
+        conn.close()
+
+        print(f"Verification: Saved values: {values}")
+        assert values["kirocli:social:token"] == "new_token"
+        assert values["codewhisperer:odic:token"] == "old_codewhisperer:odic:token"
     
     def test_social_login_no_device_registration_key(self, temp_sqlite_db_social):
         """
@@ -2776,6 +3753,36 @@ class TestKiroAuthManagerEnterpriseIDE:
         print("Verification: clientId and clientSecret are None (missing in file)...")
         assert manager._client_id is None
         assert manager._client_secret is None
+
+    def test_explicit_client_id_in_file_overrides_enterprise_registration(self, tmp_path, monkeypatch):
+        """
+        What it does: Verifies clientId/clientSecret in the credentials file win over the device registration.
+        Purpose: Keep the original field precedence after the table-driven loader rewrite.
+        """
+        monkeypatch.setattr('pathlib.Path.home', lambda: tmp_path)
+
+        aws_dir = tmp_path / ".aws" / "sso" / "cache"
+        aws_dir.mkdir(parents=True, exist_ok=True)
+        (aws_dir / "hash123.json").write_text(json.dumps({
+            "clientId": "registration_client_id",
+            "clientSecret": "registration_client_secret",
+        }))
+
+        creds_file = tmp_path / "kiro-auth-token.json"
+        creds_file.write_text(json.dumps({
+            "refreshToken": "enterprise_refresh_token",
+            "clientIdHash": "hash123",
+            "clientId": "explicit_client_id",
+            "unknownField": {"ignored": True},
+        }))
+
+        print("Action: Creating KiroAuthManager...")
+        manager = KiroAuthManager(creds_file=str(creds_file))
+
+        print("Verification: Explicit clientId wins, secret comes from registration...")
+        assert manager._client_id == "explicit_client_id"
+        assert manager._client_secret == "registration_client_secret"
+        assert manager._refresh_token == "enterprise_refresh_token"
     
     @pytest.mark.asyncio
     async def test_enterprise_ide_refresh_uses_json_format(
@@ -2797,6 +3804,7 @@ class TestKiroAuthManagerEnterpriseIDE:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -2838,6 +3846,7 @@ class TestKiroAuthManagerEnterpriseIDE:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -2852,7 +3861,7 @@ class TestKiroAuthManagerEnterpriseIDE:
             
             print("Verification: Request uses camelCase parameters...")
             call_args = mock_client.post.call_args
-            json_payload = call_args[1].get('json', {})
+            json_payload = json.loads(call_args[1]['content'])
             
             print(f"JSON payload keys: {list(json_payload.keys())}")
             assert 'grantType' in json_payload, "Should use grantType (camelCase)"
@@ -2883,6 +3892,7 @@ class TestKiroAuthManagerEnterpriseIDE:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
@@ -2930,6 +3940,7 @@ class TestKiroAuthManagerEnterpriseIDE:
         mock_response = AsyncMock()
         mock_response.status_code = 200
         mock_response.json = Mock(return_value=mock_aws_sso_oidc_token_response())
+        mock_response.content = json.dumps(mock_aws_sso_oidc_token_response()).encode()
         mock_response.raise_for_status = Mock()
         
         with patch('kiro.auth.httpx.AsyncClient') as mock_client_class:
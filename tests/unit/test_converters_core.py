@@ -17,6 +17,7 @@ from unittest.mock import patch
 
 from kiro.converters_core import (
     extract_text_content,
+    extract_message_text,
     extract_images_from_content,
     convert_images_to_kiro_format,
     merge_adjacent_messages,
@@ -279,6 +280,76 @@ class TestExtractTextContent:
         print(f"Comparing result: Expected 'Before toolAfter tool', Got '{result}'")
         assert result == "Before toolAfter tool"
 
+    def test_skips_image_blocks_even_with_text_key(self):
+        """
+        What it does: Verifies image blocks contribute no text, even if they carry a "text" key.
+        Purpose: Image blocks are handled by extract_images_from_content, never as text.
+        """
+        print("Setup: Text and image blocks, one image block with a stray text key...")
+        content = [
+            {"type": "text", "text": "Look: "},
+            {"type": "image_url", "image_url": {"url": "data:image/png;base64,AAA"}, "text": "alt"},
+            {"type": "image", "source": {}},
+            {"type": "text"},
+            "done",
+        ]
+
+        print("Action: Extracting text...")
+        result = extract_text_content(content)
+
+        print(f"Comparing result: Expected 'Look: done', Got '{result}'")
+        assert result == "Look: done"
+
+
+class TestExtractMessageText:
+    """Tests for the memoized extract_message_text helper."""
+    
+    def test_list_content_text_is_memoized(self):
+        """
+        What it does: Verifies the extracted text of list content is cached on the message.
+        Purpose: Ensure repeated pipeline reads do not walk the content blocks again.
+        """
+        print("Setup: Message with content blocks...")
+        msg = UnifiedMessage(role="user", content=[{"type": "text", "text": "Hello"}])
+        
+        print("Action: Extracting text twice...")
+        first = extract_message_text(msg)
+        with patch("kiro.converters_core.extract_text_content") as mock_extract:
+            second = extract_message_text(msg)
+        
+        print(f"Comparing result: Expected 'Hello', Got '{second}'")
+        assert first == second == "Hello"
+        mock_extract.assert_not_called()
+    
+    def test_new_content_invalidates_memo(self):
+        """
+        What it does: Verifies assigning new content or copying via replace() drops the memo.
+        Purpose: Ensure a stale text is never returned for changed content.
+        """
+        from dataclasses import replace
+        
+        print("Setup: Message with memoized text...")
+        msg = UnifiedMessage(role="user", content=[{"type": "text", "text": "Old"}])
+        extract_message_text(msg)
+        
+        print("Action: Replacing content...")
+        copy = replace(msg, content=[{"type": "text", "text": "Copy"}])
+        msg.content = [{"type": "text", "text": "New"}]
+        
+        assert extract_message_text(msg) == "New"
+        assert extract_message_text(copy) == "Copy"
+    
+    def test_memo_ignored_by_equality(self):
+        """
+        What it does: Verifies the memo does not affect message equality.
+        Purpose: Ensure messages compare by their fields only.
+        """
+        content = [{"type": "text", "text": "Same"}]
+        cached = UnifiedMessage(role="user", content=content)
+        extract_message_text(cached)
+        
+        assert cached == UnifiedMessage(role="user", content=content)
+
 
 # ==================================================================================================
 # Tests for extract_images_from_content (Issue #30 fix)
@@ -510,6 +581,26 @@ class TestExtractImagesFromContent:
         
         print(f"Comparing result: Expected [], Got {result}")
         assert result == []  # Invalid data URL is skipped
+
+    def test_parses_media_type_without_base64_marker(self):
+        """
+        What it does: Verifies the media type is taken from headers with and without parameters.
+        Purpose: Ensure data URL header slicing handles "data:<type>" and "data:<type>;<params>".
+        """
+        print("Setup: Data URLs with and without ';' parameters...")
+        content = [
+            {"type": "image_url", "image_url": {"url": "data:image/png,AAAA"}},
+            {"type": "image_url", "image_url": {"url": "data:image/webp;charset=x;base64,BBBB"}},
+        ]
+
+        print("Action: Extracting images...")
+        result = extract_images_from_content(content)
+
+        print(f"Result: {result}")
+        assert result == [
+            {"media_type": "image/png", "data": "AAAA"},
+            {"media_type": "image/webp", "data": "BBBB"},
+        ]
     
     def test_handles_empty_data_in_image(self):
         """
@@ -1269,6 +1360,59 @@ class TestMergeAdjacentMessages:
         assert len(result[0].tool_results) == 2
 
 
+class TestMergeAdjacentMessagesRuns:
+    """Tests for merging whole same-role runs at once."""
+    
+    def test_long_mixed_run_matches_pairwise_merging(self):
+        """
+        What it does: Verifies a run of strings followed by list content merges like pairwise merging.
+        Purpose: Ensure run merging keeps the exact content layout of the old pairwise merge.
+        """
+        print("Setup: Run of 5 user messages with mixed content types...")
+        messages = [
+            UnifiedMessage(role="user", content="One"),
+            UnifiedMessage(role="user", content="Two"),
+            UnifiedMessage(role="user", content=None),
+            UnifiedMessage(role="user", content=[{"type": "text", "text": "Four"}]),
+            UnifiedMessage(role="user", content="Five"),
+        ]
+        
+        print("Action: Merging...")
+        result = merge_adjacent_messages(messages)
+        
+        print(f"Result: {result}")
+        assert len(result) == 1
+        assert result[0].content == [
+            {"type": "text", "text": "One\nTwo\n"},
+            {"type": "text", "text": "Four"},
+            {"type": "text", "text": "Five"},
+        ]
+    
+    def test_run_concatenates_tool_calls_in_order(self):
+        """
+        What it does: Verifies tool_calls of a whole assistant run are concatenated in order.
+        Purpose: Ensure no tool call is lost or reordered when a run is merged at once.
+        """
+        print("Setup: Three assistant messages, two with tool_calls...")
+        call_a = {"id": "a", "type": "function", "function": {"name": "f", "arguments": "{}"}}
+        call_b = {"id": "b", "type": "function", "function": {"name": "g", "arguments": "{}"}}
+        messages = [
+            UnifiedMessage(role="user", content="Go"),
+            UnifiedMessage(role="assistant", content="A", tool_calls=[call_a]),
+            UnifiedMessage(role="assistant", content="B"),
+            UnifiedMessage(role="assistant", content="C", tool_calls=[call_b]),
+        ]
+        
+        print("Action: Merging...")
+        result = merge_adjacent_messages(messages)
+        
+        assert len(result) == 2
+        assert result[1].content == "A\nB\nC"
+        assert [tc["id"] for tc in result[1].tool_calls] == ["a", "b"]
+        print("Checking that the input list was not modified...")
+        assert messages[1].tool_calls == [call_a]
+
+
 # ==================================================================================================
 # Tests for ensure_first_message_is_user
 # ==================================================================================================
@@ -1872,6 +2016,20 @@ class TestEnsureAlternatingRoles:
         assert len(result[0].images) == 1
         assert result[2].images is not None
         assert len(result[2].images) == 1
+    
+    def test_synthetic_messages_are_shared_placeholders(self):
+        """
+        What it does: Verifies synthetic messages reuse one placeholder instance per role.
+        Purpose: Ensure no new placeholder message is allocated per insertion.
+        """
+        messages = [UnifiedMessage(role="user", content=f"m{i}") for i in range(3)]
+        
+        result = ensure_alternating_roles(messages)
+        
+        print(f"Result roles: {[m.role for m in result]}")
+        assert result[1] is result[3]
+        assert result[1].role == "assistant" and result[1].content == "(empty)"
+        assert ensure_first_message_is_user(result[1:])[0] is ensure_first_message_is_user(result[3:])[0]
 
 
 # ==================================================================================================
@@ -1960,6 +2118,136 @@ class TestNormalizeAndAlternatingIntegration:
         assert result[8].role == "user" and result[8].content == "User2"
 
 
+# ==================================================================================================
+# Tests for the single-pass normalization used by build_kiro_payload
+# ==================================================================================================
+
+def _normalize_sequentially(messages, tools_defined):
+    """Applies the public normalization steps one after another (reference result)."""
+    if tools_defined:
+        messages, _ = ensure_assistant_before_tool_results(messages)
+    else:
+        messages, _ = strip_all_tool_content(messages)
+    messages = merge_adjacent_messages(messages)
+    messages = ensure_first_message_is_user(messages)
+    messages = normalize_message_roles(messages)
+    return ensure_alternating_roles(messages)
+
+
+class TestNormalizeMessagesSinglePass:
+    """Tests that _normalize_messages matches the sequential pipeline steps."""
+    
+    TOOL_CALL = {"id": "call_1", "type": "function", "function": {"name": "read", "arguments": "{}"}}
+    TOOL_RESULT = {"type": "tool_result", "tool_use_id": "call_1", "content": "done"}
+    
+    CASES = {
+        "empty": [],
+        "assistant_first": [
+            UnifiedMessage(role="assistant", content="Hi"),
+            UnifiedMessage(role="user", content="Hello"),
+        ],
+        "developer_first": [
+            UnifiedMessage(role="developer", content="Dev"),
+            UnifiedMessage(role="user", content="Q"),
+        ],
+        "mixed_unknown_roles": [
+            UnifiedMessage(role="system", content="S"),
+            UnifiedMessage(role="system", content="S2"),
+            UnifiedMessage(role="developer", content="D"),
+            UnifiedMessage(role="user", content="U1"),
+            UnifiedMessage(role="user", content=[{"type": "text", "text": "U2"}]),
+            UnifiedMessage(role="assistant", content="A1"),
+            UnifiedMessage(role="assistant", content="A2"),
+            UnifiedMessage(role="developer", content="D2"),
+        ],
+        "tool_round_trip": [
+            UnifiedMessage(role="user", content="Read it"),
+            UnifiedMessage(role="assistant", content="", tool_calls=[TOOL_CALL]),
+            UnifiedMessage(role="user", content="", tool_results=[TOOL_RESULT]),
+            UnifiedMessage(role="user", content="And then?"),
+        ],
+        "orphaned_tool_results": [
+            UnifiedMessage(role="user", content="Start", tool_results=[TOOL_RESULT]),
+            UnifiedMessage(role="assistant", content="No tools here"),
+            UnifiedMessage(role="user", content="", tool_results=[TOOL_RESULT]),
+        ],
+    }
+    
+    @pytest.mark.parametrize("tools_defined", [True, False])
+    @pytest.mark.parametrize("case", sorted(CASES))
+    def test_matches_sequential_pipeline(self, case, tools_defined):
+        """
+        What it does: Compares the fused pass with the chained public functions.
+        Purpose: Ensure fusing the steps in build_kiro_payload changes no output.
+        """
+        from kiro.converters_pipeline import _normalize_messages
+        
+        messages = self.CASES[case]
+        print(f"Setup: case={case}, tools_defined={tools_defined}")
+        
+        expected = _normalize_sequentially(list(messages), tools_defined)
+        result = _normalize_messages(list(messages), tools_defined)
+        
+        print(f"Expected roles: {[m.role for m in expected]}")
+        print(f"Got roles: {[m.role for m in result]}")
+        assert result == expected
+
+
+class TestPipelineFastPaths:
+    """Tests that pipeline steps return chat-only input without rebuilding it."""
+    
+    CHAT = [
+        UnifiedMessage(role="user", content="Hi"),
+        UnifiedMessage(role="assistant", content="Hello"),
+    ]
+    
+    def test_strip_all_tool_content_returns_input_without_tool_content(self):
+        """
+        What it does: Verifies the input list is returned when no message has tool content.
+        Purpose: Ensure chat-only requests skip the per-message rebuild.
+        """
+        result, stripped = strip_all_tool_content(self.CHAT)
+        assert result is self.CHAT
+        assert stripped is False
+    
+    def test_ensure_assistant_returns_input_without_tool_results(self):
+        """
+        What it does: Verifies the input list is returned when no message has tool_results.
+        Purpose: Ensure requests without tool results skip the orphan check.
+        """
+        result, converted = ensure_assistant_before_tool_results(self.CHAT)
+        assert result is self.CHAT
+        assert converted is False
+    
+    def test_normalize_roles_returns_input_with_known_roles(self):
+        """
+        What it does: Verifies the input list is returned when all roles are user/assistant.
+        Purpose: Ensure the common case allocates nothing.
+        """
+        assert normalize_message_roles(self.CHAT) is self.CHAT
+    
+    def test_ensure_assistant_converts_consecutive_orphans(self):
+        """
+        What it does: Verifies each orphaned tool_results message is converted when several follow each other.
+        Purpose: Ensure the predecessor check still sees the converted messages.
+        """
+        messages = [
+            UnifiedMessage(role="user", content="", tool_results=[
+                {"type": "tool_result", "tool_use_id": "call_1", "content": "One"}
+            ]),
+            UnifiedMessage(role="user", content="", tool_results=[
+                {"type": "tool_result", "tool_use_id": "call_2", "content": "Two"}
+            ]),
+            UnifiedMessage(role="user", content="Next"),
+        ]
+        result, converted = ensure_assistant_before_tool_results(messages)
+        assert converted is True
+        assert len(result) == 3
+        assert not result[0].tool_results
+        assert not result[1].tool_results
+        assert result[2] is messages[2]
+
+
 # ==================================================================================================
 # Tests for ensure_assistant_before_tool_results
 # ==================================================================================================
@@ -2755,6 +3043,83 @@ class TestSanitizeJsonSchema:
         assert "additionalProperties" not in result
         assert result["required"] == ["question", "options"]  # Non-empty required is preserved
         assert result["properties"]["question"]["type"] == "string"
+    
+    def test_keeps_properties_named_like_removed_keywords(self):
+        """
+        What it does: Verifies property names matching removed keywords are kept.
+        Purpose: Ensure only schema keywords are dropped, not user-defined property names.
+        """
+        print("Setup: Schema with properties named 'additionalProperties' and 'required'...")
+        schema = {
+            "type": "object",
+            "properties": {
+                "additionalProperties": {"type": "boolean", "additionalProperties": False},
+                "required": {"type": "array", "items": {"type": "object", "required": []}},
+            },
+        }
+        
+        print("Action: Sanitizing schema...")
+        result = sanitize_json_schema(schema)
+        
+        print(f"Result: {result}")
+        assert result["properties"]["additionalProperties"] == {"type": "boolean"}
+        assert result["properties"]["required"] == {"type": "array", "items": {"type": "object"}}
+    
+    def test_reuses_cached_result_for_equal_schema(self):
+        """
+        What it does: Verifies an equal schema returns the cached sanitized schema.
+        Purpose: Ensure repeated tool definitions are not sanitized again on every request.
+        """
+        print("Setup: Two equal schemas (different objects)...")
+        schema = {"type": "object", "properties": {"a": {"type": "string"}}, "additionalProperties": False}
+        same = {"type": "object", "properties": {"a": {"type": "string"}}, "additionalProperties": False}
+        
+        print("Action: Sanitizing both schemas...")
+        with patch.dict("kiro.converters_tools._SANITIZED_SCHEMA_CACHE", clear=True):
+            first = sanitize_json_schema(schema)
+            second = sanitize_json_schema(same)
+        
+        print(f"Result: {first}")
+        assert second is first
+        assert "additionalProperties" not in first
+        assert "additionalProperties" in schema  # Original is untouched
+    
+    def test_cache_distinguishes_different_schemas(self):
+        """
+        What it does: Verifies different schemas get their own sanitized result.
+        Purpose: Ensure the content-based cache key never mixes up tools.
+        """
+        print("Setup: Two schemas differing in one nested value...")
+        schema_a = {"type": "object", "properties": {"a": {"type": "string"}}}
+        schema_b = {"type": "object", "properties": {"a": {"type": "integer"}}}
+        
+        print("Action: Sanitizing both schemas...")
+        with patch.dict("kiro.converters_tools._SANITIZED_SCHEMA_CACHE", clear=True):
+            result_a = sanitize_json_schema(schema_a)
+            result_b = sanitize_json_schema(schema_b)
+        
+        print(f"Results: {result_a}, {result_b}")
+        assert result_a["properties"]["a"]["type"] == "string"
+        assert result_b["properties"]["a"]["type"] == "integer"
+    
+    def test_cache_size_is_bounded(self):
+        """
+        What it does: Verifies the oldest entry is evicted when the cache is full.
+        Purpose: Ensure clients with ever-changing schemas cannot grow memory without limit.
+        """
+        print("Setup: Cache limited to 2 entries...")
+        with patch.dict("kiro.converters_tools._SANITIZED_SCHEMA_CACHE", clear=True), \
+                patch("kiro.converters_tools._SANITIZED_SCHEMA_CACHE_MAX_SIZE", 2):
+            from kiro.converters_tools import _SANITIZED_SCHEMA_CACHE
+            
+            print("Action: Sanitizing three different schemas...")
+            first = sanitize_json_schema({"type": "string"})
+            sanitize_json_schema({"type": "integer"})
+            sanitize_json_schema({"type": "boolean"})
+            
+            print(f"Cache size: {len(_SANITIZED_SCHEMA_CACHE)}")
+            assert len(_SANITIZED_SCHEMA_CACHE) == 2
+            assert first not in _SANITIZED_SCHEMA_CACHE.values()
 
 
 # ==================================================================================================
@@ -3097,6 +3462,47 @@ class TestExtractToolUses:
         assert result[0]["name"] == "get_weather"
         assert result[0]["toolUseId"] == "call_123"
     
+    def test_reuses_parsed_arguments_for_replayed_tool_calls(self):
+        """
+        What it does: Verifies equal argument strings are parsed once.
+        Purpose: Ensure tool calls replayed in history on every turn are not re-parsed.
+        """
+        from kiro.converters_tools import _parse_cached_arguments
+        _parse_cached_arguments.cache_clear()
+        
+        print("Setup: The same tool call in two separate requests...")
+        arguments = '{"path": "src/app.py", "line": 42}'
+        tool_calls = [{"id": "call_1", "function": {"name": "read_file", "arguments": arguments}}]
+        
+        print("Action: Extracting tool uses twice...")
+        first = extract_tool_uses_from_message(content="", tool_calls=tool_calls)
+        second = extract_tool_uses_from_message(content="", tool_calls=[dict(tool_calls[0])])
+        
+        info = _parse_cached_arguments.cache_info()
+        print(f"Cache info: {info}")
+        assert first[0]["input"] == {"path": "src/app.py", "line": 42}
+        assert second[0]["input"] == first[0]["input"]
+        assert info.misses == 1
+        assert info.hits == 1
+    
+    def test_long_arguments_are_not_cached(self):
+        """
+        What it does: Verifies long argument strings bypass the parse cache.
+        Purpose: Ensure large tool inputs (e.g. file contents) are not kept in memory.
+        """
+        from kiro.converters_tools import _parse_cached_arguments
+        _parse_cached_arguments.cache_clear()
+        
+        print("Setup: Tool call with very long arguments...")
+        content = "x" * 10000
+        tool_calls = [{"id": "call_1", "function": {"name": "write_file", "arguments": f'{{"content": "{content}"}}'}}]
+        
+        print("Action: Extracting tool uses...")
+        result = extract_tool_uses_from_message(content="", tool_calls=tool_calls)
+        
+        assert result[0]["input"] == {"content": content}
+        assert _parse_cached_arguments.cache_info().currsize == 0
+    
     def test_extracts_from_content_list(self):
         """
         What it does: Verifies extraction from content list.
@@ -3211,6 +3617,24 @@ class TestProcessToolsWithLongDescriptions:
         assert processed[0].description == "Get weather for a location"
         assert doc == ""
     
+    def test_returns_input_list_when_all_descriptions_fit(self):
+        """
+        What it does: Verifies the input list itself is returned when no description is too long.
+        Purpose: Ensure the common case does not rebuild the tools list on every request.
+        """
+        print("Setup: Tools with short descriptions...")
+        tools = [
+            UnifiedTool(name="a", description="Short"),
+            UnifiedTool(name="b", description=None),
+        ]
+        
+        print("Action: Processing tools...")
+        with patch('kiro.converters_core.TOOL_DESCRIPTION_MAX_LENGTH', 100):
+            processed, doc = process_tools_with_long_descriptions(tools)
+        
+        assert processed is tools
+        assert doc == ""
+    
     def test_long_description_moved_to_system_prompt(self):
         """
         What it does: Verifies moving long description to system prompt.
@@ -3308,6 +3732,33 @@ class TestProcessToolsWithLongDescriptions:
         assert "## Tool: tool2" in doc
         assert "## Tool: tool3" in doc
     
+    def test_documentation_layout(self):
+        """
+        What it does: Verifies the exact layout of the generated documentation.
+        Purpose: Ensure the header and --- separators between sections are unchanged.
+        """
+        print("Setup: Two tools with long descriptions and one short...")
+        tools = [
+            UnifiedTool(name="first", description="A" * 20),
+            UnifiedTool(name="short", description="ok"),
+            UnifiedTool(name="second", description="B" * 20),
+        ]
+        
+        print("Action: Processing tools...")
+        with patch('kiro.converters_core.TOOL_DESCRIPTION_MAX_LENGTH', 10):
+            _, doc = process_tools_with_long_descriptions(tools)
+        
+        expected = (
+            "\n\n---\n"
+            "# Tool Documentation\n"
+            "The following tools have detailed documentation that couldn't fit in the tool definition.\n\n"
+            "## Tool: first\n\n" + "A" * 20
+            + "\n\n---\n\n"
+            "## Tool: second\n\n" + "B" * 20
+        )
+        print(f"Comparing documentation: Expected {expected!r}, Got {doc!r}")
+        assert doc == expected
+    
     def test_empty_description_unchanged(self):
         """
         What it does: Verifies handling of empty description.
@@ -3582,6 +4033,24 @@ class TestInjectThinkingTags:
         print("Checking that max_thinking_length uses configured value...")
         assert "<max_thinking_length>16000</max_thinking_length>" in result
     
+    def test_prefix_cached_per_max_tokens(self):
+        """
+        What it does: Verifies the thinking prefix is built once per max tokens value.
+        Purpose: Ensure repeated requests reuse the cached prefix but follow config changes.
+        """
+        print("Action: Inject thinking tags twice with 4000, then with 8000...")
+        with patch('kiro.converters_core.FAKE_REASONING_ENABLED', True):
+            with patch('kiro.converters_core.FAKE_REASONING_MAX_TOKENS', 4000):
+                first = inject_thinking_tags("a")
+                second = inject_thinking_tags("b")
+            with patch('kiro.converters_core.FAKE_REASONING_MAX_TOKENS', 8000):
+                third = inject_thinking_tags("a")
+        
+        print("Checking that the prefix is identical and follows max tokens...")
+        assert first[:-1] == second[:-1]
+        assert "<max_thinking_length>8000</max_thinking_length>" in third
+        assert "<max_thinking_length>4000</max_thinking_length>" not in third
+    
     def test_preserves_empty_content(self):
         """
         What it does: Verifies that empty content is handled correctly.
@@ -3747,6 +4216,90 @@ class TestBuildKiroHistory:
         assert result[0]["userInputMessage"]["content"] == "Hello"
         assert result[0]["userInputMessage"]["modelId"] == "claude-sonnet-4"
     
+    def test_first_user_prefix_is_prepended_to_first_message_only(self):
+        """
+        What it does: Verifies first_user_prefix is added to the first user message only.
+        Purpose: Ensure the system prompt lands in history without rebuilding the message list.
+        """
+        print("Setup: Two user messages with an assistant between them...")
+        messages = [
+            UnifiedMessage(role="user", content="First"),
+            UnifiedMessage(role="assistant", content="Reply"),
+            UnifiedMessage(role="user", content="Second"),
+        ]
+        
+        print("Action: Building history with a prefix...")
+        result = build_kiro_history(messages, "claude-sonnet-4", first_user_prefix="SYSTEM")
+        
+        print(f"Result: {result}")
+        assert result[0]["userInputMessage"]["content"] == "SYSTEM\n\nFirst"
+        assert result[1]["assistantResponseMessage"]["content"] == "Reply"
+        assert result[2]["userInputMessage"]["content"] == "Second"
+        assert messages[0].content == "First"  # Input messages are untouched
+    
+    def test_first_user_prefix_ignored_when_history_starts_with_assistant(self):
+        """
+        What it does: Verifies the prefix is not applied to a later user message.
+        Purpose: Ensure only a leading user message receives the prefix.
+        """
+        print("Setup: History starting with an assistant message...")
+        messages = [
+            UnifiedMessage(role="assistant", content="Reply"),
+            UnifiedMessage(role="user", content="Question"),
+        ]
+        
+        print("Action: Building history with a prefix...")
+        result = build_kiro_history(messages, "claude-sonnet-4", first_user_prefix="SYSTEM")
+        
+        print(f"Result: {result}")
+        assert result[0]["assistantResponseMessage"]["content"] == "Reply"
+        assert result[1]["userInputMessage"]["content"] == "Question"
+    
+    def test_first_user_prefix_sends_first_message_as_text_only(self):
+        """
+        What it does: Verifies a prefixed message drops images and tool results from its content blocks.
+        Purpose: Pin the output of the previous rebuild-as-string path, which sent only the text.
+        """
+        print("Setup: First user message with text, image and tool_result blocks...")
+        messages = [
+            UnifiedMessage(role="user", content=[
+                {"type": "text", "text": "Look"},
+                {"type": "image", "source": {"type": "base64", "media_type": "image/png", "data": TEST_IMAGE_BASE64}},
+                {"type": "tool_result", "tool_use_id": "call_1", "content": "Output"},
+            ]),
+            UnifiedMessage(role="assistant", content="Reply"),
+        ]
+        
+        print("Action: Building history with and without a prefix...")
+        prefixed = build_kiro_history(messages, "claude-sonnet-4", first_user_prefix="SYSTEM")
+        plain = build_kiro_history(messages, "claude-sonnet-4")
+        
+        print(f"Prefixed: {prefixed[0]}")
+        assert prefixed[0]["userInputMessage"]["content"].startswith("SYSTEM\n\nLook")
+        assert "images" not in prefixed[0]["userInputMessage"]
+        assert "userInputMessageContext" not in prefixed[0]["userInputMessage"]
+        assert "images" in plain[0]["userInputMessage"]
+    
+    def test_user_message_without_tool_results_has_no_context(self):
+        """
+        What it does: Verifies no userInputMessageContext is added for plain chat messages.
+        Purpose: Ensure the context is only built when there are tool results.
+        """
+        print("Setup: Plain user messages (string and list content)...")
+        messages = [
+            UnifiedMessage(role="user", content="Hello"),
+            UnifiedMessage(role="assistant", content="Hi"),
+            UnifiedMessage(role="user", content=[{"type": "text", "text": "More"}]),
+        ]
+        
+        print("Action: Building history...")
+        result = build_kiro_history(messages, "claude-sonnet-4")
+        
+        print(f"Result: {result}")
+        assert "userInputMessageContext" not in result[0]["userInputMessage"]
+        assert "userInputMessageContext" not in result[2]["userInputMessage"]
+        assert "images" not in result[2]["userInputMessage"]
+    
     def test_builds_assistant_message(self):
         """
         What it does: Verifies building of assistant message.
@@ -5038,6 +5591,24 @@ class TestToolCallsToText:
         print("Checking that arguments are present...")
         assert '{"command": "ls -la"}' in result
     
+    def test_dict_arguments_rendered_as_json(self):
+        """
+        What it does: Verifies dict arguments (Anthropic unified format) are serialized as JSON.
+        Purpose: Ensure the model sees JSON, not a Python dict repr.
+        """
+        print("Setup: Tool call with dict arguments...")
+        tool_calls = [{
+            "id": "toolu_1",
+            "type": "function",
+            "function": {"name": "bash", "arguments": {"command": "ls", "flag": True}}
+        }]
+        
+        print("Action: Converting to text...")
+        result = tool_calls_to_text(tool_calls)
+        
+        print(f"Result: '{result}'")
+        assert result == '[Tool: bash (toolu_1)]\n{"command":"ls","flag":true}'
+    
     def test_converts_multiple_tool_calls_to_text(self):
         """
         What it does: Verifies conversion of multiple tool calls to text.
@@ -5567,6 +6138,83 @@ class TestBuildKiroPayloadIssue20:
 # Tests for build_kiro_payload with Images (Issue #30)
 # ==================================================================================================
 
+class TestBuildKiroPayloadSystemPrompt:
+    """Tests for how build_kiro_payload assembles the system prompt from its parts."""
+    
+    def _build(self, system_prompt):
+        messages = [UnifiedMessage(role="user", content="Hi")]
+        with patch("kiro.converters_pipeline.get_thinking_system_prompt_addition", return_value="\n\n THINK \n"), \
+                patch("kiro.converters_pipeline.get_truncation_recovery_system_addition", return_value="\n\nTRUNC"):
+            result = build_kiro_payload(
+                messages=messages,
+                system_prompt=system_prompt,
+                model_id="claude-sonnet-4",
+                tools=None,
+                conversation_id="test-conv-123",
+                profile_arn="",
+                inject_thinking=False
+            )
+        return result.payload["conversationState"]["currentMessage"]["userInputMessage"]["content"]
+    
+    def test_appends_additions_to_system_prompt(self):
+        """
+        What it does: Verifies additions are appended to the system prompt unchanged and in order.
+        Purpose: Ensure the single-join assembly matches the previous step-by-step concatenation.
+        """
+        print("Action: Building payload with a system prompt...")
+        content = self._build("SYSTEM")
+        
+        print(f"Content: {content!r}")
+        assert content == "SYSTEM\n\n THINK \n\n\nTRUNC\n\nHi"
+    
+    def test_strips_first_addition_without_system_prompt(self):
+        """
+        What it does: Verifies the first addition is stripped when there is no system prompt.
+        Purpose: Ensure the prompt does not start with the addition's separator.
+        """
+        print("Action: Building payload without a system prompt...")
+        content = self._build("")
+        
+        print(f"Content: {content!r}")
+        assert content == "THINK\n\nTRUNC\n\nHi"
+
+
+class TestBuildKiroPayloadPlainChat:
+    """Tests for build_kiro_payload with plain text chat turns (no tools, images or tool results)."""
+    
+    def test_plain_chat_has_no_context_or_images(self):
+        """
+        What it does: Verifies a plain chat turn produces only content, modelId and origin.
+        Purpose: Ensure no empty userInputMessageContext or images are added for simple requests.
+        """
+        print("Setup: Plain text conversation...")
+        messages = [
+            UnifiedMessage(role="user", content="Hello"),
+            UnifiedMessage(role="assistant", content="Hi"),
+            UnifiedMessage(role="user", content="How are you?"),
+        ]
+        
+        print("Action: Building Kiro payload...")
+        result = build_kiro_payload(
+            messages=messages,
+            system_prompt="",
+            model_id="claude-sonnet-4",
+            tools=None,
+            conversation_id="test-conv-123",
+            profile_arn="",
+            inject_thinking=False
+        )
+        
+        current_msg = result.payload["conversationState"]["currentMessage"]["userInputMessage"]
+        print(f"Current message: {current_msg}")
+        assert current_msg == {
+            "content": "How are you?",
+            "modelId": "claude-sonnet-4",
+            "origin": "AI_EDITOR",
+        }
+        assert result.tool_documentation == ""
+
+
 class TestBuildKiroPayloadImages:
     """
     Tests for build_kiro_payload function with image content.
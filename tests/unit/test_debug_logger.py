@@ -136,6 +136,48 @@ class TestDebugLoggerModeAll:
             file_path = debug_dir / "kiro_request_body.json"
             assert file_path.exists()
     
+    def test_log_kiro_request_payload_writes_in_all_mode(self, tmp_path):
+        """
+        Что он делает: Проверяет, что log_kiro_request_payload сериализует и записывает payload в режиме all.
+        Цель: Убедиться, что роуты могут передавать dict без предварительной сериализации.
+        """
+        print("Настройка: Режим all...")
+        debug_dir = tmp_path / "debug_logs"
+        debug_dir.mkdir()
+        
+        with patch('kiro.debug_logger.DEBUG_MODE', 'all'):
+            from kiro.debug_logger import DebugLogger
+            logger = DebugLogger.__new__(DebugLogger)
+            logger._initialized = False
+            logger.__init__()
+            logger.debug_dir = debug_dir
+            
+            print("Действие: Вызов log_kiro_request_payload...")
+            logger.log_kiro_request_payload({"conversationState": {"conversationId": "abc"}})
+            
+            print("Проверяем содержимое файла...")
+            content = json.loads((debug_dir / "kiro_request_body.json").read_text())
+            assert content == {"conversationState": {"conversationId": "abc"}}
+    
+    def test_log_kiro_request_payload_skips_serialization_when_off(self, tmp_path):
+        """
+        Что он делает: Проверяет, что в режиме off payload не сериализуется.
+        Цель: Убедиться, что запросы не платят за отладочное логирование, когда оно выключено.
+        """
+        print("Настройка: Режим off...")
+        with patch('kiro.debug_logger.DEBUG_MODE', 'off'):
+            from kiro.debug_logger import DebugLogger
+            logger = DebugLogger.__new__(DebugLogger)
+            logger._initialized = False
+            logger.__init__()
+            
+            print("Действие: Вызов log_kiro_request_payload...")
+            with patch('kiro.debug_logger.json_dumps_bytes') as mock_dumps:
+                logger.log_kiro_request_payload({"conversationState": {}})
+            
+            print("Проверяем, что сериализация не вызывалась...")
+            mock_dumps.assert_not_called()
+    
     def test_log_raw_chunk_appends_to_file(self, tmp_path):
         """
         Что он делает: Проверяет, что log_raw_chunk дописывает в файл в режиме all.
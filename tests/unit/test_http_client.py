@@ -245,6 +245,40 @@ class TestKiroHttpClientRequestWithRetry:
         mock_auth_manager_for_http.force_refresh.assert_called_once()
         assert response.status_code == 200
     
+    @pytest.mark.asyncio
+    async def test_body_is_serialized_once_for_all_attempts(self, mock_auth_manager_for_http):
+        """
+        What it does: Verifies the JSON body is sent as pre-serialized bytes, identical on retries.
+        Purpose: Ensure the payload is encoded once per request instead of once per attempt.
+        """
+        import json
+        
+        print("Setup: Creating KiroHttpClient...")
+        http_client = KiroHttpClient(mock_auth_manager_for_http)
+        
+        mock_response_403 = AsyncMock()
+        mock_response_403.status_code = 403
+        mock_response_200 = AsyncMock()
+        mock_response_200.status_code = 200
+        
+        mock_client = AsyncMock()
+        mock_client.is_closed = False
+        mock_client.request = AsyncMock(side_effect=[mock_response_403, mock_response_200])
+        
+        payload = {"conversationState": {"currentMessage": {"content": "Привет"}}}
+        
+        print("Action: Executing request that is retried once...")
+        with patch.object(http_client, '_get_client', return_value=mock_client):
+            with patch('kiro.http_client.get_kiro_headers', return_value={}):
+                await http_client.request_with_retry("POST", "https://api.example.com/test", payload)
+        
+        print("Verification: Both attempts sent the same bytes object...")
+        first, second = (call.kwargs["content"] for call in mock_client.request.call_args_list)
+        assert first is second
+        assert isinstance(first, bytes)
+        assert json.loads(first) == payload
+        assert "json" not in mock_client.request.call_args.kwargs
+    
     @pytest.mark.asyncio
     async def test_429_triggers_backoff(self, mock_auth_manager_for_http):
         """
@@ -1046,7 +1080,7 @@ class TestKiroHttpClientConnectionCloseHeader:
         mock_request = Mock()
         captured_headers = {}
         
-        def capture_build_request(method, url, json, headers):
+        def capture_build_request(method, url, content, headers):
             captured_headers.update(headers)
             return mock_request
         
@@ -1086,7 +1120,7 @@ class TestKiroHttpClientConnectionCloseHeader:
         
         captured_headers = {}
         
-        async def capture_request(method, url, json, headers):
+        async def capture_request(method, url, content, headers):
             captured_headers.update(headers)
             return mock_response
         
@@ -1124,7 +1158,7 @@ class TestKiroHttpClientConnectionCloseHeader:
         mock_request = Mock()
         captured_headers = {}
         
-        def capture_build_request(method, url, json, headers):
+        def capture_build_request(method, url, content, headers):
             captured_headers.update(headers)
             return mock_request
         
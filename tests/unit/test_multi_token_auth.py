@@ -13,7 +13,7 @@ Tests cover:
 
 import asyncio
 import pytest
-from datetime import datetime, timezone, timedelta
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from kiro.auth_multi import MultiTokenAuthManager, TokenInfo
@@ -89,6 +89,12 @@ class TestMultiTokenAuthManagerInit:
         manager = MultiTokenAuthManager(refresh_tokens=["tok"], region="eu-west-1")
         assert manager.region == "eu-west-1"
 
+    def test_token_info_is_slotted(self, three_token_manager):
+        token = three_token_manager._tokens[0]
+        assert not hasattr(token, "__dict__")
+        with pytest.raises(AttributeError):
+            token.unknown_field = 1
+
 
 # ===========================================================================
 # _rotate_to_next_token tests
@@ -112,9 +118,7 @@ class TestRotateToNextToken:
 
     def test_skips_tokens_in_backoff(self, three_token_manager):
         # Mark token 1 (index 1) as recently failed
-        three_token_manager._tokens[1].is_failed = True
-        three_token_manager._tokens[1].failure_count = 1
-        three_token_manager._tokens[1].last_failure = datetime.now(timezone.utc)
+        three_token_manager._mark_token_failed(three_token_manager._tokens[1])
 
         result = three_token_manager._rotate_to_next_token()
         # Should skip index 1, go to index 2
@@ -122,22 +126,16 @@ class TestRotateToNextToken:
         assert three_token_manager._active_index == 2
 
     def test_returns_false_when_all_tokens_in_backoff(self, three_token_manager):
-        now = datetime.now(timezone.utc)
         for token in three_token_manager._tokens:
-            token.is_failed = True
-            token.failure_count = 1
-            token.last_failure = now
+            three_token_manager._mark_token_failed(token)
 
         result = three_token_manager._rotate_to_next_token()
         # All in backoff -> resets failures and returns False
         assert result is False
 
     def test_resets_failures_when_all_in_backoff(self, three_token_manager):
-        now = datetime.now(timezone.utc)
         for token in three_token_manager._tokens:
-            token.is_failed = True
-            token.failure_count = 1
-            token.last_failure = now
+            three_token_manager._mark_token_failed(token)
 
         three_token_manager._rotate_to_next_token()
 
@@ -146,17 +144,51 @@ class TestRotateToNextToken:
             assert token.is_failed is False
 
     def test_respects_backoff_window_expired(self, three_token_manager):
-        # Token 1 failed more than 5 minutes ago (backoff window for failure_count=1)
+        # Token 1 failed, but its backoff window has already passed
         three_token_manager._tokens[1].is_failed = True
         three_token_manager._tokens[1].failure_count = 1
-        three_token_manager._tokens[1].last_failure = (
-            datetime.now(timezone.utc) - timedelta(minutes=6)
-        )
+        three_token_manager._tokens[1].backoff_until = time.time() - 1
 
         result = three_token_manager._rotate_to_next_token()
         assert result is True
         assert three_token_manager._active_index == 1
 
+    def test_round_robin_order_and_heap_stay_bounded(self, three_token_manager):
+        order = []
+        for _ in range(30):
+            three_token_manager._rotate_to_next_token()
+            order.append(three_token_manager._active_index)
+
+        assert order[:6] == [1, 2, 0, 1, 2, 0]
+        assert len(three_token_manager._ready_heap) <= 4 * len(three_token_manager._tokens)
+
+    def test_recovered_token_rejoins_rotation(self, three_token_manager):
+        token = three_token_manager._tokens[1]
+        three_token_manager._mark_token_failed(token)
+        three_token_manager._rotate_to_next_token()  # 0 -> 2, token 1 re-queued at its deadline
+        assert three_token_manager._active_index == 2
+
+        # What a successful _refresh_single_token does for a failed token
+        three_token_manager._schedule_token(1, 0.0)
+        token.is_failed = False
+
+        order = []
+        for _ in range(2):
+            three_token_manager._rotate_to_next_token()
+            order.append(three_token_manager._active_index)
+        assert order == [0, 1]
+
+    @pytest.mark.parametrize("failures, backoff", [(1, 5 * 60), (2, 30 * 60), (3, 2 * 60 * 60), (5, 2 * 60 * 60)])
+    def test_backoff_deadline_grows_with_failures(self, three_token_manager, failures, backoff):
+        token = three_token_manager._tokens[0]
+        for _ in range(failures):
+            three_token_manager._mark_token_failed(token)
+
+        assert token.is_failed is True
+        assert token.failure_count == failures
+        window = token.backoff_until - token.last_failure
+        assert backoff <= window <= backoff * 1.1
+
 
 # ===========================================================================
 # Token status tests
@@ -183,6 +215,26 @@ class TestGetTokenStatus:
     def test_empty_manager_returns_empty_list(self, empty_token_manager):
         assert empty_token_manager.get_token_status() == []
 
+    def test_epoch_timestamps_reported_as_iso(self, three_token_manager):
+        three_token_manager._tokens[0].expires_at = 4102444800.0  # 2100-01-01
+        status = three_token_manager.get_token_status()
+        assert status[0]["expires_at"] == "2100-01-01T00:00:00+00:00"
+        assert status[0]["last_refresh"] is None
+
+    def test_unchanged_token_status_is_reused(self, three_token_manager):
+        first = three_token_manager.get_token_status()
+        three_token_manager._tokens[2].failure_count = 1
+        second = three_token_manager.get_token_status()
+        assert second[0] is first[0]
+        assert second[2] is not first[2]
+        assert second[2]["failure_count"] == 1
+
+    def test_rotation_updates_active_flag(self, three_token_manager):
+        three_token_manager.get_token_status()
+        three_token_manager._active_index = 1
+        status = three_token_manager.get_token_status()
+        assert [s["active"] for s in status] == [False, True, False]
+
 
 # ===========================================================================
 # is_token_expiring_soon tests
@@ -194,13 +246,13 @@ class TestIsTokenExpiringSoon:
 
     def test_returns_false_when_token_has_long_validity(self, single_token_manager):
         single_token_manager._tokens[0].expires_at = (
-            datetime.now(timezone.utc) + timedelta(hours=1)
+            time.time() + 3600
         )
         assert single_token_manager.is_token_expiring_soon() is False
 
     def test_returns_true_when_token_expired(self, single_token_manager):
         single_token_manager._tokens[0].expires_at = (
-            datetime.now(timezone.utc) - timedelta(minutes=5)
+            time.time() - 300
         )
         assert single_token_manager.is_token_expiring_soon() is True
 
@@ -214,7 +266,7 @@ class TestGetAccessToken:
     async def test_returns_existing_valid_token(self, single_token_manager):
         single_token_manager._tokens[0].access_token = "valid_access_token"
         single_token_manager._tokens[0].expires_at = (
-            datetime.now(timezone.utc) + timedelta(hours=1)
+            time.time() + 3600
         )
 
         with patch.object(
@@ -235,7 +287,7 @@ class TestGetAccessToken:
             side_effect=set_token,
         ):
             single_token_manager._tokens[0].expires_at = (
-                datetime.now(timezone.utc) + timedelta(hours=1)
+                time.time() + 3600
             )
             result = await single_token_manager.get_access_token()
             assert result == "refreshed_token"
@@ -245,6 +297,106 @@ class TestGetAccessToken:
         with pytest.raises(ValueError, match="No refresh tokens available"):
             await empty_token_manager.get_access_token()
 
+    @pytest.mark.asyncio
+    async def test_valid_token_returned_without_lock(self, single_token_manager):
+        token = single_token_manager._tokens[0]
+        token.access_token = "valid_access_token"
+        token.expires_at = time.time() + 3600
+
+        async with single_token_manager._lock:
+            # Would deadlock if the fast path took the lock
+            result = await asyncio.wait_for(single_token_manager.get_access_token(), 1)
+
+        assert result == "valid_access_token"
+        assert single_token_manager._active_requests == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_token_served_while_refreshing_in_background(self, single_token_manager):
+        token = single_token_manager._tokens[0]
+        token.access_token = "stale_access_token"
+        token.expires_at = time.time() + 60  # Valid, but inside the refresh threshold
+        refresh_started = asyncio.Event()
+        release_refresh = asyncio.Event()
+
+        async def blocked_refresh():
+            refresh_started.set()
+            await release_refresh.wait()
+            token.access_token = "refreshed_token"
+            token.expires_at = time.time() + 3600
+
+        with patch.object(
+            single_token_manager, "_refresh_token_request", side_effect=blocked_refresh
+        ):
+            result = await single_token_manager.get_access_token()
+            assert result == "stale_access_token"
+
+            await asyncio.wait_for(refresh_started.wait(), 1)
+            release_refresh.set()
+            await single_token_manager._refresh_future
+
+        assert await single_token_manager.get_access_token() == "refreshed_token"
+
+    @pytest.mark.asyncio
+    async def test_expired_token_waits_for_refresh(self, single_token_manager):
+        token = single_token_manager._tokens[0]
+        token.access_token = "expired_access_token"
+        token.expires_at = time.time() - 1
+
+        async def set_token():
+            token.access_token = "refreshed_token"
+            token.expires_at = time.time() + 3600
+
+        with patch.object(
+            single_token_manager, "_refresh_token_request", side_effect=set_token
+        ):
+            assert await single_token_manager.get_access_token() == "refreshed_token"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_refresh(self, single_token_manager):
+        calls = 0
+
+        async def slow_refresh():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            token = single_token_manager._tokens[0]
+            token.access_token = "refreshed_token"
+            token.expires_at = time.time() + 3600
+
+        with patch.object(
+            single_token_manager, "_refresh_token_request", side_effect=slow_refresh
+        ):
+            results = await asyncio.gather(
+                *(single_token_manager.get_access_token() for _ in range(10))
+            )
+
+        assert calls == 1
+        assert results == ["refreshed_token"] * 10
+
+
+# ===========================================================================
+# mark_request_completed tests (async)
+# ===========================================================================
+
+class TestMarkRequestCompleted:
+    @pytest.mark.asyncio
+    async def test_rotates_after_n_completed_requests(self, three_token_manager):
+        for _ in range(3):
+            await three_token_manager.mark_request_completed()
+
+        assert three_token_manager._active_index == 1
+        assert three_token_manager._completed_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_rotation_deferred_while_refresh_holds_lock(self, three_token_manager):
+        async with three_token_manager._lock:
+            for _ in range(3):
+                await asyncio.wait_for(three_token_manager.mark_request_completed(), 1)
+            assert three_token_manager._active_index == 0
+
+        await three_token_manager.mark_request_completed()
+        assert three_token_manager._active_index == 1
+
 
 # ===========================================================================
 # refresh_all_tokens tests (async)
@@ -284,3 +436,49 @@ class TestRefreshAllTokens:
             assert results["token_1"] == "healthy"
             assert results["token_2"] == "failed"
             assert results["token_3"] == "healthy"
+
+    @pytest.mark.asyncio
+    async def test_only_due_skips_fresh_tokens(self, three_token_manager):
+        fresh = three_token_manager._tokens[0]
+        fresh.access_token = "access"
+        fresh.expires_at = time.time() + 3600
+        refreshed = []
+
+        async def mock_refresh(index: int) -> bool:
+            refreshed.append(index)
+            return True
+
+        with patch.object(
+            three_token_manager,
+            "_refresh_single_token",
+            side_effect=mock_refresh,
+        ):
+            results = await three_token_manager.refresh_all_tokens(only_due=True)
+
+        assert sorted(refreshed) == [1, 2]
+        assert results == {"token_1": "healthy", "token_2": "healthy", "token_3": "healthy"}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        from kiro.auth_multi import _REFRESH_CONCURRENCY
+
+        manager = MultiTokenAuthManager(
+            refresh_tokens=[f"tok_{i}" for i in range(_REFRESH_CONCURRENCY * 2)],
+            region="us-east-1",
+        )
+        in_flight = 0
+        peak = 0
+
+        async def mock_refresh(index: int) -> bool:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return True
+
+        with patch.object(manager, "_refresh_single_token", side_effect=mock_refresh):
+            results = await manager.refresh_all_tokens()
+
+        assert len(results) == _REFRESH_CONCURRENCY * 2
+        assert peak == _REFRESH_CONCURRENCY
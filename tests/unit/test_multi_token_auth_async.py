@@ -6,15 +6,17 @@ Tests cover:
 - _mask_token
 - is_token_fresh_for_streaming
 - _refresh_single_token (success, HTTP error, generic error)
-- _refresh_token_request (success, rotation on failure, all-fail)
+- _refresh_token_request (success, rotation on failure, all-fail, min gap)
 - force_refresh
-- start_background_refresh / stop_background_refresh
+- start_background_refresh / stop_background_refresh (HTTP client lifecycle, jitter)
+- Shared token cache file (round trip, expired entries, merge, disabled by default)
 - Properties: profile_arn, region, api_host, q_host, fingerprint, auth_type
 """
 
 import asyncio
+import json
 import pytest
-from datetime import datetime, timezone, timedelta
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -81,20 +83,20 @@ class TestIsTokenFreshForStreaming:
 
     def test_returns_true_when_token_has_ample_time(self, single_token_manager):
         single_token_manager._tokens[0].expires_at = (
-            datetime.now(timezone.utc) + timedelta(hours=2)
+            time.time() + 7200
         )
         assert single_token_manager.is_token_fresh_for_streaming(600) is True
 
     def test_returns_false_when_token_expires_too_soon(self, single_token_manager):
         single_token_manager._tokens[0].expires_at = (
-            datetime.now(timezone.utc) + timedelta(seconds=100)
+            time.time() + 100
         )
         assert single_token_manager.is_token_fresh_for_streaming(600) is False
 
     def test_boundary_ample_time_above_minimum(self, single_token_manager):
         """Token valid for 1200 seconds passes a 600-second minimum check."""
         single_token_manager._tokens[0].expires_at = (
-            datetime.now(timezone.utc) + timedelta(seconds=1200)
+            time.time() + 1200
         )
         assert single_token_manager.is_token_fresh_for_streaming(600) is True
 
@@ -117,19 +119,18 @@ class TestRefreshSingleToken:
     @pytest.mark.asyncio
     async def test_successful_refresh_updates_token(self, single_token_manager):
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "accessToken": "new_access_token",
             "refreshToken": "new_refresh_token",
             "expiresIn": 3600,
             "profileArn": "arn:aws:codewhisperer:us-east-1:123:profile/test",
-        }
+        }).encode()
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
             result = await single_token_manager._refresh_single_token(0)
 
@@ -143,19 +144,36 @@ class TestRefreshSingleToken:
     @pytest.mark.asyncio
     async def test_successful_refresh_returns_false_without_access_token(self, single_token_manager):
         mock_response = MagicMock()
-        mock_response.json.return_value = {}  # No accessToken
+        mock_response.content = json.dumps({}).encode()  # No accessToken
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
             result = await single_token_manager._refresh_single_token(0)
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_posts_shared_headers(self, single_token_manager):
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"accessToken": "new_access_token", "expiresIn": 3600}).encode()
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(return_value=mock_response)
+            mock_client_class.return_value = mock_client
+
+            await single_token_manager._refresh_single_token(0)
+
+        kwargs = mock_client.post.call_args.kwargs
+        assert json.loads(kwargs["content"]) == {"refreshToken": "only_token"}
+        assert kwargs["headers"] is single_token_manager._refresh_headers
+        assert kwargs["headers"]["User-Agent"] == f"KiroGateway-{single_token_manager.fingerprint[:16]}"
+
     @pytest.mark.asyncio
     async def test_http_error_marks_token_failed(self, single_token_manager):
         http_error = httpx.HTTPStatusError(
@@ -167,8 +185,7 @@ class TestRefreshSingleToken:
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(side_effect=http_error)
-            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
             result = await single_token_manager._refresh_single_token(0)
 
@@ -182,8 +199,7 @@ class TestRefreshSingleToken:
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(side_effect=ConnectionError("timeout"))
-            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
             result = await single_token_manager._refresh_single_token(0)
 
@@ -194,18 +210,17 @@ class TestRefreshSingleToken:
     @pytest.mark.asyncio
     async def test_profile_arn_updated_on_refresh(self, single_token_manager):
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "accessToken": "new_token",
             "expiresIn": 3600,
             "profileArn": "arn:new:profile",
-        }
+        }).encode()
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
             await single_token_manager._refresh_single_token(0)
 
@@ -225,33 +240,56 @@ class TestRefreshTokenRequest:
     @pytest.mark.asyncio
     async def test_successful_refresh_sets_access_token(self, single_token_manager):
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "accessToken": "fresh_token",
             "expiresIn": 3600,
-        }
+        }).encode()
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
             await single_token_manager._refresh_token_request()
 
         assert single_token_manager._tokens[0].access_token == "fresh_token"
 
+    @pytest.mark.asyncio
+    async def test_shares_refresh_logic_with_single_token_path(self, single_token_manager):
+        """Both refresh paths go through _do_refresh, so last_refresh is recorded."""
+        with patch.object(
+            single_token_manager, "_do_refresh", AsyncMock(return_value=True)
+        ) as mock_do_refresh:
+            await single_token_manager._refresh_token_request()
+            await single_token_manager._refresh_single_token(0)
+
+        assert [c.args for c in mock_do_refresh.await_args_list] == [(0,), (0,)]
+
+    @pytest.mark.asyncio
+    async def test_successful_refresh_records_last_refresh(self, single_token_manager):
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"accessToken": "fresh_token", "expiresIn": 3600}).encode()
+        mock_response.raise_for_status = MagicMock()
+        single_token_manager._http_client = MagicMock(
+            is_closed=False, post=AsyncMock(return_value=mock_response)
+        )
+
+        before = time.time()
+        await single_token_manager._refresh_token_request()
+
+        assert single_token_manager._tokens[0].last_refresh >= before
+
     @pytest.mark.asyncio
     async def test_raises_when_no_access_token_in_response(self, single_token_manager):
         mock_response = MagicMock()
-        mock_response.json.return_value = {}  # No accessToken
+        mock_response.content = json.dumps({}).encode()  # No accessToken
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
             with pytest.raises(Exception):
                 await single_token_manager._refresh_token_request()
@@ -269,7 +307,7 @@ class TestRefreshTokenRequest:
                 )
             else:
                 resp.raise_for_status = MagicMock()
-                resp.json.return_value = data or {"accessToken": "ok_token", "expiresIn": 3600}
+                resp.content = json.dumps(data or {"accessToken": "ok_token", "expiresIn": 3600}).encode()
             return resp
 
         responses = [make_response(401), make_response(200)]
@@ -283,8 +321,7 @@ class TestRefreshTokenRequest:
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.post = mock_post
-            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
             await three_token_manager._refresh_token_request()
 
@@ -304,12 +341,49 @@ class TestRefreshTokenRequest:
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
             with pytest.raises(ValueError, match="All.*tokens failed"):
                 await three_token_manager._refresh_token_request()
 
+    @pytest.mark.asyncio
+    async def test_repeated_attempt_within_min_gap_is_skipped(self, single_token_manager):
+        """A second attempt on the same token right after the first sends no request and never sleeps."""
+        http_error = httpx.HTTPStatusError(
+            "401", request=MagicMock(), response=MagicMock(status_code=401)
+        )
+        mock_response = MagicMock()
+        mock_response.raise_for_status.side_effect = http_error
+        single_token_manager._http_client = MagicMock(
+            is_closed=False, post=AsyncMock(return_value=mock_response)
+        )
+
+        with patch("kiro.auth_multi.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with pytest.raises(ValueError):
+                await single_token_manager._refresh_token_request()
+            failure_count = single_token_manager._tokens[0].failure_count
+
+            with pytest.raises(ValueError, match="less than"):
+                await single_token_manager._refresh_token_request()
+
+        mock_sleep.assert_not_called()
+        assert single_token_manager._http_client.post.await_count == 1
+        assert single_token_manager._tokens[0].failure_count == failure_count
+
+    @pytest.mark.asyncio
+    async def test_min_gap_shared_with_single_token_refresh(self, single_token_manager):
+        """A background refresh right after an on-demand one reuses its result."""
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({"accessToken": "fresh_token", "expiresIn": 3600}).encode()
+        mock_response.raise_for_status = MagicMock()
+        single_token_manager._http_client = MagicMock(
+            is_closed=False, post=AsyncMock(return_value=mock_response)
+        )
+
+        await single_token_manager._refresh_token_request()
+        assert await single_token_manager._refresh_single_token(0) is True
+        assert single_token_manager._http_client.post.await_count == 1
+
     @pytest.mark.asyncio
     async def test_non_auth_http_error_propagates(self, single_token_manager):
         """HTTP 500 (non-auth) should be re-raised, not swallowed."""
@@ -322,8 +396,7 @@ class TestRefreshTokenRequest:
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
             with pytest.raises(httpx.HTTPStatusError):
                 await single_token_manager._refresh_token_request()
@@ -331,18 +404,17 @@ class TestRefreshTokenRequest:
     @pytest.mark.asyncio
     async def test_profile_arn_updated_on_refresh(self, single_token_manager):
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "accessToken": "tok",
             "expiresIn": 3600,
             "profileArn": "arn:updated",
-        }
+        }).encode()
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
             await single_token_manager._refresh_token_request()
 
@@ -459,6 +531,135 @@ class TestBackgroundRefresh:
         await three_token_manager.stop_background_refresh()
         assert three_token_manager._shutdown is True
 
+    @pytest.mark.asyncio
+    async def test_background_delays_are_jittered(self, three_token_manager):
+        from kiro.auth_multi import BACKGROUND_REFRESH_INTERVAL
+
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+            if len(delays) == 2:
+                raise asyncio.CancelledError
+
+        with patch("kiro.auth_multi.asyncio.sleep", side_effect=fake_sleep), \
+             patch.object(three_token_manager, "refresh_all_tokens", AsyncMock(return_value={})):
+            await three_token_manager._background_token_refresh()
+
+        initial, interval = delays
+        assert 30 <= initial <= 90
+        assert BACKGROUND_REFRESH_INTERVAL * 0.8 <= interval <= BACKGROUND_REFRESH_INTERVAL * 1.2
+
+    @pytest.mark.asyncio
+    async def test_http_client_reused_and_closed_on_stop(self, three_token_manager):
+        client = three_token_manager._get_http_client()
+        assert three_token_manager._get_http_client() is client
+
+        await three_token_manager.stop_background_refresh()
+        assert client.is_closed
+        assert three_token_manager._http_client is None
+
+    @pytest.mark.parametrize("http2", [True, False])
+    def test_http_client_limits(self, three_token_manager, http2):
+        """The pool stays HTTP/1.1-sized even when HTTP/2 is offered."""
+        with patch("kiro.auth_multi._HTTP2_AVAILABLE", http2), \
+             patch("kiro.auth_multi.httpx.AsyncClient") as mock_client_class:
+            three_token_manager._get_http_client()
+
+        kwargs = mock_client_class.call_args.kwargs
+        assert kwargs["http2"] is http2
+        assert kwargs["limits"].max_connections == 16
+
+
+# ===========================================================================
+# Shared token cache file
+# ===========================================================================
+
+class TestTokenCache:
+    @pytest.mark.asyncio
+    async def test_round_trip_restores_tokens(self, tmp_path):
+        cache_file = tmp_path / "token-cache.json"
+        manager = MultiTokenAuthManager(
+            refresh_tokens=["token_a", "token_b"], token_cache_file=str(cache_file)
+        )
+        expires_at = time.time() + 3000
+        manager._tokens[0].refresh_token = "token_a_rotated"
+        manager._tokens[0].access_token = "access_a"
+        manager._tokens[0].expires_at = expires_at
+        await manager._persist_token_cache()
+
+        restarted = MultiTokenAuthManager(
+            refresh_tokens=["token_a", "token_b"], token_cache_file=str(cache_file)
+        )
+        assert restarted._tokens[0].refresh_token == "token_a_rotated"
+        assert restarted._tokens[0].access_token == "access_a"
+        assert restarted._tokens[0].expires_at == expires_at
+        # token_b was never refreshed, so it has no entry
+        assert restarted._tokens[1].access_token is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_restores_only_refresh_token(self, tmp_path):
+        cache_file = tmp_path / "token-cache.json"
+        manager = MultiTokenAuthManager(refresh_tokens=["tok"], token_cache_file=str(cache_file))
+        manager._tokens[0].refresh_token = "tok_rotated"
+        manager._tokens[0].access_token = "stale_access"
+        manager._tokens[0].expires_at = time.time() + 10
+        await manager._persist_token_cache()
+
+        restarted = MultiTokenAuthManager(refresh_tokens=["tok"], token_cache_file=str(cache_file))
+        assert restarted._tokens[0].refresh_token == "tok_rotated"
+        assert restarted._tokens[0].access_token is None
+        assert restarted._is_refresh_due(restarted._tokens[0], time.time())
+
+    @pytest.mark.asyncio
+    async def test_newer_entry_from_other_process_is_kept(self, tmp_path):
+        cache_file = tmp_path / "token-cache.json"
+        first = MultiTokenAuthManager(refresh_tokens=["tok"], token_cache_file=str(cache_file))
+        second = MultiTokenAuthManager(refresh_tokens=["tok"], token_cache_file=str(cache_file))
+        now = time.time()
+        second._tokens[0].access_token = "newer"
+        second._tokens[0].expires_at = now + 3000
+        await second._persist_token_cache()
+        first._tokens[0].access_token = "older"
+        first._tokens[0].expires_at = now + 1000
+        await first._persist_token_cache()
+
+        restarted = MultiTokenAuthManager(refresh_tokens=["tok"], token_cache_file=str(cache_file))
+        assert restarted._tokens[0].access_token == "newer"
+
+    @pytest.mark.asyncio
+    async def test_refresh_all_persists_to_cache(self, tmp_path):
+        cache_file = tmp_path / "token-cache.json"
+        manager = MultiTokenAuthManager(refresh_tokens=["tok"], token_cache_file=str(cache_file))
+
+        async def fake_refresh(index):
+            manager._tokens[index].access_token = "fresh"
+            manager._tokens[index].expires_at = time.time() + 3000
+            return True
+
+        with patch.object(manager, "_refresh_single_token", side_effect=fake_refresh):
+            await manager.refresh_all_tokens()
+
+        assert cache_file.exists()
+        restarted = MultiTokenAuthManager(refresh_tokens=["tok"], token_cache_file=str(cache_file))
+        assert restarted._tokens[0].access_token == "fresh"
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path):
+        cache_file = tmp_path / "token-cache.json"
+        cache_file.write_text("{not json")
+        manager = MultiTokenAuthManager(refresh_tokens=["tok"], token_cache_file=str(cache_file))
+        assert manager._tokens[0].refresh_token == "tok"
+        assert manager._tokens[0].access_token is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, three_token_manager):
+        assert three_token_manager._token_cache_file is None
+        three_token_manager._tokens[0].access_token = "access"
+        three_token_manager._tokens[0].expires_at = time.time() + 3000
+        with patch("kiro.auth_multi.asyncio.to_thread") as mock_to_thread:
+            await three_token_manager._persist_token_cache()
+        mock_to_thread.assert_not_called()
+
 
 # ===========================================================================
 # Properties
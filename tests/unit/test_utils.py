@@ -21,6 +21,8 @@ from kiro.utils import (
     generate_completion_id,
     generate_conversation_id,
     generate_tool_call_id,
+    json_dumps_bytes,
+    json_loads,
 )
 
 
@@ -29,6 +31,12 @@ from kiro.utils import (
 # ===========================================================================
 
 class TestGetMachineFingerprint:
+    @pytest.fixture(autouse=True)
+    def clear_fingerprint_cache(self):
+        get_machine_fingerprint.cache_clear()
+        yield
+        get_machine_fingerprint.cache_clear()
+
     def test_returns_64_char_hex_string(self):
         fp = get_machine_fingerprint()
         assert len(fp) == 64
@@ -52,10 +60,19 @@ class TestGetMachineFingerprint:
         fallback = hashlib.sha256(b"default-kiro-gateway").hexdigest()
         normal = get_machine_fingerprint()
         # In normal environments these differ; the test guarantees fallback works
+        get_machine_fingerprint.cache_clear()
         with patch("socket.gethostname", side_effect=OSError):
             fp = get_machine_fingerprint()
         assert fp == fallback
 
+    def test_computed_once_per_process(self):
+        """Repeated calls reuse the cached value instead of re-hashing."""
+        with patch("socket.gethostname", return_value="host") as mock_hostname:
+            fp1 = get_machine_fingerprint()
+            fp2 = get_machine_fingerprint()
+        assert fp1 == fp2
+        assert mock_hostname.call_count == 1
+
 
 # ===========================================================================
 # get_kiro_headers tests
@@ -233,3 +250,43 @@ class TestGenerateToolCallId:
         tcid = generate_tool_call_id()
         suffix = tcid[len("call_"):]
         assert len(suffix) == 8
+
+
+# ===========================================================================
+# json_loads / json_dumps_bytes tests
+# ===========================================================================
+
+class TestJsonHelpers:
+    def test_round_trip(self):
+        payload = {"refreshToken": "abc", "n": 1, "text": "привет"}
+        assert json_loads(json_dumps_bytes(payload)) == payload
+
+    def test_dumps_returns_compact_bytes(self):
+        encoded = json_dumps_bytes({"a": 1})
+        assert isinstance(encoded, bytes)
+        assert encoded == b'{"a":1}'
+
+    def test_dumps_indent_pretty_prints(self):
+        encoded = json_dumps_bytes({"a": 1}, indent=True)
+        assert encoded == b'{\n  "a": 1\n}'
+        with patch("kiro.utils.orjson", None):
+            assert json_dumps_bytes({"a": 1}, indent=True) == encoded
+
+    def test_loads_accepts_str(self):
+        assert json_loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_loads_accepts_memoryview(self):
+        view = memoryview(b'{"a": [1, 2]}')
+        assert json_loads(view) == {"a": [1, 2]}
+        with patch("kiro.utils.orjson", None):
+            assert json_loads(view) == {"a": [1, 2]}
+
+    def test_stdlib_fallback(self):
+        with patch("kiro.utils.orjson", None):
+            encoded = json_dumps_bytes({"a": "é"})
+            assert encoded == '{"a":"é"}'.encode("utf-8")
+            assert json_loads(encoded) == {"a": "é"}
+
+    def test_invalid_json_raises_value_error(self):
+        with pytest.raises(ValueError):
+            json_loads(b"not json")